@@ -29,7 +29,11 @@ __version__ = "0.1.0"
 # Behavior & Dynamics
 from electoral_sim.behavior.voter_behavior import (
     BehaviorEngine,
+    DirectionalModel,
+    KernelModel,
+    MixedSpatialModel,
     ProximityModel,
+    RegionalBiasModel,
     RetrospectiveModel,
     SociotropicPocketbookModel,
     StrategicVotingModel,
@@ -43,6 +47,7 @@ from electoral_sim.core.config import (
     australia_house_config,
     australia_senate_config,
     brazil_config,
+    brazil_presidential_config,
     france_config,
     germany_config,
     india_config,
@@ -52,6 +57,7 @@ from electoral_sim.core.config import (
     usa_config,
 )
 from electoral_sim.core.model import ElectionModel
+from electoral_sim.core.regional import Region, RegionalElection, RegionalResult
 from electoral_sim.dynamics.opinion_dynamics import OpinionDynamics
 
 # Engine & Logic
@@ -64,11 +70,21 @@ from electoral_sim.engine.coalition import (
     minimum_winning_coalitions,
 )
 from electoral_sim.engine.government import (
+    GovernmentFleet,
     GovernmentSimulator,
+    collapse_hazard_curve,
     collapse_probability,
     cox_proportional_hazard,
+    government_survival_batch,
     hazard_rate,
     simulate_government_survival,
+    survival_distribution,
+)
+from electoral_sim.engine.power import (
+    banzhaf_index,
+    power_distribution,
+    power_indices,
+    shapley_shubik_index,
 )
 
 # Metrics
@@ -76,6 +92,7 @@ from electoral_sim.metrics.indices import (
     effective_number_of_parties,
     efficiency_gap,
     gallagher_index,
+    partisan_bias,
 )
 from electoral_sim.presets.eu.election import (
     EU_MEMBER_STATES,
@@ -91,13 +108,20 @@ from electoral_sim.presets.india.election import (
     IndiaElectionResult,
     simulate_india_election,
 )
+from electoral_sim.presets.usa.election import (
+    USA_STATES,
+    USAPresidentialResult,
+    simulate_usa_presidential,
+)
 
 # Electoral Systems
 from electoral_sim.systems.allocation import (
     allocate_seats,
+    allocate_seats_batch,
     dhondt_allocation,
     droop_quota_allocation,
     hare_quota_allocation,
+    mmp_allocation,
     sainte_lague_allocation,
 )
 from electoral_sim.systems.alternative import (
@@ -107,9 +131,13 @@ from electoral_sim.systems.alternative import (
     irv_election,
     stv_election,
 )
+from electoral_sim.systems.electoral_college import (
+    electoral_college_monte_carlo,
+    electoral_college_votes,
+)
 
 # Analysis tools
-from electoral_sim.analysis import BatchRunner, ParameterSweep
+from electoral_sim.analysis import BatchRunner, ParameterSweep, RedistrictingEnsemble
 
 # Visualization (optional - requires matplotlib)
 try:
@@ -127,6 +155,9 @@ except ImportError:
 __all__ = [
     # Core
     "ElectionModel",
+    "RegionalElection",
+    "Region",
+    "RegionalResult",
     "Config",
     "PartyConfig",
     # Presets
@@ -138,11 +169,14 @@ __all__ = [
     "australia_senate_config",
     "south_africa_config",
     "brazil_config",
+    "brazil_presidential_config",
     "france_config",
     "japan_config",
     "PRESETS",
     # Allocation
     "allocate_seats",
+    "allocate_seats_batch",
+    "mmp_allocation",
     "dhondt_allocation",
     "sainte_lague_allocation",
     "hare_quota_allocation",
@@ -153,18 +187,26 @@ __all__ = [
     "approval_voting",
     "condorcet_winner",
     "generate_rankings",
+    # Electoral College
+    "electoral_college_votes",
+    "electoral_college_monte_carlo",
     # Metrics
     "gallagher_index",
     "effective_number_of_parties",
     "efficiency_gap",
+    "partisan_bias",
     # Behavior & Dynamics
     "BehaviorEngine",
     "ProximityModel",
+    "DirectionalModel",
+    "MixedSpatialModel",
     "ValenceModel",
+    "RegionalBiasModel",
     "RetrospectiveModel",
     "StrategicVotingModel",
     "SociotropicPocketbookModel",
     "WastedVoteModel",
+    "KernelModel",
     "OpinionDynamics",
     # Engine
     "minimum_winning_coalitions",
@@ -175,9 +217,17 @@ __all__ = [
     "allocate_portfolios_laver_shepsle",
     "collapse_probability",
     "simulate_government_survival",
+    "collapse_hazard_curve",
+    "survival_distribution",
+    "government_survival_batch",
     "hazard_rate",
     "cox_proportional_hazard",
     "GovernmentSimulator",
+    "GovernmentFleet",
+    "power_indices",
+    "banzhaf_index",
+    "shapley_shubik_index",
+    "power_distribution",
     # India Election
     "simulate_india_election",
     "IndiaElectionResult",
@@ -188,6 +238,10 @@ __all__ = [
     "EUElectionResult",
     "EU_MEMBER_STATES",
     "EU_POLITICAL_GROUPS",
+    # USA Presidential
+    "simulate_usa_presidential",
+    "USAPresidentialResult",
+    "USA_STATES",
     # Visualization
     "plot_seat_distribution",
     "plot_vote_shares",
@@ -196,4 +250,5 @@ __all__ = [
     # Analysis
     "BatchRunner",
     "ParameterSweep",
+    "RedistrictingEnsemble",
 ]
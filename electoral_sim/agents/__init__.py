@@ -1,6 +1,7 @@
 """Agent classes for electoral simulation"""
 
 from electoral_sim.agents.party import INDIA_PARTIES, UK_PARTIES, US_PARTIES, PartyAgents
+from electoral_sim.agents.store import AgentStore
 from electoral_sim.agents.voter import VoterAgents
 
-__all__ = ["VoterAgents", "PartyAgents", "INDIA_PARTIES", "US_PARTIES", "UK_PARTIES"]
+__all__ = ["AgentStore", "VoterAgents", "PartyAgents", "INDIA_PARTIES", "US_PARTIES", "UK_PARTIES"]
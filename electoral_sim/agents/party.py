@@ -1,79 +1,69 @@
 """
 Party/Candidate Agents for Electoral Simulation
-Uses Polars DataFrame for high-performance vectorized operations
+Uses NumPy column buffers, with a lazily materialised Polars DataFrame view
 """
 
-from __future__ import annotations
-
-from typing import TYPE_CHECKING
-
 import numpy as np
-import polars as pl
 
-if TYPE_CHECKING:
-    from electoral_sim.core.model import ElectionModel
+from electoral_sim.agents.store import AgentStore
+from electoral_sim.agents.voter import issue_columns
 
 
-class PartyAgents:
+class PartyAgents(AgentStore):
     """
-    Party agents stored as Polars DataFrame.
+    Party agents stored as NumPy column buffers.
 
-    This class wraps a Polars DataFrame to provide high-performance
-    party data storage with high performance.
+    Results and positions are updated in place with set_columns(); the
+    Polars DataFrame view (`.df`) is only materialised when requested.
 
-    Attributes (DataFrame columns):
+    Attributes (columns):
         - unique_id: Party identifier
         - name: Party name
         - position_x: Economic left-right (-1 to 1)
         - position_y: Social liberal-conservative (-1 to 1)
+        - position_2, position_3, ...: Optional further issue dimensions
         - valence: Non-policy appeal (0-100)
         - incumbent: Whether currently in government
         - seats: Current seat count
         - vote_share: Last election vote share
     """
 
-    def __init__(self, model: ElectionModel, df: pl.DataFrame):
-        self.model = model
-        self.df = df
-        self._cache: dict = {}
-
-    def __len__(self) -> int:
-        return len(self.df)
-
-    def invalidate_cache(self):
-        self._cache = {}
+    _kind = "party"
 
     @property
     def n_parties(self) -> int:
         """Number of parties."""
-        return len(self.df)
+        return len(self)
+
+    def get_positions(self, n_dims: int | None = None) -> np.ndarray:
+        """
+        Return party positions as (n_parties, n_dims) array (cached).
+
+        Args:
+            n_dims: Issue dimensions to return (default: all in the frame);
+                dimensions the frame lacks are placed at 0
+        """
+        columns = issue_columns(self.columns, "position")
+
+        def build():
+            positions = np.zeros((len(self), len(columns) if n_dims is None else n_dims))
+            for d, c in enumerate(columns[: positions.shape[1]]):
+                positions[:, d] = self.get_column(c)
+            return positions
 
-    def get_positions(self) -> np.ndarray:
-        """Return party positions as (n_parties, 2) array (cached)."""
-        if "positions" not in self._cache:
-            self._cache["positions"] = np.column_stack(
-                [self.df["position_x"].to_numpy(), self.df["position_y"].to_numpy()]
-            )
-        return self._cache["positions"]
+        return self._cached(("positions", n_dims), columns, build)
 
     def get_valence(self) -> np.ndarray:
-        """Return party valence scores (cached)."""
-        if "valence" not in self._cache:
-            self._cache["valence"] = self.df["valence"].to_numpy()
-        return self._cache["valence"]
+        """Return party valence scores."""
+        return self.get_column("valence")
 
     def get_names(self) -> list[str]:
         """Return party names."""
-        return self.df["name"].to_list()
+        return self.get_column("name").tolist()
 
     def update_results(self, seats: np.ndarray, vote_shares: np.ndarray):
-        """Update party results after election."""
-        self.df = self.df.with_columns(
-            [
-                pl.Series("seats", seats),
-                pl.Series("vote_share", vote_shares),
-            ]
-        )
+        """Update party results after election (in place)."""
+        self.set_columns({"seats": seats, "vote_share": vote_shares})
 
     def step(self):
         """Called each simulation step for party adaptation."""
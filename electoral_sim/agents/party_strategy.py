@@ -5,6 +5,7 @@ Implements adaptive strategies for political parties to update
 their policy positions based on voter distribution and polling.
 """
 
+from collections.abc import Mapping
 from typing import Literal
 
 import numpy as np
@@ -12,19 +13,21 @@ import polars as pl
 
 
 def adaptive_strategy_step(
-    parties_df: pl.DataFrame,
-    voters_df: pl.DataFrame,
+    parties_df: pl.DataFrame | Mapping[str, np.ndarray],
+    voters_df: pl.DataFrame | Mapping[str, np.ndarray],
     strategy: Literal["median_voter", "stick_to_base", "random_walk"] = "median_voter",
     learning_rate: float = 0.01,
     noise: float = 0.0,
     rng: np.random.Generator | None = None,
-) -> pl.DataFrame:
+) -> pl.DataFrame | dict[str, np.ndarray]:
     """
     Update party positions based on strategy.
 
     Args:
-        parties_df: Party DataFrame
-        voters_df: Voter DataFrame
+        parties_df: Party DataFrame, or a mapping of party column arrays
+            (e.g. PartyAgents.get_columns(["position_x", "position_y"]))
+        voters_df: Voter DataFrame, or a mapping of voter column arrays
+            (e.g. VoterAgents.get_columns(["ideology_x", "ideology_y"]))
         strategy:
             - "median_voter": Move towards median voter
             - "stick_to_base": Move towards party supporters mean (requires voting history)
@@ -34,30 +37,33 @@ def adaptive_strategy_step(
         rng: Random generator
 
     Returns:
-        Updated parties DataFrame
+        Updated parties DataFrame, or a dict of updated columns for a mapping
     """
     if rng is None:
         rng = np.random.default_rng()
 
-    n_parties = len(parties_df)
-
     # Extract current positions
     # We handle potential missing columns gracefully
-    has_x = "position_x" in parties_df.columns
-    has_y = "position_y" in parties_df.columns
+    party_columns = parties_df.columns if isinstance(parties_df, pl.DataFrame) else parties_df
+    has_x = "position_x" in party_columns
+    has_y = "position_y" in party_columns
 
     if not has_x:
         return parties_df
 
-    pos_x = parties_df["position_x"].to_numpy().copy()
-    pos_y = parties_df["position_y"].to_numpy().copy() if has_y else np.zeros(n_parties)
+    pos_x = np.array(parties_df["position_x"], dtype=float)
+    n_parties = len(pos_x)
+    pos_y = np.array(parties_df["position_y"], dtype=float) if has_y else np.zeros(n_parties)
 
     if strategy == "median_voter":
         # Calculate Voter Centroid (Median Voter Theorem)
         # Using median is more robust than mean for stability
-        voter_median_x = voters_df["ideology_x"].median()
+        voter_columns = voters_df.columns if isinstance(voters_df, pl.DataFrame) else voters_df
+        voter_median_x = float(np.median(np.asarray(voters_df["ideology_x"])))
         voter_median_y = (
-            voters_df["ideology_y"].median() if "ideology_y" in voters_df.columns else 0.0
+            float(np.median(np.asarray(voters_df["ideology_y"])))
+            if "ideology_y" in voter_columns
+            else 0.0
         )
 
         # Calculate vector to median
@@ -87,4 +93,6 @@ def adaptive_strategy_step(
     if has_y:
         update_dict["position_y"] = pos_y
 
+    if not isinstance(parties_df, pl.DataFrame):
+        return {**parties_df, **update_dict}
     return parties_df.with_columns([pl.Series(k, v) for k, v in update_dict.items()])
@@ -0,0 +1,164 @@
+"""
+Array-backed agent storage
+
+Agent attributes are held as NumPy column buffers owned by the store and
+updated in place, so simulation steps do not rebuild Polars DataFrames.
+The DataFrame view is materialised lazily, only when `.df` is requested.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    from electoral_sim.core.model import ElectionModel
+
+
+class AgentStore:
+    """
+    Column store shared by VoterAgents and PartyAgents.
+
+    Numeric and boolean columns are writable NumPy buffers; other columns
+    (e.g. party names) are kept as Polars Series. get_column() returns the
+    buffer itself, set_columns() writes into it in place, and derived arrays
+    (stacked positions, ...) are cached until one of their source columns
+    changes.
+
+    `.df` wraps the buffers without copying. Because Polars frames must not
+    change underneath their holders, the first update after `.df` was
+    materialised writes each column into a fresh buffer instead (copy-on-write).
+    """
+
+    # Noun used in error messages
+    _kind = "agent"
+
+    def __init__(self, model: ElectionModel, df: pl.DataFrame):
+        self.model = model
+        self._cache: dict = {}
+        self._sources: dict = {}
+        self._load(df)
+
+    def _load(self, df: pl.DataFrame) -> None:
+        """Take ownership of a frame's columns (one copy per numeric column)."""
+        self._columns: dict[str, np.ndarray | pl.Series] = {}
+        for name in df.columns:
+            series = df[name]
+            if (
+                series.dtype.is_numeric() or series.dtype == pl.Boolean
+            ) and not series.null_count():
+                self._columns[name] = np.array(series.to_numpy())
+            else:
+                self._columns[name] = series
+        self._n = len(df)
+        self._layout()
+        # The frame we were given is a valid view until the first update;
+        # it does not share memory with the buffers
+        self._frame: pl.DataFrame | None = df
+        # Buffers wrapped by a frame handed out through .df
+        self._shared: set[str] = set()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _layout(self) -> None:
+        """Arrange buffers into canonical layouts (hook for subclasses)."""
+
+    @property
+    def df(self) -> pl.DataFrame:
+        """Polars view of the current columns (materialised on demand, cached)."""
+        if self._frame is None:
+            self._frame = pl.DataFrame(
+                [
+                    col if isinstance(col, pl.Series) else pl.Series(name, col)
+                    for name, col in self._columns.items()
+                ]
+            )
+            # Polars wraps contiguous buffers and copies strided ones
+            self._shared = {
+                name
+                for name, col in self._columns.items()
+                if isinstance(col, np.ndarray) and col.flags.c_contiguous
+            }
+        return self._frame
+
+    @df.setter
+    def df(self, df: pl.DataFrame) -> None:
+        self._load(df)
+        self.invalidate_cache()
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names, in frame order."""
+        return list(self._columns)
+
+    def invalidate_cache(self):
+        """Invalidate the cached derived arrays."""
+        self._cache = {}
+        self._sources = {}
+
+    def _cached(self, key, sources, build: Callable):
+        """Cache build() under key until one of the source columns changes."""
+        if key not in self._cache:
+            self._cache[key] = build()
+            self._sources[key] = frozenset(sources)
+        return self._cache[key]
+
+    def get_column(self, name: str) -> np.ndarray:
+        """
+        Return one column as a NumPy array.
+
+        Numeric and boolean columns are the store's own buffers (no copy);
+        they change in place when the column is updated.
+        """
+        if name not in self._columns:
+            raise KeyError(f"No {self._kind} column '{name}'")
+        col = self._columns[name]
+        if isinstance(col, pl.Series):
+            return self._cached(("column", name), (name,), col.to_numpy)
+        return col
+
+    def get_columns(self, names) -> dict[str, np.ndarray]:
+        """Return the requested columns that exist, keyed by name."""
+        return {name: self.get_column(name) for name in names if name in self._columns}
+
+    def set_columns(self, values: Mapping[str, np.ndarray]) -> None:
+        """
+        Update columns in place (new columns are added).
+
+        Values are cast to the existing column's dtype; the DataFrame view and
+        derived arrays that depend on the updated columns are invalidated.
+        """
+        relayout = False
+        for name, value in values.items():
+            col = self._columns.get(name)
+            value = np.asarray(value)
+            if (
+                isinstance(col, np.ndarray)
+                and col.shape == value.shape
+                and name not in self._shared
+            ):
+                col[...] = value
+                continue
+            if len(value) != self._n:
+                raise ValueError(
+                    f"Column '{name}' has {len(value)} values, expected {self._n} {self._kind}s"
+                )
+            dtype = col.dtype if isinstance(col, np.ndarray) else None
+            self._columns[name] = np.array(value, dtype=dtype)
+            self._shared.discard(name)
+            relayout = True
+
+        self._frame = None
+        if relayout:
+            # New or replaced buffers can change derived layouts (e.g. positions)
+            self._layout()
+            self.invalidate_cache()
+            return
+        stale = [key for key, sources in self._sources.items() if not sources.isdisjoint(values)]
+        for key in stale:
+            del self._cache[key]
+            del self._sources[key]
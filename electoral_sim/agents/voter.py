@@ -1,31 +1,48 @@
 """
 Voter Agent for Electoral Simulation
-Uses Polars DataFrame for high-performance vectorized operations
+Uses NumPy column buffers, with a lazily materialised Polars DataFrame view
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import numpy as np
-import polars as pl
 
-if TYPE_CHECKING:
-    from electoral_sim.core.model import ElectionModel
+from electoral_sim.agents.store import AgentStore
+from electoral_sim.engine.numba_accel import CONSTITUENCY_DTYPE
+
+
+def issue_columns(columns: list[str], prefix: str) -> list[str]:
+    """
+    Issue-dimension columns in order: {prefix}_x, {prefix}_y, {prefix}_2, ...
+
+    Dimensions beyond the first two are numbered from 2 and must be contiguous.
+    """
+    dims = [f"{prefix}_x", f"{prefix}_y"]
+    k = 2
+    while f"{prefix}_{k}" in columns:
+        dims.append(f"{prefix}_{k}")
+        k += 1
+    return dims
 
 
-class VoterAgents:
+class VoterAgents(AgentStore):
     """
-    Voter agents stored as Polars DataFrame for vectorized operations.
+    Voter agents stored as NumPy column buffers for vectorized operations.
 
-    This class wraps a Polars DataFrame to provide high-performance
-    agent data storage with high performance.
+    Columns are updated in place with set_columns(); the Polars DataFrame
+    view (`.df`) is only materialised when requested.
 
-    Attributes (DataFrame columns):
+    Buffers use canonical layouts that the kernels take without copying:
+    ideology columns are strided views into one C-contiguous
+    (n_voters, n_dims) positions block, and constituencies are int32.
+
+    Attributes (columns):
         - unique_id: Agent identifier (auto-generated)
         - constituency: Constituency index (0 to n_constituencies-1)
         - ideology_x: Economic left-right (-1 to 1)
         - ideology_y: Social liberal-conservative (-1 to 1)
+        - ideology_2, ideology_3, ...: Optional further issue dimensions
+        - salience_x, salience_y, salience_2, ...: Optional per-voter issue weights
         - party_id: Current party identification
         - knowledge: Political knowledge (0-100)
         - turnout_prob: Base probability of voting (0-1)
@@ -33,56 +50,72 @@ class VoterAgents:
         - is_zealot: Whether agent is a zealot (fixed opinion)
     """
 
-    def __init__(
-        self,
-        model: ElectionModel,
-        df: pl.DataFrame,
-    ):
-        self.model = model
-        self.df = df
-        self._cache: dict = {}
-
-    def __len__(self) -> int:
-        return len(self.df)
+    _kind = "voter"
 
-    def invalidate_cache(self):
-        """Invalidate the cached arrays."""
-        self._cache = {}
+    def _layout(self) -> None:
+        """Pack ideology columns into one positions block; int32 constituencies."""
+        if "constituency" in self._columns:
+            self._columns["constituency"] = np.ascontiguousarray(
+                self._columns["constituency"], dtype=CONSTITUENCY_DTYPE
+            )
+        dims = issue_columns(self.columns, "ideology")
+        if not all(isinstance(self._columns.get(c), np.ndarray) for c in dims):
+            self._positions = None
+            return
+        self._positions = np.column_stack([self._columns[c] for c in dims])
+        for d, c in enumerate(dims):
+            self._columns[c] = self._positions[:, d]
 
     @property
     def n_voters(self) -> int:
         """Total number of voters."""
-        return len(self.df)
+        return len(self)
+
+    @property
+    def n_dims(self) -> int:
+        """Number of issue dimensions."""
+        return len(issue_columns(self.columns, "ideology"))
 
     def get_positions(self) -> np.ndarray:
-        """Return ideology positions as (n_voters, 2) array (cached)."""
-        if "positions" not in self._cache:
-            self._cache["positions"] = np.column_stack(
-                [self.df["ideology_x"].to_numpy(), self.df["ideology_y"].to_numpy()]
-            )
-        return self._cache["positions"]
+        """Return ideology positions as a C-contiguous (n_voters, n_dims) array (no copy)."""
+        if self._positions is None:
+            raise KeyError("Voters have no ideology_x / ideology_y columns")
+        return self._positions
+
+    def get_salience(self) -> np.ndarray | None:
+        """
+        Return per-voter issue weights as (n_voters, n_dims) array (cached).
+
+        Returns None if the voters have no salience columns; dimensions
+        without a salience column get weight 1.
+        """
+        columns = [
+            c.replace("ideology_", "salience_", 1) for c in issue_columns(self.columns, "ideology")
+        ]
+        present = [c for c in columns if c in self._columns]
+        if not present:
+            return None
+        return self._cached(
+            "salience",
+            present,
+            lambda: np.column_stack(
+                [self.get_column(c) if c in self._columns else np.ones(len(self)) for c in columns]
+            ),
+        )
 
     def get_ideology_x(self) -> np.ndarray:
-        if "ideology_x" not in self._cache:
-            self._cache["ideology_x"] = self.df["ideology_x"].to_numpy()
-        return self._cache["ideology_x"]
+        return self.get_column("ideology_x")
 
     def get_ideology_y(self) -> np.ndarray:
-        if "ideology_y" not in self._cache:
-            self._cache["ideology_y"] = self.df["ideology_y"].to_numpy()
-        return self._cache["ideology_y"]
+        return self.get_column("ideology_y")
 
     def get_constituencies(self) -> np.ndarray:
-        """Return constituency indices (cached)."""
-        if "constituency" not in self._cache:
-            self._cache["constituency"] = self.df["constituency"].to_numpy()
-        return self._cache["constituency"]
+        """Return constituency indices."""
+        return self.get_column("constituency")
 
     def get_turnout_prob(self) -> np.ndarray:
-        """Return turnout probabilities (cached)."""
-        if "turnout_prob" not in self._cache:
-            self._cache["turnout_prob"] = self.df["turnout_prob"].to_numpy()
-        return self._cache["turnout_prob"]
+        """Return turnout probabilities."""
+        return self.get_column("turnout_prob")
 
     def step(self):
         """Called each simulation step."""
@@ -1,5 +1,30 @@
 from electoral_sim.analysis.duverger import run_duverger_experiment
-from electoral_sim.analysis.vse import calculate_vse
+from electoral_sim.analysis.vse import calculate_vse, monte_carlo_vse
 from electoral_sim.analysis.batch_runner import BatchRunner, ParameterSweep
+from electoral_sim.analysis.comparison import SystemComparison, compare_systems
+from electoral_sim.analysis.redistricting import (
+    EnsembleResult,
+    RedistrictingEnsemble,
+    grid_graph,
+    random_plan,
+    score_plans,
+)
+from electoral_sim.analysis.sensitivity import saltelli_sample, sobol_analysis, sobol_indices
 
-__all__ = ["calculate_vse", "run_duverger_experiment", "BatchRunner", "ParameterSweep"]
+__all__ = [
+    "calculate_vse",
+    "monte_carlo_vse",
+    "run_duverger_experiment",
+    "BatchRunner",
+    "ParameterSweep",
+    "saltelli_sample",
+    "sobol_indices",
+    "sobol_analysis",
+    "compare_systems",
+    "SystemComparison",
+    "RedistrictingEnsemble",
+    "EnsembleResult",
+    "grid_graph",
+    "random_plan",
+    "score_plans",
+]
@@ -29,6 +29,8 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 import polars as pl
 
+from electoral_sim.analysis.sensitivity import DEFAULT_OUTPUTS, saltelli_sample, sobol_analysis
+
 try:
     from tqdm import tqdm
 except ImportError:
@@ -43,16 +45,21 @@ class ParameterSweep:
     Defines a parameter sweep for batch simulations.
 
     Args:
-        parameters: Dictionary mapping parameter names to lists of values
-        sweep_type: 'grid' for all combinations, 'random' for random sampling
-        n_samples: Number of random samples (for sweep_type='random')
+        parameters: Dictionary mapping parameter names to lists of values.
+            For sweep_type='sobol' each value is a [low, high] range.
+        sweep_type: 'grid' for all combinations, 'random' for random sampling,
+            'sobol' for a Saltelli design (variance-based sensitivity analysis)
+        n_samples: Number of random samples (for 'random'), or base samples N
+            (for 'sobol', giving N * (d + 2) configurations)
         fixed_params: Parameters that don't change
+        seed: Random seed for 'random' and 'sobol' sampling
     """
 
     parameters: dict[str, list[Any]]
     sweep_type: str = "grid"
     n_samples: int = 100
     fixed_params: dict[str, Any] = field(default_factory=dict)
+    seed: int | None = None
 
     def generate_configs(self) -> list[dict[str, Any]]:
         """Generate all parameter configurations."""
@@ -60,6 +67,8 @@ class ParameterSweep:
             return self._grid_search()
         elif self.sweep_type == "random":
             return self._random_search()
+        elif self.sweep_type == "sobol":
+            return self._sobol_search()
         else:
             raise ValueError(f"Unknown sweep_type: {self.sweep_type}")
 
@@ -82,7 +91,7 @@ class ParameterSweep:
         param_values = list(self.parameters.values())
 
         configs = []
-        rng = np.random.default_rng()
+        rng = np.random.default_rng(self.seed)
 
         for _ in range(self.n_samples):
             config = {}
@@ -93,10 +102,45 @@ class ParameterSweep:
 
         return configs
 
+    def _sobol_search(self) -> list[dict[str, Any]]:
+        """Generate a Saltelli design over [low, high] parameter ranges."""
+        bounds = self.get_bounds()
+        samples = saltelli_sample(bounds, self.n_samples, np.random.default_rng(self.seed))
+
+        # Parameters given as integer ranges (e.g. n_voters) stay integers
+        is_integer = [
+            all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values)
+            for values in self.parameters.values()
+        ]
+
+        configs = []
+        for row in samples:
+            config = {
+                name: int(round(value)) if integer else float(value)
+                for name, value, integer in zip(bounds, row, is_integer)
+            }
+            config.update(self.fixed_params)
+            configs.append(config)
+
+        return configs
+
+    def get_bounds(self) -> dict[str, tuple[float, float]]:
+        """Return (low, high) bounds for each parameter of a 'sobol' sweep."""
+        bounds = {}
+        for name, values in self.parameters.items():
+            if len(values) != 2:
+                raise ValueError(
+                    f"Sobol sweep parameter '{name}' must be a [low, high] range, got {values}"
+                )
+            bounds[name] = (float(values[0]), float(values[1]))
+        return bounds
+
     def __len__(self) -> int:
         """Return number of configurations."""
         if self.sweep_type == "grid":
             return np.prod([len(v) for v in self.parameters.values()])
+        elif self.sweep_type == "sobol":
+            return self.n_samples * (len(self.parameters) + 2)
         else:
             return self.n_samples
 
@@ -319,6 +363,41 @@ class BatchRunner:
 
         return summary
 
+    def get_sobol_indices(
+        self,
+        outputs: tuple[str, ...] | list[str] = DEFAULT_OUTPUTS,
+        n_bootstrap: int = 200,
+        confidence: float = 0.95,
+    ) -> pl.DataFrame:
+        """
+        Compute first-order and total Sobol indices for each output metric.
+
+        Requires a sweep_type='sobol' ParameterSweep. All indices are estimated
+        from the same N * (d + 2) evaluations; replicate runs per configuration
+        are averaged first.
+
+        Args:
+            outputs: Metric columns to analyse
+            n_bootstrap: Bootstrap resamples for confidence intervals
+            confidence: Confidence level for the intervals
+
+        Returns:
+            DataFrame with columns output, parameter, S1, S1_conf, ST, ST_conf
+        """
+        if self.results_df is None:
+            raise ValueError("No results available. Run `run()` first.")
+        if self.parameter_sweep.sweep_type != "sobol":
+            raise ValueError("Sobol indices require a ParameterSweep with sweep_type='sobol'")
+
+        return sobol_analysis(
+            self.results_df,
+            self.parameter_sweep.get_bounds(),
+            outputs=outputs,
+            n_bootstrap=n_bootstrap,
+            confidence=confidence,
+            seed=self.seed,
+        )
+
     def export_results(self, filepath: str, format: str = "auto"):
         """
         Export results to file.
@@ -0,0 +1,441 @@
+"""
+Redistricting Ensembles (ReCom)
+
+Samples districting plans of a precinct graph with a ReCom Markov chain.
+Each step merges two adjacent districts, draws a random spanning tree of the
+merged precincts and cuts one tree edge whose two sides are both within the
+population tolerance; the halves of a cut tree are connected, so districts
+stay contiguous. Chains run in parallel with independent random streams.
+Plans are scored from cached precinct tallies: district tallies are bincounts
+over the plan, so no election is re-run.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from electoral_sim.metrics.indices import efficiency_gap, partisan_bias
+
+
+def grid_graph(rows: int, cols: int) -> np.ndarray:
+    """
+    Rook adjacency of a rows x cols grid of precincts, numbered row by row.
+
+    Returns:
+        (n_edges, 2) precinct pairs
+    """
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    horizontal = np.column_stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()])
+    vertical = np.column_stack([ids[:-1].ravel(), ids[1:].ravel()])
+    return np.concatenate([horizontal, vertical])
+
+
+def _random_spanning_tree(
+    n_nodes: int, edges: np.ndarray, rng: np.random.Generator
+) -> list[tuple[int, int]]:
+    """Kruskal over a random edge order (a minimum spanning tree for random weights)."""
+    parent = list(range(n_nodes))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    tree = []
+    for u, v in edges[rng.permutation(len(edges))].tolist():
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            parent[ru] = rv
+            tree.append((u, v))
+            if len(tree) == n_nodes - 1:
+                break
+    return tree
+
+
+def _tree_cut(
+    nodes: np.ndarray,
+    edges: np.ndarray,
+    population: np.ndarray,
+    piece_bounds: tuple[float, float],
+    rest_bounds: tuple[float, float],
+    rng: np.random.Generator,
+    max_attempts: int,
+) -> np.ndarray | None:
+    """
+    Split connected nodes into a piece and a rest, both connected and in bounds.
+
+    Draws up to max_attempts spanning trees and cuts a random edge whose sides
+    have piece and rest populations within the bounds.
+
+    Returns:
+        Node ids of the piece, or None if no tree had a valid cut
+    """
+    m = len(nodes)
+    local = np.full(len(population), -1, dtype=np.int64)
+    local[nodes] = np.arange(m)
+    sub = local[edges]
+    sub = sub[(sub >= 0).all(axis=1)]
+    pop = population[nodes]
+    total = pop.sum()
+
+    def valid(piece):
+        rest = total - piece
+        return (
+            (piece >= piece_bounds[0])
+            & (piece <= piece_bounds[1])
+            & (rest >= rest_bounds[0])
+            & (rest <= rest_bounds[1])
+        )
+
+    for _ in range(max_attempts):
+        tree = _random_spanning_tree(m, sub, rng)
+        if len(tree) < m - 1:
+            raise ValueError("Precinct graph is not connected")
+        adjacency = [[] for _ in range(m)]
+        for u, v in tree:
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+
+        # Preorder DFS: every subtree is a contiguous run of `order`
+        root = int(rng.integers(m))
+        order, parent, stack = [], [-1] * m, [root]
+        while stack:
+            u = stack.pop()
+            order.append(u)
+            for w in adjacency[u]:
+                if w != parent[u]:
+                    parent[w] = u
+                    stack.append(w)
+        subtree_pop = pop.astype(float)
+        size = np.ones(m, dtype=np.int64)
+        for u in reversed(order[1:]):
+            subtree_pop[parent[u]] += subtree_pop[u]
+            size[parent[u]] += size[u]
+
+        # Cutting the edge above v separates v's subtree from the rest
+        below = valid(subtree_pop)
+        above = valid(total - subtree_pop)
+        below[root] = above[root] = False
+        candidates = np.flatnonzero(below | above)
+        if len(candidates) == 0:
+            continue
+        v = int(rng.choice(candidates))
+        position = order.index(v)
+        subtree = np.zeros(m, dtype=bool)
+        subtree[order[position : position + size[v]]] = True
+        return nodes[subtree if below[v] else ~subtree]
+    return None
+
+
+def random_plan(
+    edges: np.ndarray,
+    population: np.ndarray,
+    n_districts: int,
+    tolerance: float = 0.05,
+    seed: int | np.random.Generator | None = None,
+    max_attempts: int = 100,
+    max_restarts: int = 10,
+) -> np.ndarray:
+    """
+    Contiguous, population-balanced plan by recursive spanning-tree cuts.
+
+    Districts are peeled off one at a time; each cut keeps the remainder
+    within the tolerance of the districts still to be drawn. A remainder
+    that cannot be cut restarts the plan.
+
+    Args:
+        edges: (n_edges, 2) precinct adjacency
+        population: (n_precincts,) precinct population
+        n_districts: Number of districts
+        tolerance: Maximum deviation from the ideal district population (share)
+        seed: Random seed or generator
+        max_attempts: Spanning trees drawn per cut before restarting
+        max_restarts: Restarts before giving up
+
+    Returns:
+        (n_precincts,) district of each precinct
+    """
+    rng = np.random.default_rng(seed)
+    edges = np.asarray(edges, dtype=np.int64)
+    population = np.asarray(population, dtype=float)
+    ideal = population.sum() / n_districts
+    lo, hi = ideal * (1 - tolerance), ideal * (1 + tolerance)
+
+    for _ in range(max_restarts + 1):
+        plan = np.full(len(population), n_districts - 1, dtype=np.int32)
+        for district in range(n_districts - 1):
+            remaining = n_districts - district - 1
+            nodes = np.flatnonzero(plan == n_districts - 1)
+            rest_bounds = (remaining * lo, remaining * hi)
+            piece = _tree_cut(nodes, edges, population, (lo, hi), rest_bounds, rng, max_attempts)
+            if piece is None:
+                break
+            plan[piece] = district
+        else:
+            return plan
+    raise ValueError(
+        f"No balanced plan found; try a tolerance above {tolerance} "
+        "or more precincts per district"
+    )
+
+
+def score_plans(
+    plans: np.ndarray,
+    tallies: np.ndarray,
+    n_districts: int,
+    party_a: int = 0,
+    party_b: int = 1,
+) -> dict:
+    """
+    District tallies, seats and partisan metrics of many plans at once.
+
+    District tallies come from one bincount per party over the cached
+    precinct tallies; efficiency gap and partisan bias compare party_a with
+    party_b on two-party votes. Each district has one winner, the party
+    with the most votes (ties to the lower party index), used for both
+    seats and the efficiency gap.
+
+    Args:
+        plans: (n_plans, n_precincts) district of each precinct
+        tallies: (n_precincts, n_parties) votes per precinct
+        n_districts: Number of districts
+        party_a: Party scored by the metrics (efficiency_gap and partisan_bias)
+        party_b: Opposing party
+
+    Returns:
+        Dictionary with district_tallies (n_plans, n_districts, n_parties),
+        seats (n_plans, n_parties), efficiency_gap (n_plans,) and
+        partisan_bias (n_plans,)
+    """
+    plans = np.atleast_2d(plans)
+    tallies = np.asarray(tallies)
+    N, P = len(plans), tallies.shape[1]
+    index = (np.arange(N)[:, np.newaxis] * n_districts + plans).ravel()
+    district_tallies = np.stack(
+        [
+            np.bincount(index, weights=np.tile(tallies[:, p], N), minlength=N * n_districts)
+            for p in range(P)
+        ],
+        axis=-1,
+    ).reshape(N, n_districts, P)
+    if np.issubdtype(tallies.dtype, np.integer):
+        district_tallies = np.rint(district_tallies).astype(np.int64)
+
+    winner = district_tallies.argmax(axis=2)
+    seats = (winner[:, :, np.newaxis] == np.arange(P)).sum(axis=1)
+    votes_a = district_tallies[:, :, party_a]
+    votes_b = district_tallies[:, :, party_b]
+    two_party = np.maximum(votes_a + votes_b, 1)
+    return {
+        "district_tallies": district_tallies,
+        "seats": seats,
+        "efficiency_gap": efficiency_gap(votes_a, votes_b, (winner == party_a).astype(int)),
+        "partisan_bias": partisan_bias(votes_a / two_party),
+    }
+
+
+def _run_chain(
+    seed: np.random.SeedSequence,
+    plan: np.ndarray | None,
+    edges: np.ndarray,
+    population: np.ndarray,
+    n_districts: int,
+    tolerance: float,
+    n_steps: int,
+    thin: int,
+    max_attempts: int,
+) -> tuple[np.ndarray, int]:
+    """
+    Run one ReCom chain on its own random stream.
+
+    Returns:
+        (plans, accepted); plans is (n_steps // thin, n_precincts)
+    """
+    rng = np.random.default_rng(seed)
+    if plan is None:
+        plan = random_plan(edges, population, n_districts, tolerance, rng)
+    plan = plan.copy()
+    ideal = population.sum() / n_districts
+    bounds = (ideal * (1 - tolerance), ideal * (1 + tolerance))
+
+    samples = np.empty((n_steps // thin, len(plan)), dtype=np.int32)
+    accepted = 0
+    for step in range(n_steps):
+        cut = np.flatnonzero(plan[edges[:, 0]] != plan[edges[:, 1]])
+        u, v = edges[cut[rng.integers(len(cut))]]
+        a, b = plan[u], plan[v]
+        nodes = np.flatnonzero((plan == a) | (plan == b))
+        piece = _tree_cut(nodes, edges, population, bounds, bounds, rng, max_attempts)
+        # A step without a balanced cut keeps the current plan
+        if piece is not None:
+            plan[nodes] = b
+            plan[piece] = a
+            accepted += 1
+        if (step + 1) % thin == 0:
+            samples[(step + 1) // thin - 1] = plan
+    return samples, accepted
+
+
+def _run_chain_task(args: tuple) -> tuple:
+    """Unpack arguments for ProcessPoolExecutor.map()."""
+    return _run_chain(*args)
+
+
+@dataclass
+class EnsembleResult:
+    """Plans sampled by a RedistrictingEnsemble and their scores."""
+
+    plans: np.ndarray  # (n_plans, n_precincts) district of each precinct
+    chain: np.ndarray  # (n_plans,) chain index of each plan
+    acceptance_rate: np.ndarray  # (n_chains,) share of steps that moved
+    district_tallies: np.ndarray  # (n_plans, n_districts, n_parties)
+    seats: np.ndarray  # (n_plans, n_parties)
+    efficiency_gap: np.ndarray  # (n_plans,) positive: party_a wastes more votes
+    partisan_bias: np.ndarray  # (n_plans,) positive favors party_a
+    party_a: int = 0
+
+    def percentile(self, metric: str, value: float) -> float:
+        """
+        Share of ensemble plans scoring at most value.
+
+        Args:
+            metric: "efficiency_gap", "partisan_bias" or "seats" (party_a's seats)
+            value: Score of the plan under scrutiny (e.g. an enacted plan)
+
+        Returns:
+            Share in [0, 1]; values near 0 or 1 mark an outlier
+        """
+        scores = self.seats[:, self.party_a] if metric == "seats" else getattr(self, metric)
+        return float((scores <= value).mean())
+
+
+class RedistrictingEnsemble:
+    """
+    Ensemble of contiguous, population-balanced districting plans.
+
+    Example:
+        >>> edges = grid_graph(20, 20)
+        >>> ensemble = RedistrictingEnsemble(edges, tallies, n_districts=8)
+        >>> result = ensemble.run(n_steps=500, n_chains=4, seed=42, n_jobs=4)
+        >>> result.percentile("efficiency_gap", ensemble.score(enacted)["efficiency_gap"][0])
+    """
+
+    def __init__(
+        self,
+        edges: np.ndarray,
+        tallies: np.ndarray,
+        n_districts: int,
+        population: np.ndarray | None = None,
+        tolerance: float = 0.05,
+        party_a: int = 0,
+        party_b: int = 1,
+        max_attempts: int = 10,
+    ):
+        """
+        Args:
+            edges: (n_edges, 2) precinct adjacency (e.g. grid_graph())
+            tallies: (n_precincts, n_parties) votes per precinct, e.g. a
+                BallotSet's constituency_tallies with precincts as constituencies
+            n_districts: Number of districts
+            population: (n_precincts,) precinct population (default: votes cast)
+            tolerance: Maximum deviation from the ideal district population (share)
+            party_a: Party scored by the metrics (efficiency_gap and partisan_bias)
+            party_b: Opposing party
+            max_attempts: Spanning trees drawn per step before the step is rejected
+        """
+        self.edges = np.asarray(edges, dtype=np.int64)
+        self.tallies = np.asarray(tallies)
+        self.population = np.asarray(
+            self.tallies.sum(axis=1) if population is None else population, dtype=float
+        )
+        if self.edges.ndim != 2 or self.edges.shape[1] != 2:
+            raise ValueError("edges must be an (n_edges, 2) array")
+        if len(self.population) != len(self.tallies):
+            raise ValueError("population and tallies must have one row per precinct")
+        if not 1 < n_districts <= len(self.tallies):
+            raise ValueError(f"n_districts must be between 2 and {len(self.tallies)}")
+
+        self.n_districts = n_districts
+        self.tolerance = tolerance
+        self.party_a = party_a
+        self.party_b = party_b
+        self.max_attempts = max_attempts
+
+    def score(self, plans: np.ndarray) -> dict:
+        """Score plans against the cached precinct tallies; see score_plans()."""
+        return score_plans(plans, self.tallies, self.n_districts, self.party_a, self.party_b)
+
+    def run(
+        self,
+        n_steps: int = 1000,
+        n_chains: int = 4,
+        initial_plan: np.ndarray | None = None,
+        thin: int = 1,
+        seed: int | None = None,
+        n_jobs: int = 1,
+    ) -> EnsembleResult:
+        """
+        Run ReCom chains and score every recorded plan.
+
+        Args:
+            n_steps: Steps per chain
+            n_chains: Independent chains
+            initial_plan: (n_precincts,) contiguous starting plan shared by all
+                chains (default: a random_plan() per chain)
+            thin: Record every thin-th plan
+            seed: Random seed
+            n_jobs: Worker processes for running chains (1 = sequential);
+                results are identical for any value
+
+        Returns:
+            EnsembleResult
+        """
+        if initial_plan is not None:
+            initial_plan = np.asarray(initial_plan, dtype=np.int32)
+            district_pop = np.bincount(
+                initial_plan, weights=self.population, minlength=self.n_districts
+            )
+            ideal = self.population.sum() / self.n_districts
+            if np.abs(district_pop / ideal - 1).max() > self.tolerance:
+                raise ValueError("initial_plan is outside the population tolerance")
+
+        seeds = np.random.SeedSequence(seed).spawn(n_chains)
+        tasks = [
+            (
+                seeds[c],
+                initial_plan,
+                self.edges,
+                self.population,
+                self.n_districts,
+                self.tolerance,
+                n_steps,
+                thin,
+                self.max_attempts,
+            )
+            for c in range(n_chains)
+        ]
+
+        if n_jobs > 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Spawned workers: forking after Polars / Numba start their thread pools can deadlock
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=n_jobs, mp_context=context) as executor:
+                outputs = list(executor.map(_run_chain_task, tasks))
+        else:
+            outputs = [_run_chain(*task) for task in tasks]
+
+        plans = np.concatenate([out[0] for out in outputs])
+        scores = self.score(plans)
+        return EnsembleResult(
+            plans=plans,
+            chain=np.repeat(np.arange(n_chains), [len(out[0]) for out in outputs]),
+            acceptance_rate=np.array([out[1] / n_steps for out in outputs]),
+            district_tallies=scores["district_tallies"],
+            seats=scores["seats"],
+            efficiency_gap=scores["efficiency_gap"],
+            partisan_bias=scores["partisan_bias"],
+            party_a=self.party_a,
+        )
@@ -13,6 +13,7 @@ Ref: Jameson Quinn, "Voting System Efficiency"
 """
 
 import numpy as np
+import polars as pl
 
 
 def calculate_welfare(utilities: np.ndarray, weights: np.ndarray | None = None) -> float:
@@ -43,6 +44,23 @@ def calculate_vse(
                      For single-winner: one 1.0, rest 0.0.
         random_iterations: unused in this analytical version (w_random = mean of all options)
 
+    Returns:
+        VSE Score (typically 0.0 to 1.0)
+    """
+    return vse_from_welfare(np.sum(utilities, axis=0, dtype=np.float64), seat_shares)
+
+
+def vse_from_welfare(party_welfare: np.ndarray, seat_shares: np.ndarray) -> float:
+    """
+    Calculate VSE from per-party welfare sums.
+
+    Lets callers that already accumulated welfare (e.g. during vote sampling)
+    skip the pass over the utility matrix.
+
+    Args:
+        party_welfare: (n_parties,) total utility each party would deliver
+        seat_shares: (n_parties,) seat shares of the actual outcome
+
     Returns:
         VSE Score (typically 0.0 to 1.0)
     """
@@ -50,20 +68,188 @@ def calculate_vse(
     # The "Optimal" outcome depends on the goal.
     # Goal: Maximize sum of utilities.
     # For single-winner assumption (standard VSE): Best single party.
-    total_utility_per_party = np.sum(utilities, axis=0)
-    w_optimal = np.max(total_utility_per_party)
+    w_optimal = np.max(party_welfare)
 
     # 2. W_random
     # Expected welfare of a random winner (standard VSE definition)
-    w_random = np.mean(total_utility_per_party)
+    w_random = np.mean(party_welfare)
 
     # 3. W_actual
     # Weighted average of welfare provided by each party, weighted by their seat share.
     # (Assuming parliament utility is linear combination of party utilities)
-    w_actual = np.sum(total_utility_per_party * seat_shares)
+    w_actual = np.sum(party_welfare * seat_shares)
 
     if w_optimal == w_random:
         return 0.0  # Division by zero protection (all options equal)
 
     vse = (w_actual - w_random) / (w_optimal - w_random)
     return float(vse)
+
+
+def constituency_welfare(
+    utilities: np.ndarray, constituencies: np.ndarray, n_constituencies: int
+) -> np.ndarray:
+    """
+    Sum each party's utility over the voters of each constituency.
+
+    Args:
+        utilities: (n_voters, n_parties) matrix of utilities
+        constituencies: (n_voters,) constituency index per voter
+        n_constituencies: Number of constituencies
+
+    Returns:
+        (n_constituencies, n_parties) welfare matrix
+    """
+    return np.stack(
+        [
+            np.bincount(constituencies, weights=utilities[:, p], minlength=n_constituencies)
+            for p in range(utilities.shape[1])
+        ],
+        axis=1,
+    )
+
+
+def constituency_vse(welfare: np.ndarray, winners: np.ndarray) -> np.ndarray:
+    """
+    VSE of each constituency's winner against that constituency's electorate.
+
+    The random-winner baseline is exact: the mean welfare over all parties.
+
+    Args:
+        welfare: (n_constituencies, n_parties) welfare matrix
+        winners: (n_constituencies,) winning party per constituency (-1 = none)
+
+    Returns:
+        (n_constituencies,) VSE scores, NaN where there is no winner or all
+        parties deliver equal welfare
+    """
+    w_optimal = welfare.max(axis=1)
+    w_random = welfare.mean(axis=1)
+    w_actual = np.take_along_axis(welfare, np.maximum(winners, 0)[:, None], axis=1)[:, 0]
+
+    spread = w_optimal - w_random
+    valid = (winners >= 0) & (spread > 0)
+    vse = np.full(len(winners), np.nan)
+    vse[valid] = (w_actual[valid] - w_random[valid]) / spread[valid]
+    return vse
+
+
+def district_vse(welfare: np.ndarray, winners: np.ndarray) -> float:
+    """
+    Aggregate VSE of a district system: every constituency's winner against
+    the best and the random winner of that constituency.
+
+    Args:
+        welfare: (n_constituencies, n_parties) welfare matrix
+        winners: (n_constituencies,) winning party per constituency (-1 = none)
+
+    Returns:
+        VSE Score (typically 0.0 to 1.0)
+    """
+    has_winner = winners >= 0
+    welfare = welfare[has_winner]
+    w_actual = welfare[np.arange(len(welfare)), winners[has_winner]].sum()
+    w_optimal = welfare.max(axis=1).sum()
+    w_random = welfare.mean(axis=1).sum()
+
+    if w_optimal == w_random:
+        return 0.0
+
+    return float((w_actual - w_random) / (w_optimal - w_random))
+
+
+def monte_carlo_vse(
+    model,
+    strategic_fractions: tuple[float, ...] | list[float] = (0.0, 0.25, 0.5, 0.75, 1.0),
+    systems: tuple[str, ...] | list[str] = ("FPTP",),
+    n_replicates: int = 10,
+    sensitivity: float = 1.0,
+    **kwargs,
+) -> pl.DataFrame:
+    """
+    Estimate VSE across mixes of honest and strategic voters.
+
+    Sincere utilities, welfare and turnout probabilities come from the
+    model's current electorate and are shared by every replicate; turnout,
+    MNL draws and strategic voters are drawn for all replicates at once and
+    each mix is sampled as one (n_replicates * n_voters) batch. Strategic
+    voters discount parties by their replicate's constituency poll share (as
+    StrategicVotingModel does with viability) before voting. The strategic
+    voters of a smaller fraction are a subset of those of a larger one, and
+    all mixes share the same MNL draws, so differences between fractions are
+    paired. Welfare is always measured on sincere utilities.
+
+    Args:
+        model: ElectionModel providing electorate, behavior and temperature
+        strategic_fractions: Fractions of strategic voters to evaluate
+        systems: Electoral systems to count each mix under
+        n_replicates: Number of replicates
+        sensitivity: Strength of the strategic viability discount
+        **kwargs: Extra parameters passed to the behavior engine
+
+    Returns:
+        DataFrame with replicate, strategic_fraction, system, vse and
+        district_vse (NaN for non-district systems)
+    """
+    from electoral_sim.core.ballots import BallotSet
+    from electoral_sim.engine.numba_accel import mnl_sample
+
+    constituencies = model.voters.get_constituencies()
+    C, P = model.n_constituencies, model.n_parties
+    R, n = n_replicates, len(model.voters)
+    eligible = model._eligibility()
+    rows = []
+
+    sincere = model._compute_utilities(**kwargs)
+    welfare = constituency_welfare(sincere, constituencies, C)
+    turnout_prob = model._turnout_probability(sincere)
+
+    # Common random numbers: every mix of a replicate shares them
+    will_vote = turnout_prob > model.rng.random((R, n))
+    random_vals = model.rng.random(R * n)
+    strategic_draw = model.rng.random((R, n))
+
+    replicate = np.broadcast_to(np.arange(R)[:, np.newaxis], (R, n))
+    batch_constituencies = np.tile(constituencies, R)
+    batch_sincere = np.tile(sincere, (R, 1))
+
+    def sample(utilities: np.ndarray) -> np.ndarray:
+        votes = mnl_sample(
+            utilities, model.temperature, random_vals, batch_constituencies, eligible
+        )
+        return votes.reshape(R, n)
+
+    # Honest polls: first-preference shares per replicate and constituency
+    honest = sample(batch_sincere)
+    cells = (replicate * C + constituencies) * P + honest
+    poll = np.bincount(cells[will_vote], minlength=R * C * P).reshape(R, C, P).astype(float)
+    poll /= np.maximum(poll.sum(axis=2, keepdims=True), 1.0)
+    discount = sensitivity * np.log(poll + 1e-6)
+
+    for fraction in strategic_fractions:
+        strategic = strategic_draw < fraction
+        utilities = batch_sincere.copy()
+        mixed = utilities.reshape(R, n, P)
+        mixed[strategic] += discount[replicate[strategic], constituencies[strategic.nonzero()[1]]]
+        votes = honest if fraction == 0 else sample(utilities)
+
+        for rep in range(R):
+            ballots = BallotSet(
+                mixed[rep], votes[rep], will_vote[rep], constituencies, C, welfare=welfare
+            )
+            for system in systems:
+                results = model.count_ballots(ballots, system, metrics=("vse",))
+                winners = results.get("winners")
+                rows.append(
+                    {
+                        "replicate": rep,
+                        "strategic_fraction": float(fraction),
+                        "system": system,
+                        "vse": results["vse"],
+                        "district_vse": (
+                            district_vse(welfare, winners) if winners is not None else np.nan
+                        ),
+                    }
+                )
+
+    return pl.DataFrame(rows).sort("replicate", maintain_order=True)
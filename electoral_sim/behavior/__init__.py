@@ -3,9 +3,15 @@
 from electoral_sim.behavior.voter_behavior import (
     BehaviorEngine,
     BehaviorModel,
+    BehaviorPlan,
+    DirectionalModel,
+    KernelModel,
+    MixedSpatialModel,
     ProximityModel,
+    RegionalBiasModel,
     RetrospectiveModel,
     SociotropicPocketbookModel,
+    SpatialModel,
     StrategicVotingModel,
     ValenceModel,
     WastedVoteModel,
@@ -14,10 +20,16 @@ from electoral_sim.behavior.voter_behavior import (
 __all__ = [
     "BehaviorModel",
     "BehaviorEngine",
+    "BehaviorPlan",
+    "SpatialModel",
     "ProximityModel",
+    "DirectionalModel",
+    "MixedSpatialModel",
     "ValenceModel",
+    "RegionalBiasModel",
     "RetrospectiveModel",
     "StrategicVotingModel",
     "SociotropicPocketbookModel",
     "WastedVoteModel",
+    "KernelModel",
 ]
@@ -3,12 +3,31 @@ Voter Behavior Models
 
 Implements different factors that influence voter utility and choice.
 Modular and pluggable.
+
+BehaviorEngine compiles its models into a BehaviorPlan: the spatial terms
+(proximity, directional and mixed models), party-only terms (summed into one
+(n_parties,) bias vector) and voter-only terms (one (n_voters,) scalar applied
+to incumbents) are evaluated by a single fused kernel that writes one
+utility matrix in the engine's precision (float32 by default, float64 for
+validation). Custom KernelModels add their JIT-compiled per-(voter, party)
+functions into the same matrix.
 """
 
-from typing import Protocol, runtime_checkable
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal, Protocol, runtime_checkable
+
+import inspect
 
 import numpy as np
 
+from electoral_sim.engine.numba_accel import (
+    compile_pair_utility,
+    fused_utilities_fast,
+    utility_dtype,
+)
+
 
 @runtime_checkable
 class BehaviorModel(Protocol):
@@ -17,27 +36,160 @@ class BehaviorModel(Protocol):
     def compute_utility(self, voters, parties, **kwargs) -> np.ndarray: ...
 
 
-class ProximityModel:
-    """Standard spatial model: utility decreases with ideological distance."""
+class SpatialModel(ABC):
+    """
+    Base class for issue-space models evaluated by the fused utility kernel.
+
+    Subclasses must implement spatial_weights, describing their utility as a
+    weighted sum of three spatial terms, which lets BehaviorEngine fuse any number of
+    spatial models with the valence and incumbency terms in one pass.
+    """
+
+    # Proximity distance metric, or None for models without a distance term
+    metric: str | None = None
 
-    def __init__(self, weight: float = 1.0, dimensionality: int = 2):
+    def __init__(self, weight: float = 1.0, dimensionality: int | None = None):
         self.weight = weight
         self.dimensionality = dimensionality
 
+    @abstractmethod
+    def spatial_weights(self) -> dict[str, float]:
+        """
+        Coefficients of the spatial terms:
+
+        - distance: -dist(v, c) under the model's metric
+        - quadratic: -||v - c||^2
+        - directional: <v, c>, the scalar product from the neutral point (origin)
+        """
+
+    def issue_space(
+        self,
+        voter_positions: np.ndarray,
+        party_positions: np.ndarray,
+        salience: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """Restrict positions (and salience) to the model's issue dimensions."""
+        d = self.dimensionality
+        if d is None:
+            return voter_positions, party_positions, salience
+        return (
+            voter_positions[:, :d],
+            party_positions[:, :d],
+            None if salience is None else salience[:, :d],
+        )
+
     def compute_utility(
-        self, voter_positions: np.ndarray, party_positions: np.ndarray, **kwargs
+        self,
+        voter_positions: np.ndarray,
+        party_positions: np.ndarray,
+        salience: np.ndarray | None = None,
+        dtype: type | None = None,
+        **kwargs,
     ) -> np.ndarray:
         """
         Args:
             voter_positions: (n_voters, dims)
             party_positions: (n_parties, dims)
+            salience: Optional (n_voters, dims) issue weights
+            dtype: Output dtype (default: dtype of voter_positions)
         Returns:
             (n_voters, n_parties) utility matrix
         """
-        # (n_voters, 1, dims) - (1, n_parties, dims) -> (n_voters, n_parties, dims)
-        diff = voter_positions[:, np.newaxis, :] - party_positions[np.newaxis, :, :]
-        dist = np.linalg.norm(diff, axis=2)
-        return -self.weight * dist
+        # Spatial terms are accumulated one dimension at a time, without a
+        # (n_voters, n_parties, dims) difference tensor
+        n_voters, n_parties = len(voter_positions), len(party_positions)
+        voters, parties, salience = self.issue_space(voter_positions, party_positions, salience)
+        weights = self.spatial_weights()
+        return fused_utilities_fast(
+            voters,
+            parties,
+            weights.get("distance", 0.0),
+            np.zeros(n_parties),
+            np.zeros(n_voters),
+            np.zeros(n_parties),
+            dtype=dtype or np.result_type(voter_positions, np.float32),
+            salience=salience,
+            metric=self.metric or "euclidean",
+            quadratic_weight=weights.get("quadratic", 0.0),
+            directional_weight=weights.get("directional", 0.0),
+        )
+
+
+class ProximityModel(SpatialModel):
+    """
+    Standard spatial model: utility decreases with ideological distance.
+
+    Works in an issue space of any dimension. Distances can be Euclidean or
+    city-block and are weighted per voter by issue salience when the voter
+    data provides it.
+    """
+
+    def __init__(
+        self,
+        weight: float = 1.0,
+        dimensionality: int | None = None,
+        metric: Literal["euclidean", "cityblock"] = "euclidean",
+    ):
+        """
+        Args:
+            weight: Utility lost per unit of distance
+            dimensionality: Leading issue dimensions used (default: all)
+            metric: 'euclidean' or 'cityblock'
+        """
+        super().__init__(weight, dimensionality)
+        self.metric = metric
+
+    def spatial_weights(self) -> dict[str, float]:
+        return {"distance": self.weight}
+
+
+class DirectionalModel(SpatialModel):
+    """
+    Directional model (Rabinowitz & Macdonald 1989).
+
+    Voters reward parties on their side of each issue, in proportion to
+    intensity: U = weight * <v, c>, with positions measured from the neutral
+    point at the origin of the issue space (salience-weighted per issue).
+    """
+
+    def __init__(self, weight: float = 1.0, dimensionality: int | None = None):
+        """
+        Args:
+            weight: Scale of the directional scalar product
+            dimensionality: Leading issue dimensions used (default: all)
+        """
+        super().__init__(weight, dimensionality)
+
+    def spatial_weights(self) -> dict[str, float]:
+        return {"directional": self.weight}
+
+
+class MixedSpatialModel(SpatialModel):
+    """
+    Mixed proximity/directional model (Merrill & Grofman 1999).
+
+    U = weight * [beta * <v, c> - (1 - beta) * ||v - c||^2]
+
+    beta = 0 is the quadratic proximity model, beta = 1 the directional model.
+    """
+
+    def __init__(self, weight: float = 1.0, beta: float = 0.5, dimensionality: int | None = None):
+        """
+        Args:
+            weight: Overall scale
+            beta: Directional share (0-1)
+            dimensionality: Leading issue dimensions used (default: all)
+        """
+        if not 0.0 <= beta <= 1.0:
+            raise ValueError(f"beta must be between 0 and 1, got {beta}")
+        super().__init__(weight, dimensionality)
+        self.beta = beta
+
+    def spatial_weights(self) -> dict[str, float]:
+        return {
+            "directional": self.weight * self.beta,
+            "quadratic": self.weight * (1.0 - self.beta),
+        }
 
 
 class ValenceModel:
@@ -54,7 +206,37 @@ class ValenceModel:
         Returns:
             (n_voters, n_parties) utility matrix
         """
-        return np.tile(self.weight * valence, (n_voters, 1))
+        return np.tile(self.party_bias(valence), (n_voters, 1))
+
+    def party_bias(self, valence: np.ndarray) -> np.ndarray:
+        """(n_parties,) utility term shared by every voter."""
+        return self.weight * np.asarray(valence, dtype=np.float64)
+
+
+class RegionalBiasModel:
+    """
+    Regional party strength: a party-level utility term that varies by region.
+
+    Reads party_data["regional_bias"], the (n_parties,) bias of the region being
+    simulated (see RegionalElection).
+    """
+
+    def __init__(self, weight: float = 1.0):
+        self.weight = weight
+
+    def compute_utility(self, n_voters: int, regional_bias: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Args:
+            n_voters: Number of voters
+            regional_bias: (n_parties,) party strength in the voters' region
+        Returns:
+            (n_voters, n_parties) utility matrix
+        """
+        return np.tile(self.party_bias(regional_bias), (n_voters, 1))
+
+    def party_bias(self, regional_bias: np.ndarray) -> np.ndarray:
+        """(n_parties,) utility term shared by every voter in the region."""
+        return self.weight * np.asarray(regional_bias, dtype=np.float64)
 
 
 class RetrospectiveModel:
@@ -76,12 +258,14 @@ class RetrospectiveModel:
             incumbent_mask: bool array (n_parties,)
             economic_growth: Current growth rate (can be voter-specific or global)
         """
-        utility = np.zeros((n_voters, n_parties))
+        return np.tile(self.party_bias(incumbent_mask, economic_growth), (n_voters, 1))
+
+    def party_bias(self, incumbent_mask: np.ndarray, economic_growth: float) -> np.ndarray:
+        """(n_parties,) utility term shared by every voter."""
         # Logic: If growth > 0, bonus to incumbents. If growth < 0, penalty.
         # Here we assume a simple global growth for now
         reward = self.weight * economic_growth
-        utility[:, incumbent_mask] = reward
-        return utility
+        return np.where(incumbent_mask, reward, 0.0)
 
 
 class StrategicVotingModel:
@@ -95,9 +279,12 @@ class StrategicVotingModel:
         Args:
             viability: (n_parties,) estimated probability of winning or 'expected vote share'
         """
+        return np.tile(self.party_bias(viability), (n_voters, 1))
+
+    def party_bias(self, viability: np.ndarray) -> np.ndarray:
+        """(n_parties,) utility term shared by every voter."""
         # Penalty for low viability
-        penalty = self.sensitivity * (np.log(viability + 1e-6))
-        return np.tile(penalty, (n_voters, 1))
+        return self.sensitivity * (np.log(viability + 1e-6))
 
 
 class SociotropicPocketbookModel:
@@ -110,6 +297,9 @@ class SociotropicPocketbookModel:
     Research shows higher-educated voters tend to be more sociotropic.
     """
 
+    # Optional voter columns read by BehaviorEngine (see BehaviorPlan.voter_columns)
+    voter_columns = ("economic_perception", "personal_income_change")
+
     def __init__(self, sociotropic_weight: float = 0.5, pocketbook_weight: float = 0.5):
         self.sociotropic_weight = sociotropic_weight
         self.pocketbook_weight = pocketbook_weight
@@ -132,6 +322,21 @@ class SociotropicPocketbookModel:
         """
         utility = np.zeros((n_voters, n_parties))
 
+        # Apply to incumbents
+        utility[:, incumbent_mask] = self.voter_effect(
+            n_voters, economic_growth, personal_income_change, perception_type
+        )[:, np.newaxis]
+
+        return utility
+
+    def voter_effect(
+        self,
+        n_voters: int,
+        economic_growth: float,
+        personal_income_change: np.ndarray | None = None,
+        perception_type: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """(n_voters,) utility term applied to every incumbent party."""
         # Default: everyone uses national (sociotropic)
         if perception_type is None:
             perception_type = np.ones(n_voters)
@@ -142,12 +347,7 @@ class SociotropicPocketbookModel:
         sociotropic_effect = self.sociotropic_weight * economic_growth * perception_type
         pocketbook_effect = self.pocketbook_weight * personal_income_change * (1 - perception_type)
 
-        total_effect = sociotropic_effect + pocketbook_effect
-
-        # Apply to incumbents
-        utility[:, incumbent_mask] = total_effect[:, np.newaxis]
-
-        return utility
+        return sociotropic_effect + pocketbook_effect
 
 
 class WastedVoteModel:
@@ -168,112 +368,445 @@ class WastedVoteModel:
         Args:
             viability: (n_parties,) expected vote share or probability of winning
         """
+        return np.tile(self.party_bias(viability), (n_voters, 1))
+
+    def party_bias(self, viability: np.ndarray) -> np.ndarray:
+        """(n_parties,) utility term shared by every voter."""
         # Binary penalty: below threshold → wasted vote
         is_wasted = viability < self.viability_threshold
-        penalty_vec = np.where(is_wasted, -self.penalty, 0.0)
-        return np.tile(penalty_vec, (n_voters, 1))
+        return np.where(is_wasted, -self.penalty, 0.0)
 
 
-class BehaviorEngine:
-    """Combines multiple behavior models into a single utility matrix."""
+class KernelModel:
+    """
+    Custom model defined by a scalar per-(voter, party) utility function.
 
-    def __init__(self):
-        self.models = []
+    The function is JIT-compiled with Numba and accumulated straight into the
+    engine's utility matrix, so plugins run at compiled speed without building
+    their own (n_voters, n_parties) matrix.
 
-    def add_model(self, model, weight: float = 1.0):
-        self.models.append((model, weight))
+    Example:
+        >>> def age_affinity(voter, party):
+        ...     return -abs(voter[0] - party[0]) / 10.0
+        >>> model = KernelModel(age_affinity, voter_columns=["age"], party_columns=["leader_age"])
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        voter_columns: list[str] | tuple[str, ...] = (),
+        party_columns: list[str] | tuple[str, ...] = (),
+        weight: float = 1.0,
+    ):
+        """
+        Args:
+            func: f(voter_row, party_row) -> float. voter_row holds the
+                declared voter columns for one voter, party_row the declared
+                party columns for one party (both float64 arrays, in order)
+            voter_columns: Voter columns to read; requested from the agents
+                by the engine and looked up in voter_data (or voter_data['df'])
+            party_columns: Party columns to read, looked up the same way
+            weight: Utility scale
+        """
+        params = [
+            p
+            for p in inspect.signature(func).parameters.values()
+            if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) and p.default is p.empty
+        ]
+        if len(params) != 2:
+            raise TypeError(
+                f"{func.__name__} must take exactly two arguments (voter_row, party_row), "
+                f"got {len(params)}"
+            )
+        self.func = func
+        self.voter_columns = tuple(voter_columns)
+        self.party_columns = tuple(party_columns)
+        self.weight = weight
+
+    @staticmethod
+    def _columns(data: dict, columns: tuple[str, ...], n_rows: int, side: str) -> np.ndarray:
+        """(n_rows, len(columns)) float64 matrix of the declared columns."""
+        out = np.empty((n_rows, len(columns)), dtype=np.float64)
+        for j, name in enumerate(columns):
+            if data.get(name) is not None:
+                values = data[name]
+            elif data.get("df") is not None and name in data["df"].columns:
+                values = data["df"][name].to_numpy()
+            else:
+                raise KeyError(f"KernelModel reads {side} column '{name}', which is not provided")
+            out[:, j] = np.asarray(values, dtype=np.float64)
+        return out
+
+    def accumulate(
+        self, voter_data: dict, party_data: dict, out: np.ndarray, weight: float = 1.0
+    ) -> np.ndarray:
+        """Add weight * self.weight * func(voter, party) to out in place."""
+        voter_cols = self._columns(voter_data, self.voter_columns, out.shape[0], "voter")
+        party_cols = self._columns(party_data, self.party_columns, out.shape[1], "party")
+        kernel = compile_pair_utility(self.func)
+        try:
+            return kernel(voter_cols, party_cols, float(weight * self.weight), out)
+        except Exception as err:
+            # Numba typing errors surface here, on first use of the kernel
+            if type(err).__module__.startswith("numba"):
+                raise TypeError(
+                    f"Cannot compile {self.func.__name__}(voter_row, party_row) -> float "
+                    f"for {len(self.voter_columns)} voter and {len(self.party_columns)} "
+                    f"party columns: {err}"
+                ) from err
+            raise
+
+    def compute_utility(
+        self, voter_data: dict, party_data: dict, dtype: type = np.float64, **kwargs
+    ) -> np.ndarray:
+        """
+        Returns:
+            (n_voters, n_parties) utility matrix
+        """
+        out = np.zeros((voter_data["n_voters"], party_data["n_parties"]), dtype=dtype)
+        return self.accumulate(voter_data, party_data, out)
+
+
+def _viability(party_data: dict, kwargs: dict) -> np.ndarray:
+    """Viability scores from party data or kwargs (default: equal viability)."""
+    viability = party_data.get("viability")
+    if viability is None:
+        viability = kwargs.get("viability")
+    if viability is None:
+        n_parties = party_data["n_parties"]
+        viability = np.ones(n_parties) / n_parties
+    return np.asarray(viability, dtype=np.float64)
+
+
+def _perception_type(voter_data: dict) -> np.ndarray | None:
+    """Per-voter economic perception (0=pocketbook, 1=sociotropic), if available."""
+    perception = voter_data.get("economic_perception")
+    if perception is None and voter_data.get("df") is not None:
+        voter_df = voter_data["df"]
+        if "economic_perception" in voter_df.columns:
+            perception = voter_df["economic_perception"].to_numpy()
+    return perception
+
+
+# Party-only terms: (model, voter_data, party_data, kwargs) -> (n_parties,)
+_PARTY_TERMS: dict[type, Callable] = {
+    ValenceModel: lambda m, vd, pd, kw: m.party_bias(pd["valence"]),
+    RegionalBiasModel: lambda m, vd, pd, kw: m.party_bias(pd["regional_bias"]),
+    RetrospectiveModel: lambda m, vd, pd, kw: m.party_bias(pd["incumbents"], kw.get("growth", 0.0)),
+    StrategicVotingModel: lambda m, vd, pd, kw: m.party_bias(_viability(pd, kw)),
+    WastedVoteModel: lambda m, vd, pd, kw: m.party_bias(_viability(pd, kw)),
+}
+
+# Voter-only terms applied to incumbents: (model, voter_data, party_data, kwargs) -> (n_voters,)
+_VOTER_TERMS: dict[type, Callable] = {
+    SociotropicPocketbookModel: lambda m, vd, pd, kw: m.voter_effect(
+        vd["n_voters"],
+        economic_growth=kw.get("growth", 0.0),
+        personal_income_change=vd.get("personal_income_change"),
+        perception_type=_perception_type(vd),
+    ),
+}
+
+
+def _registered_term(terms: dict[type, Callable], model) -> Callable | None:
+    """Term registered for the model's class or its nearest registered base class."""
+    for cls in type(model).__mro__:
+        if cls in terms:
+            return terms[cls]
+    return None
+
+
+def _requested_columns(models: list, attr: str) -> tuple[str, ...]:
+    """Union of the column names models declare under attr, without duplicates."""
+    columns: dict[str, None] = {}
+    for model in models:
+        columns.update(dict.fromkeys(getattr(model, attr, ())))
+    return tuple(columns)
+
+
+@dataclass
+class BehaviorPlan:
+    """
+    Behavior models grouped by the shape of their utility term.
+
+    Attributes:
+        distance: Spatial models (proximity, directional, mixed) sharing one
+            metric and issue space, fused into the kernel's spatial terms
+        extra_distance: Spatial models with another metric or issue space
+        party_terms: (term, model, weight) summed into an (n_parties,) bias
+        voter_terms: (term, model, weight) summed into an (n_voters,) scalar
+            applied to incumbent parties
+        kernel_terms: KernelModels, accumulated into the utility matrix by
+            their compiled per-(voter, party) kernels
+        matrix_terms: Other models, each returning a full utility matrix
+
+    Models may declare the agent columns they read as ``voter_columns`` /
+    ``party_columns``; callers fetch the union (plan.voter_columns,
+    plan.party_columns) once per election and pass them in voter_data and
+    party_data, instead of the whole agent DataFrames.
+    """
+
+    distance: list[tuple[SpatialModel, float]] = field(default_factory=list)
+    extra_distance: list[tuple[SpatialModel, float]] = field(default_factory=list)
+    party_terms: list[tuple[Callable, object, float]] = field(default_factory=list)
+    voter_terms: list[tuple[Callable, object, float]] = field(default_factory=list)
+    kernel_terms: list[tuple[KernelModel, float]] = field(default_factory=list)
+    matrix_terms: list[tuple[object, float]] = field(default_factory=list)
+
+    def party_bias(self, voter_data: dict, party_data: dict, **kwargs) -> np.ndarray:
+        """(n_parties,) sum of all party-only terms."""
+        bias = np.zeros(party_data["n_parties"], dtype=np.float64)
+        for term, model, w in self.party_terms:
+            bias += w * term(model, voter_data, party_data, kwargs)
+        return bias
+
+    def voter_term(self, voter_data: dict, party_data: dict, **kwargs) -> np.ndarray:
+        """(n_voters,) sum of all voter-only terms."""
+        total = np.zeros(voter_data["n_voters"], dtype=np.float64)
+        for term, model, w in self.voter_terms:
+            total += w * term(model, voter_data, party_data, kwargs)
+        return total
+
+    @property
+    def metric(self) -> str:
+        """Distance metric of the fused spatial terms."""
+        for model, _ in self.distance:
+            if model.metric is not None:
+                return model.metric
+        return "euclidean"
+
+    def accepts(self, model: SpatialModel) -> bool:
+        """Whether a spatial model can join the fused spatial terms."""
+        if not self.distance:
+            return True
+        lead = self.distance[0][0]
+        compatible_metric = model.metric is None or all(
+            m.metric in (None, model.metric) for m, _ in self.distance
+        )
+        return model.dimensionality == lead.dimensionality and compatible_metric
+
+    def spatial_weights(self) -> dict[str, float]:
+        """Summed coefficients of the fused spatial terms."""
+        totals = {"distance": 0.0, "quadratic": 0.0, "directional": 0.0}
+        for model, w in self.distance:
+            for name, value in model.spatial_weights().items():
+                totals[name] += w * value
+        return totals
+
+    @property
+    def voter_columns(self) -> tuple[str, ...]:
+        """Voter columns requested by the plan's models, in first-use order."""
+        return _requested_columns(self.models(), "voter_columns")
+
+    @property
+    def party_columns(self) -> tuple[str, ...]:
+        """Party columns requested by the plan's models, in first-use order."""
+        return _requested_columns(self.models(), "party_columns")
+
+    def models(self) -> list:
+        """All models in the plan."""
+        grouped = (self.party_terms, self.voter_terms)
+        return [
+            *(m for m, _ in self.distance + self.extra_distance),
+            *(m for terms in grouped for _, m, _ in terms),
+            *(m for m, _ in self.kernel_terms + self.matrix_terms),
+        ]
+
+    def execute(
+        self,
+        voter_data: dict,
+        party_data: dict,
+        use_gpu: bool = False,
+        dtype: type = np.float32,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Evaluate the plan into a single utility matrix.
+
+        Args:
+            voter_data: Voter arrays (n_voters, positions, ...)
+            party_data: Party arrays (n_parties, positions, valence, ...)
+            use_gpu: Compute the distance term with CuPy
+            dtype: Output dtype (np.float32 or np.float64)
 
-    def compute_all(self, voter_data: dict, party_data: dict, **kwargs) -> np.ndarray:
+        Returns:
+            (n_voters, n_parties) utility matrix
+        """
         n_voters = voter_data["n_voters"]
         n_parties = party_data["n_parties"]
-        use_gpu = kwargs.get("use_gpu", False)
+        bias = self.party_bias(voter_data, party_data, **kwargs)
+        voter_term = self.voter_term(voter_data, party_data, **kwargs)
+        # Incumbency only matters to voter terms
+        mask = (
+            np.asarray(party_data["incumbents"], dtype=np.float64)
+            if self.voter_terms
+            else np.zeros(n_parties)
+        )
+        weights = self.spatial_weights()
+        metric = self.metric
+
+        voter_positions = voter_data["positions"]
+        party_positions = party_data["positions"]
+        salience = voter_data.get("salience")
+        if self.distance:
+            voter_positions, party_positions, salience = self.distance[0][0].issue_space(
+                voter_positions, party_positions, salience
+            )
 
         if use_gpu:
             import cupy as cp
 
-            total_utility = cp.zeros((n_voters, n_parties), dtype=cp.float32)
-
-            # Convert basic data to GPU
-            v_pos = cp.asarray(voter_data["positions"], dtype=cp.float32)
-            p_pos = cp.asarray(party_data["positions"], dtype=cp.float32)
-            valence = cp.asarray(party_data["valence"], dtype=cp.float32)
-            incumbents = cp.asarray(party_data["incumbents"], dtype=bool)
-
-            for model, w in self.models:
-                if isinstance(model, ProximityModel):
-                    # Optimized proximity on GPU
-                    diff = v_pos[:, cp.newaxis, :] - p_pos[cp.newaxis, :, :]
-                    u = -model.weight * cp.sqrt(cp.sum(diff**2, axis=2))
-                elif isinstance(model, ValenceModel):
-                    u = model.weight * valence[cp.newaxis, :]
-                elif isinstance(model, RetrospectiveModel):
-                    reward = model.weight * kwargs.get("growth", 0.0)
-                    u = cp.zeros((n_voters, n_parties), dtype=cp.float32)
-                    u[:, incumbents] = reward
-                else:
-                    # Fallback to CPU for specialized models if not GPU-ready
-                    # (This part is tricky, we'll assume models return NumPy and we convert)
-                    u_cpu = model.compute_utility(voter_data, party_data, **kwargs)
-                    u = cp.asarray(u_cpu, dtype=cp.float32)
-
-                total_utility += w * u
-
-            return cp.asnumpy(total_utility)
-
+            v_pos = cp.asarray(voter_positions, dtype=dtype)
+            p_pos = cp.asarray(party_positions, dtype=dtype)
+            sal = None if salience is None else cp.asarray(salience, dtype=dtype)
+
+            # Accumulate one dimension at a time: memory stays (n_voters, n_parties)
+            acc = cp.zeros((n_voters, n_parties), dtype=dtype)
+            sq = cp.zeros((n_voters, n_parties), dtype=dtype)
+            dot = cp.zeros((n_voters, n_parties), dtype=dtype)
+            for d in range(v_pos.shape[1]):
+                s = 1.0 if sal is None else sal[:, d, cp.newaxis]
+                v = v_pos[:, d, cp.newaxis]
+                c = p_pos[cp.newaxis, :, d]
+                sq += s * (v - c) ** 2
+                if metric == "cityblock":
+                    acc += s * cp.abs(v - c)
+                dot += s * v * c
+            dist = cp.sqrt(sq) if metric == "euclidean" else acc
+            total = (
+                weights["directional"] * dot
+                - weights["distance"] * dist
+                - weights["quadratic"] * sq
+            )
+            total += cp.asarray(bias, dtype=dtype)[cp.newaxis, :]
+            total += cp.outer(cp.asarray(voter_term, dtype=dtype), cp.asarray(mask, dtype=dtype))
+            total_utility = cp.asnumpy(total.astype(dtype))
         else:
-            total_utility = np.zeros((n_voters, n_parties))
-
-            for model, w in self.models:
-                if isinstance(model, ProximityModel):
-                    u = model.compute_utility(voter_data["positions"], party_data["positions"])
-                elif isinstance(model, ValenceModel):
-                    u = model.compute_utility(n_voters, party_data["valence"])
-                elif isinstance(model, RetrospectiveModel):
-                    u = model.compute_utility(
-                        n_voters, n_parties, party_data["incumbents"], kwargs.get("growth", 0.0)
-                    )
-                elif isinstance(model, StrategicVotingModel):
-                    # Strategic voting: needs viability scores
-                    viability = party_data.get("viability")
-                    if viability is None:
-                        viability = kwargs.get("viability")
-                    if viability is None:
-                        viability = np.ones(n_parties) / n_parties  # Default: equal viability
-                    u = model.compute_utility(n_voters, viability)
-                elif isinstance(model, WastedVoteModel):
-                    # Wasted vote model: needs viability scores
-                    viability = party_data.get("viability")
-                    if viability is None:
-                        viability = kwargs.get("viability")
-                    if viability is None:
-                        viability = np.ones(n_parties) / n_parties  # Default: equal viability
-                    u = model.compute_utility(n_voters, viability)
-                elif isinstance(model, SociotropicPocketbookModel):
-                    # Economic voting with sociotropic/pocketbook distinction
-                    voter_df = voter_data.get("df")
-                    perception_type = None
-                    if (
-                        voter_df is not None
-                        and hasattr(voter_df, "columns")
-                        and "economic_perception" in voter_df.columns
-                    ):
-                        perception_type = voter_df["economic_perception"].to_numpy()
-                    u = model.compute_utility(
-                        n_voters,
-                        n_parties,
-                        party_data["incumbents"],
-                        economic_growth=kwargs.get("growth", 0.0),
-                        personal_income_change=voter_data.get("personal_income_change"),
-                        perception_type=perception_type,
-                    )
-                else:
-                    # Generic fallback - try to call with standard args
-                    try:
-                        u = model.compute_utility(n_voters, n_parties, **kwargs)
-                    except TypeError:
-                        # If that fails, try minimal interface
-                        u = np.zeros((n_voters, n_parties))
-
-                total_utility += w * u
-
-            return total_utility
+            total_utility = fused_utilities_fast(
+                voter_positions,
+                party_positions,
+                weights["distance"],
+                bias,
+                voter_term,
+                mask,
+                dtype=dtype,
+                salience=salience,
+                metric=metric,
+                quadratic_weight=weights["quadratic"],
+                directional_weight=weights["directional"],
+            )
+
+        for model, w in self.extra_distance:
+            total_utility += w * model.compute_utility(
+                voter_data["positions"],
+                party_data["positions"],
+                salience=voter_data.get("salience"),
+                dtype=dtype,
+            )
+
+        for model, w in self.kernel_terms:
+            model.accumulate(voter_data, party_data, total_utility, weight=w)
+
+        for model, w in self.matrix_terms:
+            # Generic fallback: compute_utility(n_voters, n_parties, **kwargs)
+            u = np.asarray(model.compute_utility(n_voters, n_parties, **kwargs))
+            if u.shape != total_utility.shape:
+                raise TypeError(
+                    f"{type(model).__name__}.compute_utility returned shape {u.shape}, "
+                    f"expected {total_utility.shape}"
+                )
+            total_utility += np.asarray(w * u, dtype=total_utility.dtype)
+
+        return total_utility
+
+
+class BehaviorEngine:
+    """
+    Combines multiple behavior models into a single utility matrix.
+
+    The model list is compiled into a BehaviorPlan on first use (and again
+    after add_model), so each election evaluates all terms in one fused pass.
+
+    Attributes:
+        precision: 'float32' (default) or 'float64' utility matrices
+    """
+
+    def __init__(self, precision: str = "float32"):
+        utility_dtype(precision)
+        self.precision = precision
+        self.models = []
+        self._plan: BehaviorPlan | None = None
+        self._plan_key: tuple | None = None
+
+    def __getstate__(self) -> dict:
+        # Compiled plans hold term functions; they are rebuilt after unpickling
+        return {**self.__dict__, "_plan": None, "_plan_key": None}
+
+    def add_model(self, model, weight: float = 1.0):
+        self.models.append((model, weight))
+        self._plan = None
+
+    def add_kernel(
+        self,
+        func: Callable,
+        voter_columns: list[str] | tuple[str, ...] = (),
+        party_columns: list[str] | tuple[str, ...] = (),
+        weight: float = 1.0,
+    ) -> KernelModel:
+        """
+        Register a scalar per-(voter, party) utility function as a KernelModel.
+
+        Args:
+            func: f(voter_row, party_row) -> float (see KernelModel)
+            voter_columns: Voter columns passed in voter_row, in order
+            party_columns: Party columns passed in party_row, in order
+            weight: Utility scale
+
+        Returns:
+            The registered KernelModel
+        """
+        model = KernelModel(func, voter_columns, party_columns)
+        self.add_model(model, weight)
+        return model
+
+    def compile(self) -> BehaviorPlan:
+        """Group the registered models into a BehaviorPlan (cached)."""
+        key = tuple((id(model), w) for model, w in self.models)
+        if self._plan is not None and self._plan_key == key:
+            return self._plan
+
+        plan = BehaviorPlan()
+        for model, w in self.models:
+            party_term = _registered_term(_PARTY_TERMS, model)
+            voter_term = _registered_term(_VOTER_TERMS, model)
+            if isinstance(model, SpatialModel):
+                (plan.distance if plan.accepts(model) else plan.extra_distance).append((model, w))
+            elif party_term is not None:
+                plan.party_terms.append((party_term, model, w))
+            elif voter_term is not None:
+                plan.voter_terms.append((voter_term, model, w))
+            elif isinstance(model, KernelModel):
+                plan.kernel_terms.append((model, w))
+            else:
+                plan.matrix_terms.append((model, w))
+
+        self._plan, self._plan_key = plan, key
+        return plan
+
+    def compute_all(
+        self, voter_data: dict, party_data: dict, precision: str | None = None, **kwargs
+    ) -> np.ndarray:
+        """
+        Utility matrix of all registered models.
+
+        Args:
+            voter_data: Voter arrays (n_voters, positions, ...)
+            party_data: Party arrays (n_parties, positions, valence, ...)
+            precision: Overrides the engine's precision for this call
+            **kwargs: Model inputs (growth, viability, use_gpu, ...)
+
+        Returns:
+            (n_voters, n_parties) utility matrix
+        """
+        dtype = utility_dtype(precision or self.precision)
+        return self.compile().execute(voter_data, party_data, dtype=dtype, **kwargs)
@@ -1,8 +1,18 @@
 """Core module - ElectionModel and configuration."""
 
+from electoral_sim.core.ballots import BallotSet
 from electoral_sim.core.config import PRESETS, Config, PartyConfig
-from electoral_sim.core.counting import count_fptp, count_pr
+from electoral_sim.core.counting import (
+    COUNTING_SYSTEMS,
+    condorcet_winners,
+    constituency_winners,
+    count_ballots,
+    count_fptp,
+    count_pr,
+    runoff_qualifiers,
+)
 from electoral_sim.core.model import ElectionModel
+from electoral_sim.core.regional import Region, RegionalElection, RegionalResult
 from electoral_sim.core.voter_generation import generate_party_frame, generate_voter_frame
 
 __all__ = [
@@ -14,4 +24,13 @@ __all__ = [
     "generate_party_frame",
     "count_fptp",
     "count_pr",
+    "BallotSet",
+    "count_ballots",
+    "condorcet_winners",
+    "constituency_winners",
+    "runoff_qualifiers",
+    "Region",
+    "RegionalElection",
+    "RegionalResult",
+    "COUNTING_SYSTEMS",
 ]
@@ -0,0 +1,316 @@
+"""
+Ballot Set Module
+
+A BallotSet holds every ballot form derived from one election's utilities
+(plurality choices, rankings, approvals and scores) and caches the tallies
+that counting rules share, such as first preferences per constituency and the
+pairwise preference matrix. It is produced once per election by
+ElectionModel.cast_ballots() and can be counted under any number of systems.
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+# Maximum score on a score (range) ballot
+SCORE_MAX = 5
+
+
+class BallotSet:
+    """
+    All ballot forms for one election, derived from the same utilities.
+
+    Only counted ballots (voters who turned out and cast a valid vote) enter
+    the tallies. Every derived form is computed lazily on first use and
+    cached, so rules that need the same intermediate share the work.
+
+    Rankings put the voter's plurality choice first and order the remaining
+    parties by utility, so first-preference tallies agree with the plurality
+    ballots. Parties excluded from a voter's constituency (reserved seats) are
+    ranked last, never approved and score 0. Rankings are compressed to unique
+    (constituency, ranking) rows with counts, which keeps ranked counting
+    independent of electorate size.
+
+    Attributes:
+        utilities: (n_voters, n_parties) utilities of the whole electorate
+        votes: (n_voters,) plurality choices of the whole electorate
+        will_vote: (n_voters,) turnout decisions
+        counted: (n_voters,) mask of ballots that enter the tallies
+        welfare: (n_constituencies, n_parties) utility sums for VSE
+        constituencies: (n_counted,) constituency of each counted ballot
+        plurality: (n_counted,) party chosen on each counted ballot
+        list_votes: (n_counted,) second (party-list) vote on each counted
+            ballot under MMP; equal to plurality for straight tickets
+        runoff_votes: (n_counted,) sampled second-round vote of each counted
+            ballot under TRS (-1 outside second rounds), or None
+        runoff_qualifiers: (n_constituencies, n_parties) second-round
+            candidates the runoff votes were sampled for, or None
+    """
+
+    def __init__(
+        self,
+        utilities: np.ndarray,
+        votes: np.ndarray,
+        will_vote: np.ndarray,
+        constituencies: np.ndarray,
+        n_constituencies: int,
+        valid: np.ndarray | None = None,
+        welfare: np.ndarray | None = None,
+        eligible: np.ndarray | None = None,
+        list_votes: np.ndarray | None = None,
+    ):
+        """
+        Args:
+            utilities: (n_voters, n_parties) utility matrix
+            votes: (n_voters,) plurality choices
+            will_vote: (n_voters,) boolean turnout decisions
+            constituencies: (n_voters,) constituency index per voter
+            n_constituencies: Number of constituencies
+            valid: Optional (n_voters,) mask of valid ballots (e.g. reserved seats)
+            welfare: Optional (n_constituencies, n_parties) welfare sums, if
+                already accumulated while sampling votes
+            eligible: Optional (n_constituencies, n_parties) mask of parties
+                each constituency allows (see ElectionModel._eligibility)
+            list_votes: Optional (n_voters,) second (party-list) votes for MMP;
+                defaults to the plurality choices (no split tickets)
+        """
+        self.utilities = utilities
+        self.votes = votes
+        self.will_vote = will_vote
+        self.n_constituencies = n_constituencies
+        self.n_parties = utilities.shape[1]
+
+        self.counted = will_vote if valid is None else will_vote & valid
+        self.constituencies = constituencies[self.counted]
+        self.plurality = votes[self.counted]
+        self.list_votes = self.plurality if list_votes is None else list_votes[self.counted]
+        self.runoff_votes: np.ndarray | None = None
+        self.runoff_qualifiers: np.ndarray | None = None
+
+        self._voter_constituencies = constituencies
+        self._welfare = welfare
+        self._eligible = eligible
+
+    @property
+    def turnout(self) -> float:
+        """Fraction of the electorate that turned out."""
+        return float(self.will_vote.sum() / len(self.will_vote))
+
+    @property
+    def welfare(self) -> np.ndarray:
+        """
+        (n_constituencies, n_parties) total utility of each party per constituency.
+
+        Covers the whole electorate, not only counted ballots.
+        """
+        if self._welfare is None:
+            from electoral_sim.analysis.vse import constituency_welfare
+
+            self._welfare = constituency_welfare(
+                self.utilities, self._voter_constituencies, self.n_constituencies
+            )
+        return self._welfare
+
+    # =========================================================================
+    # PLURALITY TALLIES
+    # =========================================================================
+
+    @cached_property
+    def first_preferences(self) -> np.ndarray:
+        """(n_parties,) national first-preference (plurality) vote counts."""
+        return np.bincount(self.plurality, minlength=self.n_parties).astype(np.int64)
+
+    @cached_property
+    def constituency_tallies(self) -> np.ndarray:
+        """(n_constituencies, n_parties) first-preference counts per constituency."""
+        return self._tally_by_constituency(self.constituencies, self.plurality)
+
+    @cached_property
+    def list_preferences(self) -> np.ndarray:
+        """(n_parties,) national second (party-list) vote counts."""
+        if self.list_votes is self.plurality:
+            return self.first_preferences
+        return np.bincount(self.list_votes, minlength=self.n_parties).astype(np.int64)
+
+    @cached_property
+    def registered(self) -> np.ndarray:
+        """(n_constituencies,) registered voters (the whole electorate) per constituency."""
+        return np.bincount(self._voter_constituencies, minlength=self.n_constituencies)
+
+    def set_runoff(self, qualifiers: np.ndarray, votes: np.ndarray) -> None:
+        """
+        Attach sampled second-round ballots (two-round system).
+
+        Args:
+            qualifiers: (n_constituencies, n_parties) second-round candidates
+            votes: (n_counted,) second-round votes, -1 outside second rounds
+        """
+        self.runoff_qualifiers = qualifiers
+        self.runoff_votes = votes
+        self.__dict__.pop("runoff_tallies", None)
+
+    @cached_property
+    def runoff_tallies(self) -> np.ndarray:
+        """(n_constituencies, n_parties) second-round votes per constituency."""
+        voted = self.runoff_votes >= 0
+        return self._tally_by_constituency(self.constituencies[voted], self.runoff_votes[voted])
+
+    @property
+    def split_ticket_share(self) -> float:
+        """Fraction of counted ballots whose list vote differs from the district vote."""
+        if not len(self.plurality):
+            return 0.0
+        return float(np.mean(self.list_votes != self.plurality))
+
+    # =========================================================================
+    # RANKINGS
+    # =========================================================================
+
+    @cached_property
+    def rankings(self) -> np.ndarray:
+        """
+        (n_counted, n_parties) party indices in preference order.
+
+        Column 0 is the plurality choice; the rest follow descending utility.
+        """
+        u = self._counted_utilities(-np.inf)
+        u[np.arange(len(u)), self.plurality] = np.inf
+        dtype = np.int8 if self.n_parties < 128 else np.int16
+        return np.argsort(-u, axis=1, kind="stable").astype(dtype)
+
+    @cached_property
+    def compressed_rankings(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Unique (constituency, ranking) rows with their ballot counts.
+
+        Returns:
+            (constituency, rankings, counts) with shapes (U,), (U, n_parties), (U,),
+            sorted by constituency
+        """
+        P = self.n_parties
+        rankings = self.rankings
+
+        if self.n_constituencies * P**P < 2**62:
+            # Encode each row as one integer: constituency, then ranking digits in base P
+            key = self.constituencies.astype(np.int64) * P**P
+            for k in range(P):
+                key += rankings[:, k].astype(np.int64) * P ** (P - 1 - k)
+            _, first, counts = np.unique(key, return_index=True, return_counts=True)
+            return self.constituencies[first], rankings[first], counts
+        else:
+            rows = np.column_stack([self.constituencies, rankings])
+            unique_rows, counts = np.unique(rows, axis=0, return_counts=True)
+            return unique_rows[:, 0], unique_rows[:, 1:], counts
+
+    @cached_property
+    def compressed_positions(self) -> np.ndarray:
+        """(U, n_parties) rank position of each party on each unique ranking (0 = first)."""
+        _, rankings, _ = self.compressed_rankings
+        return np.argsort(rankings, axis=1)
+
+    @cached_property
+    def pairwise_by_constituency(self) -> np.ndarray:
+        """
+        (n_constituencies, n_parties, n_parties) pairwise preference counts.
+
+        Entry [c, i, j] is the number of ballots in constituency c ranking i above j.
+        """
+        cid, _, counts = self.compressed_rankings
+        pos = self.compressed_positions
+        C, P = self.n_constituencies, self.n_parties
+
+        pairwise = np.zeros((C, P, P), dtype=np.int64)
+        for i in range(P):
+            for j in range(P):
+                if i != j:
+                    prefers = pos[:, i] < pos[:, j]
+                    pairwise[:, i, j] = np.bincount(
+                        cid[prefers], weights=counts[prefers], minlength=C
+                    )
+        return pairwise
+
+    @cached_property
+    def pairwise(self) -> np.ndarray:
+        """(n_parties, n_parties) national pairwise preference counts."""
+        return self.pairwise_by_constituency.sum(axis=0)
+
+    # =========================================================================
+    # APPROVALS AND SCORES
+    # =========================================================================
+
+    @cached_property
+    def approvals(self) -> np.ndarray:
+        """
+        (n_counted, n_parties) approval ballots.
+
+        Voters approve every eligible party at or above their mean utility over
+        eligible parties, and always approve their plurality choice.
+        """
+        if self._eligible is None:
+            u = self.utilities[self.counted]
+            approvals = u >= u.mean(axis=1, keepdims=True)
+        else:
+            u = self._counted_utilities(0.0)
+            eligible = self._eligible[self.constituencies]
+            mean = u.sum(axis=1, keepdims=True) / eligible.sum(axis=1, keepdims=True)
+            approvals = (u >= mean) & eligible
+        approvals[np.arange(len(u)), self.plurality] = True
+        return approvals
+
+    @cached_property
+    def approval_tallies(self) -> np.ndarray:
+        """(n_constituencies, n_parties) approval counts per constituency."""
+        return self._weighted_tally(self.approvals)
+
+    @cached_property
+    def scores(self) -> np.ndarray:
+        """
+        (n_counted, n_parties) score ballots from 0 to SCORE_MAX.
+
+        Each voter's utilities are rescaled so their favourite scores SCORE_MAX
+        and their least preferred eligible party scores 0.
+        """
+        if self._eligible is None:
+            u = self.utilities[self.counted]
+            lo = u.min(axis=1, keepdims=True)
+            hi = u.max(axis=1, keepdims=True)
+        else:
+            lo = self._counted_utilities(np.inf).min(axis=1, keepdims=True)
+            u = self._counted_utilities(-np.inf)
+            hi = u.max(axis=1, keepdims=True)
+            u = np.maximum(u, lo)  # Ineligible parties score 0
+        span = hi - lo
+        span[span == 0] = 1.0
+        return np.rint(SCORE_MAX * (u - lo) / span).astype(np.int8)
+
+    @cached_property
+    def score_tallies(self) -> np.ndarray:
+        """(n_constituencies, n_parties) total scores per constituency."""
+        return self._weighted_tally(self.scores)
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _counted_utilities(self, fill: float) -> np.ndarray:
+        """Utilities of counted ballots (a copy), with ineligible parties set to fill."""
+        u = self.utilities[self.counted]  # Boolean indexing copies
+        if self._eligible is not None:
+            u[~self._eligible[self.constituencies]] = fill
+        return u
+
+    def _tally_by_constituency(self, constituencies: np.ndarray, choices: np.ndarray) -> np.ndarray:
+        """Count (constituency, party) pairs into a dense matrix."""
+        C, P = self.n_constituencies, self.n_parties
+        flat = constituencies.astype(np.int64) * P + choices
+        return np.bincount(flat, minlength=C * P).reshape(C, P).astype(np.int64)
+
+    def _weighted_tally(self, ballots: np.ndarray) -> np.ndarray:
+        """Sum per-party ballot values (approvals, scores) by constituency."""
+        C, P = self.n_constituencies, self.n_parties
+        tallies = np.zeros((C, P), dtype=np.int64)
+        for p in range(P):
+            tallies[:, p] = np.bincount(
+                self.constituencies, weights=ballots[:, p], minlength=C
+            ).astype(np.int64)
+        return tallies
@@ -80,9 +80,9 @@ Examples:
     run_parser.add_argument(
         "--system",
         "-s",
-        choices=["FPTP", "PR", "IRV", "STV"],
+        choices=["FPTP", "PR", "IRV", "STV", "MMP", "TRS"],
         default="FPTP",
-        help="Electoral system: FPTP (first-past-the-post), PR (proportional representation), IRV (instant runoff), STV (single transferable vote) (default: FPTP)",
+        help="Electoral system: FPTP (first-past-the-post), PR (proportional representation), IRV (instant runoff), STV (single transferable vote), MMP (mixed-member proportional), TRS (two-round) (default: FPTP)",
     )
     run_parser.add_argument(
         "--allocation",
@@ -227,10 +227,11 @@ def list_presets():
         "india": "543 constituencies, FPTP, 17 parties (Lok Sabha)",
         "usa": "435 districts, FPTP, 2 parties (House of Representatives)",
         "uk": "650 constituencies, FPTP, 5+ parties (House of Commons)",
-        "germany": "299 districts, MMP (PR), 5% threshold, 6 parties (Bundestag)",
+        "germany": "299 districts, MMP, 5% threshold, 6 parties (Bundestag)",
         "france": "577 constituencies, Two-round system, 5 parties (National Assembly)",
         "japan": "289 constituencies, Mixed system, 2% threshold (House of Representatives)",
         "brazil": "513 seats, Open-list PR, 8 parties (Chamber of Deputies)",
+        "brazil_presidential": "1 national constituency, Two-round system, 5 parties (Presidency)",
         "australia_house": "151 electorates, IRV (preferential voting), 5 parties",
         "australia_senate": "76 seats, STV (proportional), 5 parties",
         "south_africa": "400 seats, Closed-list PR, 1.5% threshold, 8 parties",
@@ -47,10 +47,13 @@ class Config:
         n_voters: Total number of voter agents
         n_constituencies: Number of electoral districts
         parties: List of PartyConfig or dicts
-        electoral_system: 'FPTP' or 'PR'
+        electoral_system: 'FPTP', 'PR', 'MMP' or 'TRS'
         allocation_method: 'dhondt' or 'sainte_lague'
         threshold: Electoral threshold (0-1)
         temperature: MNL temperature (lower = more deterministic)
+        list_temperature: MNL temperature of MMP second votes (None = temperature)
+        runoff_qualify: TRS share of registered voters reaching the second round
+            besides the top two (None = top two only)
         seed: Random seed for reproducibility
     """
 
@@ -62,12 +65,14 @@ class Config:
     parties: list[PartyConfig | dict] = field(default_factory=list)
 
     # Electoral system
-    electoral_system: Literal["FPTP", "PR"] = "FPTP"
+    electoral_system: Literal["FPTP", "PR", "MMP", "TRS"] = "FPTP"
     allocation_method: Literal["dhondt", "sainte_lague", "hare", "droop"] = "dhondt"
     threshold: float = 0.0
 
     # Voting behavior
     temperature: float = 0.5
+    list_temperature: float | None = None
+    runoff_qualify: float | None = None
 
     # Simulation
     seed: int | None = None
@@ -95,7 +100,7 @@ class Config:
 
 # Re-export country configs from presets for backward compatibility
 from electoral_sim.presets.australia.config import australia_house_config, australia_senate_config
-from electoral_sim.presets.brazil.config import brazil_config
+from electoral_sim.presets.brazil.config import brazil_config, brazil_presidential_config
 from electoral_sim.presets.france.config import france_config
 from electoral_sim.presets.germany.config import germany_config
 from electoral_sim.presets.japan.config import japan_config
@@ -138,6 +143,7 @@ PRESETS = {
     "australia_senate": australia_senate_config,
     "south_africa": south_africa_config,
     "brazil": brazil_config,
+    "brazil_presidential": brazil_presidential_config,
     "france": france_config,
     "japan": japan_config,
 }
@@ -1,13 +1,15 @@
 """
 Vote Counting Module
 
-Contains functions for counting votes under different electoral systems.
+Contains functions for counting votes under different electoral systems,
+and a dispatcher that counts a BallotSet under any supported rule.
 """
 
 from typing import Literal
 
 import numpy as np
 
+from electoral_sim.core.ballots import BallotSet
 from electoral_sim.engine.numba_accel import fptp_count_fast
 
 
@@ -76,3 +78,364 @@ def count_pr(
         "vote_counts": vote_counts,
         "n_seats": n_seats,
     }
+
+
+# =============================================================================
+# BALLOT SET COUNTING
+# =============================================================================
+
+
+def _seats_from_winners(winners: np.ndarray, n_parties: int) -> np.ndarray:
+    """Seats per party from per-constituency winners (-1 = no winner)."""
+    return np.bincount(winners[winners >= 0], minlength=n_parties).astype(np.int64)
+
+
+def _plurality_winners(tallies: np.ndarray) -> np.ndarray:
+    """Highest tally per constituency; -1 where nobody voted."""
+    winners = tallies.argmax(axis=1)
+    winners[tallies.sum(axis=1) == 0] = -1
+    return winners
+
+
+def constituency_winners(tallies: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Winner, runner-up and victory margin of every constituency at once.
+
+    Args:
+        tallies: (n_constituencies, n_parties) vote counts
+
+    Returns:
+        (winner, runner_up, margin); winner and runner_up are -1 where
+        nobody voted
+    """
+    order = np.argsort(-tallies, axis=1, kind="stable")[:, :2]
+    top = np.take_along_axis(tallies, order, axis=1)
+    empty = tallies.sum(axis=1) == 0
+    winner = np.where(empty, -1, order[:, 0])
+    if tallies.shape[1] < 2:
+        return winner, np.full_like(winner, -1), top[:, 0]
+    runner_up = np.where(empty, -1, order[:, 1])
+    return winner, runner_up, top[:, 0] - top[:, 1]
+
+
+def _fptp_winners(ballots: BallotSet) -> np.ndarray:
+    return _plurality_winners(ballots.constituency_tallies)
+
+
+def runoff_qualifiers(
+    tallies: np.ndarray,
+    registered: np.ndarray | None = None,
+    qualify_share: float | None = None,
+) -> np.ndarray:
+    """
+    Candidates in each constituency's second round under the two-round system.
+
+    A first-round majority wins outright; elsewhere the top two qualify, plus
+    any candidate whose votes reach qualify_share of the registered voters
+    (France: 12.5%).
+
+    Args:
+        tallies: (n_constituencies, n_parties) first-round votes
+        registered: (n_constituencies,) registered voters (needed with qualify_share)
+        qualify_share: Share of registered voters that qualifies (None = top two only)
+
+    Returns:
+        (n_constituencies, n_parties) mask; rows are all False where no
+        second round is held
+    """
+    totals = tallies.sum(axis=1)
+    runoff = (2 * tallies.max(axis=1, initial=0) <= totals) & (totals > 0)
+
+    qualifiers = np.zeros(tallies.shape, dtype=bool)
+    order = np.argsort(-tallies, axis=1, kind="stable")[:, :2]
+    np.put_along_axis(qualifiers, order, True, axis=1)
+    if qualify_share is not None:
+        qualifiers |= tallies >= qualify_share * np.asarray(registered)[:, np.newaxis]
+    qualifiers &= runoff[:, np.newaxis]
+    return qualifiers
+
+
+def _trs_qualifiers(ballots: BallotSet, runoff_qualify: float | None = None) -> np.ndarray:
+    """Second-round candidates: those the ballots were sampled for, if any."""
+    if ballots.runoff_votes is not None:
+        return ballots.runoff_qualifiers
+    return runoff_qualifiers(ballots.constituency_tallies, ballots.registered, runoff_qualify)
+
+
+def _trs_winners(ballots: BallotSet, runoff_qualify: float | None = None) -> np.ndarray:
+    """
+    Two-round system: a first-round majority wins outright, otherwise the
+    qualifiers (see runoff_qualifiers) meet in a second round.
+
+    Uses the sampled second-round ballots when the BallotSet has them (see
+    ElectionModel.cast_ballots); otherwise each ballot goes to its
+    highest-ranked qualifier. Second-round ties go to the first-round leader.
+    """
+    tallies = ballots.constituency_tallies
+    winners = _plurality_winners(tallies)
+    qualifiers = _trs_qualifiers(ballots, runoff_qualify)
+    runoff = qualifiers.any(axis=1)
+    if not runoff.any():
+        return winners
+
+    if ballots.runoff_votes is not None:
+        second = ballots.runoff_tallies
+    else:
+        cid, rankings, counts = ballots.compressed_rankings
+        rows = np.arange(len(cid))
+        top = rankings[rows, qualifiers[cid[:, None], rankings].argmax(axis=1)].astype(np.int64)
+        C, P = ballots.n_constituencies, ballots.n_parties
+        second = np.bincount(cid * P + top, weights=counts, minlength=C * P).reshape(C, P)
+
+    # First-round votes as a fractional tie-break
+    score = second + tallies / (tallies.sum(axis=1, keepdims=True) + 1)
+    second_round = np.where(qualifiers, score, -1.0).argmax(axis=1)
+    winners[runoff] = second_round[runoff]
+    return winners
+
+
+def _irv_winners(ballots: BallotSet) -> np.ndarray:
+    """
+    Instant runoff, run for all constituencies at once on compressed rankings.
+
+    Each round, every unique ranking is credited to its highest-ranked
+    continuing party; constituencies without a majority eliminate their
+    lowest continuing party (lowest index on ties).
+    """
+    cid, rankings, counts = ballots.compressed_rankings
+    C, P = ballots.n_constituencies, ballots.n_parties
+    rows = np.arange(len(cid))
+
+    winners = np.full(C, -1, dtype=np.int64)
+    decided = ballots.constituency_tallies.sum(axis=1) == 0
+    eliminated = np.zeros((C, P), dtype=bool)
+
+    for _ in range(P):
+        continuing = ~eliminated[cid[:, None], rankings]
+        top = rankings[rows, continuing.argmax(axis=1)].astype(np.int64)
+        tally = np.bincount(cid * P + top, weights=counts, minlength=C * P).reshape(C, P)
+
+        leader = tally.argmax(axis=1)
+        done = ~decided & (
+            (2 * tally.max(axis=1) > tally.sum(axis=1)) | ((~eliminated).sum(axis=1) == 1)
+        )
+        winners[done] = leader[done]
+        decided |= done
+        if decided.all():
+            break
+
+        loser = np.where(eliminated, np.inf, tally).argmin(axis=1)
+        open_ = np.flatnonzero(~decided)
+        eliminated[open_, loser[open_]] = True
+
+    return winners
+
+
+def _stv_elected(ballots: BallotSet, district_magnitude: int = 3) -> np.ndarray:
+    """
+    Single transferable vote in each constituency with a Droop quota and
+    fractional (Gregory) surplus transfers, on compressed rankings.
+
+    Returns:
+        (n_constituencies, district_magnitude) elected parties, -1 padded
+    """
+    cid, rankings, counts = ballots.compressed_rankings
+    C, P = ballots.n_constituencies, ballots.n_parties
+    m = min(district_magnitude, P)
+    elected = np.full((C, m), -1, dtype=np.int64)
+
+    bounds = np.searchsorted(cid, np.arange(C + 1))
+    for c in range(C):
+        lo, hi = bounds[c], bounds[c + 1]
+        if lo == hi:
+            continue
+        R = rankings[lo:hi]
+        weights = counts[lo:hi].astype(np.float64)
+        rows = np.arange(hi - lo)
+        quota = np.floor(weights.sum() / (m + 1)) + 1
+
+        excluded = np.zeros(P, dtype=bool)
+        n_elected = 0
+        while n_elected < m:
+            hopeful = ~excluded
+            top = R[rows, hopeful[R].argmax(axis=1)].astype(np.int64)
+            tally = np.bincount(top, weights=weights, minlength=P)
+
+            if hopeful.sum() <= m - n_elected:
+                # Remaining seats go to the remaining parties
+                for p in np.argsort(-np.where(hopeful, tally, -1.0), kind="stable"):
+                    if hopeful[p] and n_elected < m:
+                        elected[c, n_elected] = p
+                        n_elected += 1
+                break
+
+            best = int(np.where(hopeful, tally, -1.0).argmax())
+            if tally[best] >= quota:
+                elected[c, n_elected] = best
+                n_elected += 1
+                excluded[best] = True
+                weights[top == best] *= (tally[best] - quota) / tally[best]
+            else:
+                excluded[int(np.where(hopeful, tally, np.inf).argmin())] = True
+
+    return elected
+
+
+def _approval_winners(ballots: BallotSet) -> np.ndarray:
+    return _plurality_winners(ballots.approval_tallies)
+
+
+def _score_winners(ballots: BallotSet) -> np.ndarray:
+    winners = ballots.score_tallies.argmax(axis=1)
+    winners[ballots.constituency_tallies.sum(axis=1) == 0] = -1
+    return winners
+
+
+def _copeland_winners(ballots: BallotSet) -> np.ndarray:
+    """
+    Copeland: most pairwise wins (ties count half), first preferences break ties.
+    """
+    pw = ballots.pairwise_by_constituency
+    pw_t = pw.transpose(0, 2, 1)
+    copeland = (pw > pw_t).sum(axis=2) + 0.5 * ((pw == pw_t).sum(axis=2) - 1)
+
+    tallies = ballots.constituency_tallies
+    share = tallies / np.maximum(tallies.sum(axis=1, keepdims=True), 1)
+    winners = (copeland + 0.1 * share).argmax(axis=1)
+    winners[tallies.sum(axis=1) == 0] = -1
+    return winners
+
+
+def _minimax_winners(ballots: BallotSet) -> np.ndarray:
+    """
+    Minimax (Simpson-Kramer): smallest worst pairwise defeat. Elects the
+    Condorcet winner whenever one exists.
+    """
+    pw = ballots.pairwise_by_constituency
+    margins = pw.transpose(0, 2, 1) - pw  # [c, i, j] = votes for j over i minus i over j
+    winners = margins.max(axis=2).argmin(axis=1)
+    winners[ballots.constituency_tallies.sum(axis=1) == 0] = -1
+    return winners
+
+
+def condorcet_winners(ballots: BallotSet) -> np.ndarray:
+    """
+    Condorcet winner of each constituency.
+
+    Args:
+        ballots: BallotSet to evaluate
+
+    Returns:
+        (n_constituencies,) party beating every other head-to-head, -1 if none
+    """
+    pw = ballots.pairwise_by_constituency
+    beats_all = (pw > pw.transpose(0, 2, 1)).sum(axis=2) == ballots.n_parties - 1
+    return np.where(beats_all.any(axis=1), beats_all.argmax(axis=1), -1)
+
+
+# Single-winner rules: BallotSet -> (n_constituencies,) winners
+SINGLE_WINNER_RULES = {
+    "FPTP": _fptp_winners,
+    "TRS": _trs_winners,
+    "IRV": _irv_winners,
+    "approval": _approval_winners,
+    "score": _score_winners,
+    "copeland": _copeland_winners,
+    "minimax": _minimax_winners,
+}
+
+COUNTING_SYSTEMS = (*SINGLE_WINNER_RULES, "STV", "PR", "MMP")
+
+
+def count_ballots(
+    ballots: BallotSet,
+    system: str = "FPTP",
+    allocation_method: str = "dhondt",
+    threshold: float = 0.0,
+    n_seats: int | None = None,
+    district_magnitude: int = 3,
+    basic_mandates: int = 3,
+    levelling: bool = True,
+    runoff_qualify: float | None = None,
+) -> dict:
+    """
+    Count a BallotSet under any supported electoral system.
+
+    Systems share the BallotSet's cached tallies, so counting the same
+    ballots under several rules costs little more than the first count.
+
+    Args:
+        ballots: BallotSet from ElectionModel.cast_ballots()
+        system: One of COUNTING_SYSTEMS
+        allocation_method: PR allocation method
+        threshold: PR threshold (0-1)
+        n_seats: PR seats (default: one per constituency; MMP: two per
+            constituency, i.e. as many list seats as districts)
+        district_magnitude: Seats per constituency under STV
+        basic_mandates: District seats that qualify a party for MMP list
+            seats regardless of the threshold
+        levelling: Compensate MMP overhang seats with levelling seats
+        runoff_qualify: TRS share of registered voters that qualifies for the
+            second round besides the top two (ignored when the ballots carry
+            sampled second-round votes)
+
+    Returns:
+        Dictionary with seats, first-preference vote counts and, for
+        constituency-based systems, the winners per constituency. MMP
+        counts second votes as vote_counts (first votes are in
+        district_vote_counts) and adds the mmp_allocation() breakdown.
+    """
+    n_parties = ballots.n_parties
+    results = {
+        "system": system,
+        "vote_counts": ballots.first_preferences,
+        "n_constituencies": ballots.n_constituencies,
+    }
+
+    if system == "TRS":
+        winners = _trs_winners(ballots, runoff_qualify)
+        results["winners"] = winners
+        results["seats"] = _seats_from_winners(winners, n_parties)
+        results["runoffs"] = int(_trs_qualifiers(ballots, runoff_qualify).any(axis=1).sum())
+    elif system in SINGLE_WINNER_RULES:
+        winners = SINGLE_WINNER_RULES[system](ballots)
+        results["winners"] = winners
+        results["seats"] = _seats_from_winners(winners, n_parties)
+    elif system == "STV":
+        elected = _stv_elected(ballots, district_magnitude)
+        results["elected"] = elected
+        results["seats"] = _seats_from_winners(elected.ravel(), n_parties)
+    elif system == "PR":
+        from electoral_sim.systems.allocation import allocate_seats
+
+        n_seats = ballots.n_constituencies if n_seats is None else n_seats
+        results["method"] = allocation_method
+        results["seats"] = allocate_seats(
+            ballots.first_preferences, n_seats, allocation_method, threshold
+        )
+    elif system == "MMP":
+        from electoral_sim.systems.allocation import mmp_allocation
+
+        # First votes elect districts by plurality; second votes fill the house
+        winners = _fptp_winners(ballots)
+        n_seats = 2 * ballots.n_constituencies if n_seats is None else n_seats
+        results.update(
+            mmp_allocation(
+                ballots.list_preferences,
+                _seats_from_winners(winners, n_parties),
+                n_seats,
+                allocation_method,
+                threshold,
+                basic_mandates,
+                levelling,
+            )
+        )
+        results["winners"] = winners
+        results["method"] = allocation_method
+        results["vote_counts"] = ballots.list_preferences
+        results["district_vote_counts"] = ballots.first_preferences
+        results["split_ticket_share"] = ballots.split_ticket_share
+    else:
+        raise ValueError(f"Unknown system: {system}. Use one of {list(COUNTING_SYSTEMS)}")
+
+    return results
@@ -17,10 +17,18 @@ from mesa import Model
 from electoral_sim.agents.party import PartyAgents
 from electoral_sim.agents.party_strategy import adaptive_strategy_step
 from electoral_sim.agents.voter import VoterAgents
-from electoral_sim.core.voter_generation import generate_voter_frame
+from electoral_sim.core.ballots import BallotSet
+from electoral_sim.core.counting import COUNTING_SYSTEMS, count_ballots, runoff_qualifiers
+from electoral_sim.core.voter_generation import (
+    add_issue_dimensions,
+    extra_position_columns,
+    generate_voter_frame,
+)
 from electoral_sim.engine.numba_accel import (
-    fptp_count_fast,
+    mnl_sample,
+    utility_dtype,
     vote_mnl_fast,
+    vote_mnl_welfare_fast,
 )
 from electoral_sim.events.event_manager import EventManager
 from electoral_sim.metrics.indices import effective_number_of_parties, gallagher_index
@@ -29,6 +37,10 @@ if TYPE_CHECKING:
     from electoral_sim.behavior.voter_behavior import BehaviorEngine
     from electoral_sim.dynamics.opinion_dynamics import OpinionDynamics
 
+# Metrics run_election() can compute; 'constituency_vse' needs a district system
+AVAILABLE_METRICS = ("gallagher", "enp", "vse", "constituency_vse")
+DEFAULT_METRICS = ("gallagher", "enp", "vse")
+
 # =============================================================================
 # ELECTION MODEL
 # =============================================================================
@@ -40,7 +52,8 @@ class ElectionModel(Model):
 
     Supports:
         - Multiple constituencies (default: 543 for Lok Sabha)
-        - Configurable electoral systems (FPTP, PR with D'Hondt/Sainte-Laguë)
+        - Configurable electoral systems (FPTP, PR with D'Hondt/Sainte-Laguë,
+          two-round, IRV, STV, approval, score, Condorcet methods)
         - Multinomial logit voting model
         - Opinion dynamics (placeholder)
 
@@ -77,15 +90,31 @@ class ElectionModel(Model):
     party_frame : pl.DataFrame | None
         Optional pre-built party DataFrame
     electoral_system : str
-        'FPTP' or 'PR'
+        'FPTP', 'PR', 'MMP' or any of core.counting.COUNTING_SYSTEMS
     allocation_method : str
         'dhondt' or 'sainte_lague' (for PR)
     threshold : float
         Electoral threshold for PR (0-1)
     temperature : float
         MNL temperature parameter (lower = more deterministic)
+    list_temperature : float | None
+        MNL temperature of second (party-list) votes under MMP (default:
+        temperature); a higher value means more ticket splitting
+    runoff_qualify : float | None
+        Two-round system: share of registered voters that qualifies for the
+        second round besides the top two (France: 0.125; None = top two only)
     seed : int | None
         Random seed for reproducibility
+    metrics : tuple[str, ...] | None
+        Metrics computed per election, from AVAILABLE_METRICS
+        (default: gallagher, enp, vse); gallagher and enp are always reported
+    precision : str | None
+        Utility matrix precision: 'float32' or 'float64' for validation
+        (default: the behavior engine's precision, float32 unless set)
+    n_dims : int
+        Number of issue dimensions (parties take position_2, position_3, ...)
+    issue_salience : bool
+        Give each voter random issue salience weights
     """
 
     def __init__(
@@ -99,6 +128,8 @@ class ElectionModel(Model):
         allocation_method: str = "dhondt",
         threshold: float = 0.0,
         temperature: float = 0.5,
+        list_temperature: float | None = None,
+        runoff_qualify: float | None = None,
         seed: int | None = None,
         behavior_engine: BehaviorEngine | None = None,
         opinion_dynamics: OpinionDynamics | None = None,
@@ -115,6 +146,10 @@ class ElectionModel(Model):
             ConstituencyManager
         ] = None,  # TECHNICAL: Real data integration
         use_gpu: bool = False,  # P4: GPU acceleration (CuPy)
+        metrics: tuple[str, ...] | None = None,  # Metrics computed per election
+        precision: str | None = None,  # Utility matrix precision (None = engine's)
+        n_dims: int = 2,  # Issue space dimensions
+        issue_salience: bool = False,  # Per-voter issue weights
     ):
         super().__init__()
 
@@ -136,9 +171,18 @@ class ElectionModel(Model):
         self.allocation_method = allocation_method
         self.threshold = threshold
         self.temperature = temperature
+        self.list_temperature = list_temperature
+        self.runoff_qualify = runoff_qualify
         self.include_nota = include_nota
         self.constituency_constraints = constituency_constraints or {}
+        self._eligibility_cache: tuple | None = None  # (constraints key, compiled mask)
         self.constituency_manager = constituency_manager
+        self.metrics = self._check_metrics(DEFAULT_METRICS if metrics is None else metrics)
+        if precision is not None:
+            utility_dtype(precision)
+        self.precision = precision
+        self.n_dims = n_dims
+        self.issue_salience = issue_salience
 
         # Behavior & Dynamics
         from electoral_sim.behavior.voter_behavior import (
@@ -235,6 +279,8 @@ class ElectionModel(Model):
             allocation_method=config.allocation_method,
             threshold=config.threshold,
             temperature=config.temperature,
+            list_temperature=config.list_temperature,
+            runoff_qualify=config.runoff_qualify,
             seed=config.seed,
         )
 
@@ -271,7 +317,7 @@ class ElectionModel(Model):
         Set electoral system. Chainable.
 
         Args:
-            system: 'FPTP' or 'PR'
+            system: 'FPTP', 'PR' or any of core.counting.COUNTING_SYSTEMS
 
         Returns:
             self for chaining
@@ -324,7 +370,7 @@ class ElectionModel(Model):
             {
                 "step": self.time,
                 "n_voters": len(self.voters),
-                "mean_turnout": float(self.voters.df["turnout_prob"].mean()),
+                "mean_turnout": float(self.voters.get_turnout_prob().mean(dtype=np.float64)),
             }
         )
 
@@ -341,15 +387,20 @@ class ElectionModel(Model):
             - Behavioral attributes: political knowledge, misinformation susceptibility, etc.
             - Turnout probability
         """
-        return generate_voter_frame(n_voters, self.n_constituencies, self.rng)
+        df = generate_voter_frame(n_voters, self.n_constituencies, self.rng)
+        if self.n_dims != 2 or self.issue_salience:
+            df = add_issue_dimensions(df, self.n_dims, self.rng, salience=self.issue_salience)
+        return df
 
     def _generate_party_frame(self, parties: list[dict]) -> pl.DataFrame:
         """Generate party DataFrame from configuration, optionally adding NOTA."""
+        extra_dims = extra_position_columns(parties)
         party_data = [
             {
                 "name": p.get("name", f"Party {i}"),
                 "position_x": float(p.get("position_x", 0.0)),
                 "position_y": float(p.get("position_y", 0.0)),
+                **{c: float(p.get(c, 0.0)) for c in extra_dims},
                 "valence": float(p.get("valence", 50.0)),
                 "incumbent": bool(p.get("incumbent", False)),
                 "is_nota": False,
@@ -363,6 +414,7 @@ class ElectionModel(Model):
                     "name": "NOTA",
                     "position_x": 0.0,
                     "position_y": 0.0,
+                    **{c: 0.0 for c in extra_dims},
                     "valence": 0.0,  # Negative valence or handled separately?
                     "incumbent": False,
                     "is_nota": True,
@@ -375,6 +427,7 @@ class ElectionModel(Model):
                 "name": [p["name"] for p in party_data],
                 "position_x": [p["position_x"] for p in party_data],
                 "position_y": [p["position_y"] for p in party_data],
+                **{c: [p[c] for p in party_data] for c in extra_dims},
                 "valence": [p["valence"] for p in party_data],
                 "incumbent": [p["incumbent"] for p in party_data],
                 "is_nota": [p["is_nota"] for p in party_data],
@@ -389,18 +442,22 @@ class ElectionModel(Model):
 
         Applies anti-incumbency penalty if configured.
         """
+        # Models declare the agent columns they read; fetch exactly those, as
+        # cached NumPy views, instead of handing every model the DataFrames
+        plan = self.behavior_engine.compile()
         voter_data = {
             "n_voters": len(self.voters),
-            "positions": self.voters.get_positions(),  # Need to add this to VoterAgents
+            "positions": self.voters.get_positions(),  # (n_voters, n_dims)
+            "salience": self.voters.get_salience(),
             "ideology_x": self.voters.get_ideology_x(),
             "ideology_y": self.voters.get_ideology_y(),
-            "df": self.voters.df,
+            **self.voters.get_columns(plan.voter_columns),
         }
 
         # Apply anti-incumbency penalty to incumbent party valence
         valence = self.parties.get_valence().copy()
-        if "incumbent" in self.parties.df.columns:
-            incumbent_mask = self.parties.df["incumbent"].to_numpy()
+        if "incumbent" in self.parties.columns:
+            incumbent_mask = self.parties.get_column("incumbent")
             # Anti-incumbency: negative value = penalty to incumbents
             if self.anti_incumbency != 0.0:
                 valence[incumbent_mask] += self.anti_incumbency
@@ -412,10 +469,7 @@ class ElectionModel(Model):
         effective_growth = self.economic_growth
         if self.event_manager:
             # Valence modifiers (e.g. Scanal penalties)
-            valence_modifiers = self.event_manager.get_valence_modifiers()
-            for pid, mod in valence_modifiers.items():
-                if pid < len(valence):
-                    valence[pid] += mod
+            valence += self.event_manager.get_valence_modifiers(len(valence))
 
             # Economic modifiers (e.g. Shocks)
             eco_mod = self.event_manager.get_economic_modifier()
@@ -423,36 +477,97 @@ class ElectionModel(Model):
 
         party_data = {
             "n_parties": len(self.parties),
-            "positions": self.parties.get_positions(),
+            "positions": self.parties.get_positions(n_dims=voter_data["positions"].shape[1]),
             "valence": valence,
             "incumbents": (
-                self.parties.df["incumbent"].to_numpy()
-                if "incumbent" in self.parties.df.columns
+                self.parties.get_column("incumbent")
+                if "incumbent" in self.parties.columns
                 else np.zeros(len(self.parties), dtype=bool)
             ),
-            "df": self.parties.df,
             "viability": kwargs.get("viability"),  # P4: Support for strategic voting inputs
+            **self.parties.get_columns(plan.party_columns),
         }
 
         # Pass economic growth to behavior engine for retrospective voting
         return self.behavior_engine.compute_all(
-            voter_data, party_data, growth=effective_growth, use_gpu=self.use_gpu, **kwargs
+            voter_data,
+            party_data,
+            growth=effective_growth,
+            use_gpu=self.use_gpu,
+            precision=self.precision or self.behavior_engine.precision,
+            **kwargs,
         )
 
-    def _vote_mnl(self, utilities: np.ndarray) -> np.ndarray:
+    def _vote_mnl(self, utilities: np.ndarray, random_vals: np.ndarray | None = None) -> np.ndarray:
         """
         Multinomial logit voting: P(j) = exp(U_j/τ) / Σexp(U_k/τ)
 
-        Uses Numba acceleration when available (~10x faster).
+        Uses Numba acceleration when available (~10x faster). Parties a
+        voter's constituency excludes (reserved seats) get probability 0.
+        random_vals optionally supplies the uniform draws.
 
         Returns array of vote choices (party indices).
         """
+        constituencies = self.voters.get_constituencies()
+        eligible = self._eligibility()
+        if self.use_gpu:
+            from electoral_sim.engine.gpu_accel import mnl_sample_gpu
+
+            if eligible is not None:
+                utilities = np.where(eligible[constituencies], utilities, -np.inf)
+            return mnl_sample_gpu(utilities, self.temperature, random_vals)
+
+        return vote_mnl_fast(
+            utilities, self.temperature, self.rng, constituencies, eligible, random_vals
+        )
+
+    def _vote_list(self, utilities: np.ndarray, random_vals: np.ndarray) -> np.ndarray:
+        """
+        Second (party-list) votes under MMP, from the first votes' utilities and draws.
+
+        Reusing each voter's uniform draw couples the two ballots: with the
+        same temperature they coincide, and a different list_temperature
+        splits the tickets of voters whose choice it moves. Party lists are
+        not subject to reserved-seat constraints.
+        """
+        temperature = self.temperature if self.list_temperature is None else self.list_temperature
         if self.use_gpu:
             from electoral_sim.engine.gpu_accel import mnl_sample_gpu
 
-            return mnl_sample_gpu(utilities, self.temperature)
+            return mnl_sample_gpu(utilities, temperature, random_vals)
+
+        return mnl_sample(utilities, temperature, random_vals)
 
-        return vote_mnl_fast(utilities, self.temperature, self.rng)
+    def _eligibility(self) -> np.ndarray | None:
+        """
+        (n_constituencies, n_parties) mask of parties each constituency allows.
+
+        Compiled from constituency_constraints and cached until the
+        constraints or party names change. None when there are no constraints.
+        """
+        if not self.constituency_constraints:
+            return None
+        names = tuple(self.parties.get_names())
+        key = (
+            names,
+            self.n_constituencies,
+            tuple((cid, tuple(allowed)) for cid, allowed in self.constituency_constraints.items()),
+        )
+        if self._eligibility_cache is not None and self._eligibility_cache[0] == key:
+            return self._eligibility_cache[1]
+
+        eligible = np.ones((self.n_constituencies, len(names)), dtype=bool)
+        for cid, allowed in self.constituency_constraints.items():
+            if not 0 <= cid < self.n_constituencies:
+                raise ValueError(
+                    f"Constrained constituency {cid} is out of range "
+                    f"(0 to {self.n_constituencies - 1})"
+                )
+            eligible[cid] = np.isin(names, list(allowed))
+            if not eligible[cid].any():
+                raise ValueError(f"No party allowed in constituency {cid} exists")
+        self._eligibility_cache = (key, eligible)
+        return eligible
 
     def _decide_turnout(self, utilities: np.ndarray | None = None) -> np.ndarray:
         """
@@ -469,13 +584,25 @@ class ElectionModel(Model):
         Returns:
             Boolean array of who votes
         """
-        n_voters = len(self.voters)
-        turnout_prob = self.voters.df["turnout_prob"].to_numpy()
+        # Stochastic turnout decision
+        random_vals = self.rng.random(len(self.voters))
+        return self._turnout_probability(utilities) > random_vals
+
+    def _turnout_probability(self, utilities: np.ndarray | None = None) -> np.ndarray:
+        """Per-voter turnout probability after alienation and indifference penalties."""
+        turnout_prob = self.voters.get_turnout_prob()
 
         # Apply alienation and indifference penalties if utilities provided
         if utilities is not None:
+            # Voters only weigh the parties their constituency lets them vote for
+            max_utility, min_utility = utilities.max(axis=1), utilities.min(axis=1)
+            eligible = self._eligibility()
+            if eligible is not None:
+                allowed = eligible[self.voters.get_constituencies()]
+                max_utility = np.where(allowed, utilities, -np.inf).max(axis=1)
+                min_utility = np.where(allowed, utilities, np.inf).min(axis=1)
+
             # Alienation: abstain if best option is still unacceptable
-            max_utility = utilities.max(axis=1)
             alienation_penalty = np.where(
                 max_utility < self.alienation_threshold,
                 0.3,  # 30% reduction in turnout probability
@@ -483,7 +610,7 @@ class ElectionModel(Model):
             )
 
             # Indifference: abstain if all options are too similar
-            utility_range = utilities.max(axis=1) - utilities.min(axis=1)
+            utility_range = max_utility - min_utility
             indifference_penalty = np.where(
                 utility_range < self.indifference_threshold,
                 0.2,  # 20% reduction in turnout probability
@@ -499,78 +626,166 @@ class ElectionModel(Model):
         else:
             adjusted_turnout = turnout_prob
 
-        # Stochastic turnout decision
-        random_vals = self.rng.random(n_voters)
-        return adjusted_turnout > random_vals
+        return adjusted_turnout
 
-    def run_election(self, **kwargs) -> dict:
+    def run_election(self, metrics: tuple[str, ...] | None = None, **kwargs) -> dict:
         """
         Run a single election and return results.
 
         Args:
+            metrics: Metrics to compute (default: model setting)
             **kwargs: Extra parameters passed to the behavior engine (e.g. growth=0.03)
 
         Returns:
             Dictionary with vote counts, seats, turnout, and metrics
         """
-        # Compute utilities and cast votes
+        ballots = self.cast_ballots(metrics=metrics, **kwargs)
+        results = self.count_ballots(ballots, metrics=metrics)
+
+        # Update party results in place
+        self.parties.update_results(
+            results["seats"], results["vote_counts"] / results["vote_counts"].sum()
+        )
+
+        self.election_results.append(results)
+        return results
+
+    def cast_ballots(self, metrics: tuple[str, ...] | None = None, **kwargs) -> BallotSet:
+        """
+        Sample one set of ballots and turnout decisions without counting them.
+
+        The returned ballots can be counted any number of times with
+        count_ballots(), e.g. under several electoral systems (common random
+        numbers for paired system comparisons).
+
+        When VSE is among the metrics, per-constituency welfare is accumulated
+        while sampling votes, so counting needs no second pass over utilities.
+
+        Args:
+            metrics: Metrics that will be computed (default: model setting)
+            **kwargs: Extra parameters passed to the behavior engine
+
+        Returns:
+            BallotSet with plurality, ranked, approval and score ballots
+        """
+        metrics = self.metrics if metrics is None else self._check_metrics(metrics)
+        constituencies = self.voters.get_constituencies()
+
+        # Compute utilities and cast votes; reserved-seat constraints are
+        # applied during choice, so excluded parties are never chosen
         utilities = self._compute_utilities(**kwargs)
-        votes = self._vote_mnl(utilities)
+        eligible = self._eligibility()
+        # MMP samples both ballots from the same uniform draw per voter
+        mmp = self.electoral_system == "MMP"
+        random_vals = self.rng.random(len(utilities)) if mmp else None
+        welfare = None
+        if not self.use_gpu and ("vse" in metrics or "constituency_vse" in metrics):
+            votes, welfare = vote_mnl_welfare_fast(
+                utilities,
+                self.temperature,
+                self.rng,
+                constituencies,
+                self.n_constituencies,
+                eligible,
+                random_vals,
+            )
+        else:
+            votes = self._vote_mnl(utilities, random_vals)
+
+        # MMP second votes: same utilities with their own temperature
+        list_votes = self._vote_list(utilities, random_vals) if mmp else None
 
         # Determine turnout (now with alienation/indifference)
         will_vote = self._decide_turnout(utilities)
 
-        # Filter to voters who turned out (use cached constituencies)
-        constituencies = self.voters.get_constituencies()
-        voted_constituencies = constituencies[will_vote]
-        voted_choices = votes[will_vote]
-
-        # Apply constituency-level constraints if any (Reserved seats)
-        # We need to filter options per constituency. This is easier if done during utility computation,
-        # but as a post-hoc filter for "illegal" votes (invalidating them) or redistribution.
-        # For simplicity, let's assume if a vote is cast for an excluded party in a reserved seat, it is invalidated.
-        if self.constituency_constraints:
-            party_names = self.parties.df["name"].to_list()
-            valid_mask = np.ones(len(voted_choices), dtype=bool)
-            for cid, allowed_parties in self.constituency_constraints.items():
-                c_mask = voted_constituencies == cid
-                # Find indices of parties not in allowed list
-                excluded_indices = [
-                    i for i, name in enumerate(party_names) if name not in allowed_parties
-                ]
-                # Invalidate votes for excluded parties in this constituency
-                invalid_votes = np.isin(voted_choices, excluded_indices) & c_mask
-                valid_mask &= ~invalid_votes
-
-            voted_constituencies = voted_constituencies[valid_mask]
-            voted_choices = voted_choices[valid_mask]
-
-        # Count votes
-        if self.electoral_system == "FPTP":
-            results = self._count_fptp(voted_constituencies, voted_choices)
-        else:
-            results = self._count_pr(voted_choices)
+        ballots = BallotSet(
+            utilities,
+            votes,
+            will_vote,
+            constituencies,
+            self.n_constituencies,
+            welfare=welfare,
+            eligible=eligible,
+            list_votes=list_votes,
+        )
+        if self.electoral_system == "TRS":
+            self._vote_runoff(ballots)
+        return ballots
+
+    def _vote_runoff(self, ballots: BallotSet) -> None:
+        """
+        Second round of the two-round system as a masked resample of round one.
+
+        Qualifiers come from the first-round tallies (see runoff_qualifiers).
+        Voters who turned out in a constituency holding a second round choose
+        again from their round-one utilities with every other party masked
+        out, so no utilities are recomputed and nobody else is resampled.
+        """
+        qualifiers = runoff_qualifiers(
+            ballots.constituency_tallies, ballots.registered, self.runoff_qualify
+        )
+        votes = np.full(len(ballots.plurality), -1, dtype=ballots.plurality.dtype)
+        second = qualifiers.any(axis=1)[ballots.constituencies]
+        if second.any():
+            voters = np.flatnonzero(ballots.counted)[second]
+            votes[second] = mnl_sample(
+                ballots.utilities[voters],
+                self.temperature,
+                self.rng.random(len(voters)),
+                ballots.constituencies[second],
+                qualifiers,
+            )
+        ballots.set_runoff(qualifiers, votes)
+
+    def count_ballots(
+        self,
+        ballots: BallotSet,
+        electoral_system: str | None = None,
+        allocation_method: str | None = None,
+        threshold: float | None = None,
+        metrics: tuple[str, ...] | None = None,
+        **options,
+    ) -> dict:
+        """
+        Count a set of ballots from cast_ballots() under an electoral system.
+
+        Does not modify model state, so the same ballots can be counted under
+        several systems; tallies shared between systems are computed once.
+
+        Args:
+            ballots: Output of cast_ballots()
+            electoral_system: Any of core.counting.COUNTING_SYSTEMS
+                (default: model setting)
+            allocation_method: PR allocation method (default: model setting)
+            threshold: PR threshold (default: model setting)
+            metrics: Metrics to compute (default: model setting)
+            **options: Extra counting options (e.g. district_magnitude for STV)
+
+        Returns:
+            Dictionary with vote counts, seats, turnout, and metrics
+        """
+        electoral_system = electoral_system or self.electoral_system
+        allocation_method = allocation_method or self.allocation_method
+        threshold = self.threshold if threshold is None else threshold
+        metrics = self.metrics if metrics is None else self._check_metrics(metrics)
+
+        # Unknown system names keep the historical behaviour of counting as PR
+        system = electoral_system if electoral_system in COUNTING_SYSTEMS else "PR"
+        options.setdefault("runoff_qualify", self.runoff_qualify)
+        results = count_ballots(
+            ballots,
+            system,
+            allocation_method=allocation_method,
+            threshold=threshold,
+            **options,
+        )
 
         # If NOTA is included, it might "win" votes but shouldn't win seats in most systems
         # Unless we implement specific NOTA-win logic. For now, NOTA is just a vote vacuum.
-        if self.include_nota:
-            # Mask out NOTA wins in FPTP (NOTA doesn't win seats)
-            nota_idx = (
-                self.parties.df.with_row_index("temp_idx")
-                .filter(pl.col("is_nota"))
-                .select("temp_idx")
-                .to_series()
-                .item(0)
-            )
-            if self.electoral_system == "FPTP":
-                # Find constituencies where NOTA 'won'
-                # results['seats'] currently might include NOTA
-                # We need to find the runner-up if NOTA won.
-                # Actually, fptp_count_fast just gives the winner.
-                # If we want to handle NOTA wins, we'd need to modify the counting or post-process.
-                # For now, let's just mark NOTA seats as vacancies or give to runner-up if NOTA is winner.
-                # Simplest: NOTA seats are 0.
-                results["seats"][nota_idx] = 0
+        if self.include_nota and system != "PR":
+            nota_idx = int(np.flatnonzero(self.parties.get_column("is_nota"))[0])
+            # Constituency seats 'won' by NOTA are left vacant
+            results["seats"][nota_idx] = 0
 
         # Calculate metrics
         vote_shares = results["vote_counts"] / results["vote_counts"].sum()
@@ -578,72 +793,30 @@ class ElectionModel(Model):
             results["seats"] / results["seats"].sum() if results["seats"].sum() > 0 else vote_shares
         )
 
+        # Gallagher and ENP are cheap and read by every consumer, so always reported
+        results["turnout"] = ballots.turnout
         results["gallagher"] = gallagher_index(vote_shares, seat_shares)
         results["enp_votes"] = effective_number_of_parties(vote_shares)
         results["enp_seats"] = effective_number_of_parties(seat_shares)
-        results["turnout"] = will_vote.sum() / len(will_vote)
 
-        # Update party DataFrame with results
-        self.parties.df = self.parties.df.with_columns(
-            [
-                pl.Series("seats", results["seats"]),
-                pl.Series("vote_share", vote_shares),
-            ]
-        )
+        # Calculate VSE (P4) from welfare sums accumulated while voting
+        from electoral_sim.analysis.vse import constituency_vse, district_vse, vse_from_welfare
 
-        # Calculate VSE (P4)
-        if "seats" in results:
-            seats = np.array(results["seats"])
-            total_seats = seats.sum()
-            if total_seats > 0:
-                seat_shares = seats / total_seats
-            else:
-                seat_shares = np.array(results["vote_counts"]) / np.sum(results["vote_counts"])
-
-            from electoral_sim.analysis.vse import calculate_vse
-
-            vse_score = calculate_vse(utilities, seat_shares)
-            results["vse"] = vse_score
+        if "vse" in metrics:
+            results["vse"] = vse_from_welfare(ballots.welfare.sum(axis=0), seat_shares)
+        if "constituency_vse" in metrics and "winners" in results:
+            results["constituency_vse"] = constituency_vse(ballots.welfare, results["winners"])
+            results["district_vse"] = district_vse(ballots.welfare, results["winners"])
 
-        self.election_results.append(results)
         return results
 
-    def _count_fptp(self, constituencies: np.ndarray, votes: np.ndarray) -> dict:
-        """
-        First Past The Post: winner takes all in each constituency.
-
-        Uses Numba parallel acceleration when available.
-        """
-        seats, vote_counts = fptp_count_fast(
-            constituencies, votes, self.n_constituencies, self.n_parties
-        )
-
-        return {
-            "system": "FPTP",
-            "seats": seats,
-            "vote_counts": vote_counts,
-            "n_constituencies": self.n_constituencies,
-        }
-
-    def _count_pr(self, votes: np.ndarray) -> dict:
-        """Proportional Representation with seat allocation."""
-        # Vectorized vote counting
-        vote_counts = np.bincount(votes, minlength=self.n_parties).astype(np.int64)
-
-        # Allocate seats using registry for all methods
-        from electoral_sim.systems.allocation import allocate_seats
-
-        seats = allocate_seats(
-            vote_counts, self.n_constituencies, self.allocation_method, self.threshold
-        )
-
-        return {
-            "system": "PR",
-            "method": self.allocation_method,
-            "seats": seats,
-            "vote_counts": vote_counts,
-            "n_constituencies": self.n_constituencies,
-        }
+    @staticmethod
+    def _check_metrics(metrics: tuple[str, ...]) -> tuple[str, ...]:
+        """Validate a metrics selection."""
+        unknown = set(metrics) - set(AVAILABLE_METRICS)
+        if unknown:
+            raise ValueError(f"Unknown metrics: {sorted(unknown)}. Use {list(AVAILABLE_METRICS)}")
+        return tuple(metrics)
 
     def step(self) -> None:
         """Run one simulation step (for opinion dynamics)."""
@@ -654,8 +827,8 @@ class ElectionModel(Model):
             current_ideologies_y = self.voters.get_ideology_y()
 
             # Get media bias vector if available (Media Diet P3)
-            if "media_bias" in self.voters.df.columns:
-                media_bias_vector = self.voters.df["media_bias"].to_numpy()
+            if "media_bias" in self.voters.columns:
+                media_bias_vector = self.voters.get_column("media_bias")
                 media_strength = 0.05  # Standard media influence per step
             else:
                 media_bias_vector = 0.0
@@ -677,14 +850,10 @@ class ElectionModel(Model):
                 media_bias=0.0,
                 media_strength=0.0,  # Minimal effect on Y
             )
-            # Update the frame
-            self.voters.df = self.voters.df.with_columns(
-                [
-                    pl.Series("ideology_x", new_ideologies_x),
-                    pl.Series("ideology_y", new_ideologies_y),
-                ]
+            # Update the ideology buffers in place
+            self.voters.set_columns(
+                {"ideology_x": new_ideologies_x, "ideology_y": new_ideologies_y}
             )
-            self.voters.invalidate_cache()
 
         # P4: Dynamic Events
         if self.event_manager:
@@ -694,14 +863,14 @@ class ElectionModel(Model):
         # P4: Adaptive Strategy
         if self.use_adaptive_strategy:
             # print("DEBUG: Calling adaptive strategy") # Debugging
-            self.parties.df = adaptive_strategy_step(
-                self.parties.df,
-                self.voters.df,
+            parties = adaptive_strategy_step(
+                self.parties.get_columns(["position_x", "position_y"]),
+                self.voters.get_columns(["ideology_x", "ideology_y"]),
                 strategy="median_voter",
                 learning_rate=0.005,  # Small shift per month/step
                 rng=self.rng,
             )
-            self.parties.invalidate_cache()
+            self.parties.set_columns(parties)
 
         # Collect step data (Mesa 3.0 compatible)
         self._collect_data()
@@ -736,24 +905,22 @@ class ElectionModel(Model):
 
         for i in range(n_elections):
             if reset_voters and i > 0:
-                # Optimized partial reset: only update stochastic columns
-                n = len(self.voters)
-                # Just update ideology and turnout, keep demographics and unique_ids
-                new_voter_data = self._generate_voter_frame(n)
-                self.voters.df = self.voters.df.with_columns(
-                    [
-                        new_voter_data["ideology_x"],
-                        new_voter_data["ideology_y"],
-                        new_voter_data["turnout_prob"],
-                    ]
-                )
-                self.voters.invalidate_cache()
+                self._resample_voters()
 
             results = self.run_election(**kwargs)
             batch_results.append(results)
 
         return batch_results
 
+    def _resample_voters(self) -> None:
+        """Redraw the stochastic voter columns (ideology, turnout), keeping demographics."""
+        # Optimized partial reset: only update stochastic columns
+        n = len(self.voters)
+        new_voter_data = self._generate_voter_frame(n)
+        self.voters.set_columns(
+            {c: new_voter_data[c].to_numpy() for c in ("ideology_x", "ideology_y", "turnout_prob")}
+        )
+
     def get_aggregate_stats(self, results: list[dict] | None = None) -> dict:
         """
         Compute aggregate statistics across multiple elections.
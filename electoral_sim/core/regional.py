@@ -0,0 +1,347 @@
+"""
+Regional Election Engine
+
+Runs national elections made of regions (states, member states, provinces),
+each with its own seats, party strength, ideology shift, turnout and seat
+allocation rule. Every region goes through the same BehaviorEngine utility
+pass, MNL sampling kernel and bincount tallies, and all regions are counted
+together: FPTP districts in one tally matrix, PR regions in one batched
+allocation call. Presets such as simulate_india_election() and
+simulate_eu_election() are thin wrappers around it.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from electoral_sim.core.counting import constituency_winners
+
+
+@dataclass
+class Region:
+    """
+    One region of a RegionalElection.
+
+    Attributes:
+        name: Region name
+        seats: Seats elected in the region
+        party_weights: Regional party strength, {party: weight}; parties not
+            listed get 0 (scaled by RegionalElection.strength_weight)
+        ideology_shift: Shift of the region's voter ideology (x, y, ...);
+            missing dimensions are not shifted
+        turnout: Mean turnout probability, or a function of the region's
+            random generator returning it (e.g. with regional noise)
+        allocation: "FPTP" (one single-member district per seat) or a PR
+            method for the whole region ("dhondt", "sainte_lague", "hare", "droop")
+        threshold: PR threshold as a share of the region's votes
+    """
+
+    name: str
+    seats: int
+    party_weights: dict[str, float] = field(default_factory=dict)
+    ideology_shift: tuple[float, ...] = (0.0, 0.0)
+    turnout: float | Callable[[np.random.Generator], float] = 0.6
+    allocation: str = "FPTP"
+    threshold: float = 0.0
+
+
+@dataclass
+class RegionalResult:
+    """
+    Tallies and seats of a RegionalElection run.
+
+    Attributes:
+        party_names: Party names, in column order
+        regions: The simulated regions
+        seats: (n_regions, n_parties) seats won per region
+        votes: (n_regions, n_parties) ballots cast per region
+        voters: (n_regions,) simulated electorate per region
+        district_tallies: (n_districts, n_parties) ballots per FPTP district
+        district_region: (n_districts,) region index of each FPTP district
+        sample_positions: (n_sample, n_dims) ideology of sampled voters
+        sample_votes: (n_sample,) party chosen by sampled voters
+        sample_region: (n_sample,) region index of sampled voters
+    """
+
+    party_names: list[str]
+    regions: list[Region]
+    seats: np.ndarray
+    votes: np.ndarray
+    voters: np.ndarray
+    district_tallies: np.ndarray
+    district_region: np.ndarray
+    sample_positions: np.ndarray
+    sample_votes: np.ndarray
+    sample_region: np.ndarray
+
+    @property
+    def region_names(self) -> list[str]:
+        return [region.name for region in self.regions]
+
+    @property
+    def total_seats(self) -> dict[str, int]:
+        """Seats per party, summed over regions."""
+        return dict(zip(self.party_names, self.seats.sum(axis=0).tolist()))
+
+    @property
+    def vote_shares(self) -> np.ndarray:
+        """(n_parties,) national vote shares."""
+        totals = self.votes.sum(axis=0)
+        return totals / max(totals.sum(), 1)
+
+    @property
+    def turnout(self) -> float:
+        """National turnout."""
+        return float(self.votes.sum() / self.voters.sum())
+
+    def district_results(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(winner, runner_up, margin) of every FPTP district; see constituency_winners()."""
+        return constituency_winners(self.district_tallies)
+
+
+def _simulate_region(
+    seed: np.random.SeedSequence,
+    region: Region,
+    n_voters: int,
+    ideology_sd: float,
+    behavior_engine,
+    party_data: dict,
+    temperature: float,
+    use_gpu: bool,
+    sample_size: int,
+) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    """
+    Simulate one region's voters and tally the ballots cast per district.
+
+    Each region draws from its own random stream, so results do not depend on
+    whether regions run sequentially or in worker processes.
+
+    Returns:
+        (tallies, (sample_positions, sample_votes)); tallies is
+        (n_districts, n_parties), with one district for PR regions
+    """
+    from electoral_sim.engine.numba_accel import mnl_sample
+
+    rng = np.random.default_rng(seed)
+    n_parties = party_data["n_parties"]
+    n_districts = region.seats if region.allocation == "FPTP" else 1
+
+    # Voters live in the parties' issue space
+    n_dims = party_data["positions"].shape[1]
+    shift = np.zeros(n_dims)
+    shift[: len(region.ideology_shift)] = region.ideology_shift
+    positions = rng.normal(0, ideology_sd, (n_voters, n_dims)) + shift
+    districts = rng.integers(0, n_districts, n_voters) if n_districts > 1 else 0
+
+    utilities = behavior_engine.compute_all(
+        {"n_voters": n_voters, "positions": positions}, party_data, use_gpu=use_gpu
+    )
+    votes = mnl_sample(utilities, temperature, rng.random(n_voters))
+    choices = np.bincount(districts * n_parties + votes, minlength=n_districts * n_parties)
+
+    # Voters turn out independently of their choice, so the ballots cast per
+    # (district, party) cell are Binomial(choices, mean turnout)
+    turnout = region.turnout(rng) if callable(region.turnout) else region.turnout
+    tallies = rng.binomial(choices.reshape(n_districts, n_parties), turnout)
+
+    sample = rng.choice(n_voters, min(sample_size, n_voters), replace=False)
+    return tallies, (positions[sample], votes[sample])
+
+
+def _simulate_region_task(args: tuple) -> tuple:
+    """Unpack arguments for ProcessPoolExecutor.map()."""
+    return _simulate_region(*args)
+
+
+class RegionalElection:
+    """
+    National election over regions with their own seats and rules.
+
+    Utility per voter and party is the BehaviorEngine's (by default
+    -distance_weight * distance + valence_weight * valence) plus the region's
+    party strength, strength_weight * party_weights, and any fixed party bias.
+
+    Example:
+        >>> election = RegionalElection(
+        ...     parties={"A": {"position_x": 0.3, "position_y": 0.0, "valence": 50},
+        ...              "B": {"position_x": -0.3, "position_y": 0.0, "valence": 50}},
+        ...     regions=[Region("North", 10, {"A": 0.6}), Region("South", 5, allocation="dhondt")],
+        ... )
+        >>> result = election.run(seed=42)
+        >>> result.total_seats
+    """
+
+    def __init__(
+        self,
+        parties: dict[str, dict],
+        regions: list[Region],
+        voters_per_seat: int = 1000,
+        temperature: float = 0.5,
+        ideology_sd: float = 0.3,
+        distance_weight: float = 0.3,
+        valence_weight: float = 0.005,
+        strength_weight: float = 3.0,
+        party_bias: dict[str, float] | None = None,
+        seatless: tuple[str, ...] = (),
+        behavior_engine=None,
+        use_gpu: bool = False,
+        n_jobs: int = 1,
+    ):
+        """
+        Args:
+            parties: {name: {"position_x", "position_y", "valence"}}; further
+                issue dimensions go in "position_2", "position_3", ...
+            regions: Regions in order
+            voters_per_seat: Simulated voters per seat
+            temperature: MNL temperature
+            ideology_sd: Standard deviation of voter ideology around the
+                region's shift
+            distance_weight: Weight of the distance term (default engine)
+            valence_weight: Weight of valence (default engine)
+            strength_weight: Scale of Region.party_weights
+            party_bias: Fixed utility per party in every region (e.g. a protest
+                option's penalty, historical viability)
+            seatless: Options that take votes but never seats (e.g. "NOTA");
+                FPTP districts they carry stay vacant, PR ignores their votes
+            behavior_engine: Custom BehaviorEngine; if it has no
+                RegionalBiasModel, a copy with one added is used
+            use_gpu: Compute utilities with CuPy (BehaviorEngine GPU path)
+            n_jobs: Worker processes for simulating regions (1 = sequential);
+                results are identical for any value
+        """
+        from electoral_sim.behavior.voter_behavior import (
+            BehaviorEngine,
+            ProximityModel,
+            RegionalBiasModel,
+            ValenceModel,
+        )
+        from electoral_sim.engine.gpu_accel import is_gpu_available
+        from electoral_sim.systems.allocation import DIVISORS
+
+        unknown = {r.allocation for r in regions} - {"FPTP", *DIVISORS, "hare", "droop"}
+        if unknown:
+            raise ValueError(f"Unknown allocation: {sorted(unknown)}")
+
+        self.parties = parties
+        self.regions = regions
+        self.party_names = list(parties)
+        self.voters_per_seat = voters_per_seat
+        self.temperature = temperature
+        self.ideology_sd = ideology_sd
+        self.strength_weight = strength_weight
+        self.party_bias = party_bias or {}
+        self.seatless = seatless
+        self.use_gpu = use_gpu and is_gpu_available()
+        self.n_jobs = n_jobs
+
+        if behavior_engine is None:
+            behavior_engine = BehaviorEngine()
+            behavior_engine.add_model(ProximityModel(weight=distance_weight))
+            behavior_engine.add_model(ValenceModel(weight=valence_weight))
+        if not any(isinstance(m, RegionalBiasModel) for m, _ in behavior_engine.models):
+            # Leave the caller's engine untouched
+            behavior_engine = copy.copy(behavior_engine)
+            behavior_engine.models = list(behavior_engine.models)
+            behavior_engine.add_model(RegionalBiasModel())
+        self.behavior_engine = behavior_engine
+
+    def regional_bias(self) -> np.ndarray:
+        """(n_regions, n_parties) party-level utility of each region."""
+        strength = np.array(
+            [[r.party_weights.get(p, 0.0) for p in self.party_names] for r in self.regions]
+        )
+        fixed = np.array([self.party_bias.get(p, 0.0) for p in self.party_names])
+        return self.strength_weight * strength + fixed
+
+    def run(self, seed: int | None = None, sample_size: int = 0) -> RegionalResult:
+        """
+        Simulate every region and count all of them together.
+
+        Args:
+            seed: Random seed
+            sample_size: Voters per region kept in the result's sample
+
+        Returns:
+            RegionalResult
+        """
+        from electoral_sim.core.voter_generation import extra_position_columns
+        from electoral_sim.systems.allocation import allocate_seats_batch
+
+        P = len(self.party_names)
+        dims = ["position_x", "position_y", *extra_position_columns(list(self.parties.values()))]
+        party_data = {
+            "n_parties": P,
+            "positions": np.array([[p.get(d, 0.0) for d in dims] for p in self.parties.values()]),
+            "valence": np.array([p["valence"] for p in self.parties.values()], dtype=float),
+            "incumbents": np.array([p.get("incumbent", False) for p in self.parties.values()]),
+        }
+        bias = self.regional_bias()
+        seeds = np.random.SeedSequence(seed).spawn(len(self.regions))
+        tasks = [
+            (
+                seeds[r],
+                region,
+                self.voters_per_seat * region.seats,
+                self.ideology_sd,
+                self.behavior_engine,
+                {**party_data, "regional_bias": bias[r]},
+                self.temperature,
+                self.use_gpu,
+                sample_size,
+            )
+            for r, region in enumerate(self.regions)
+        ]
+
+        if self.n_jobs > 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Spawned workers: forking after Polars / Numba start their thread pools can deadlock
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.n_jobs, mp_context=context) as executor:
+                outputs = list(executor.map(_simulate_region_task, tasks))
+        else:
+            outputs = [_simulate_region(*task) for task in tasks]
+
+        R = len(self.regions)
+        votes = np.stack([out[0].sum(axis=0) for out in outputs])
+        seats = np.zeros((R, P), dtype=np.int64)
+        seated = np.array([p not in self.seatless for p in self.party_names])
+
+        # FPTP regions: all districts in one tally matrix
+        fptp = [r for r, region in enumerate(self.regions) if region.allocation == "FPTP"]
+        district_tallies = (
+            np.concatenate([outputs[r][0] for r in fptp]) if fptp else np.zeros((0, P), np.int64)
+        )
+        district_region = np.repeat(fptp, [self.regions[r].seats for r in fptp]).astype(np.int64)
+        winner, _, _ = constituency_winners(district_tallies)
+        won = winner >= 0
+        won[won] = seated[winner[won]]
+        seats += np.bincount(district_region[won] * P + winner[won], minlength=R * P).reshape(R, P)
+
+        # PR regions: one batched allocation, seatless options excluded
+        pr = [r for r, region in enumerate(self.regions) if region.allocation != "FPTP"]
+        if pr:
+            seats[pr] = allocate_seats_batch(
+                votes[pr] * seated,
+                [self.regions[r].seats for r in pr],
+                [self.regions[r].allocation for r in pr],
+                [self.regions[r].threshold for r in pr],
+            )
+
+        return RegionalResult(
+            party_names=self.party_names,
+            regions=self.regions,
+            seats=seats,
+            votes=votes,
+            voters=np.array([self.voters_per_seat * region.seats for region in self.regions]),
+            district_tallies=district_tallies,
+            district_region=district_region,
+            sample_positions=np.concatenate([out[1][0] for out in outputs]),
+            sample_votes=np.concatenate([out[1][1] for out in outputs]),
+            sample_region=np.repeat(np.arange(R), [len(out[1][1]) for out in outputs]),
+        )
@@ -238,6 +238,56 @@ def generate_voter_frame(
     )
 
 
+def add_issue_dimensions(
+    df: pl.DataFrame,
+    n_dims: int,
+    rng: np.random.Generator,
+    salience: bool = False,
+) -> pl.DataFrame:
+    """
+    Extend a voter frame to an N-dimensional issue space.
+
+    Adds ideology_2 ... ideology_{n_dims-1} (same spread as the first two
+    dimensions) and, optionally, per-voter salience weights salience_x,
+    salience_y, salience_2, ... drawn from a Dirichlet and scaled to mean 1.
+
+    Args:
+        df: Voter DataFrame with ideology_x and ideology_y
+        n_dims: Total number of issue dimensions (>= 2)
+        rng: NumPy random generator
+        salience: Whether to add salience weights
+
+    Returns:
+        Voter DataFrame with the extra columns
+    """
+    if n_dims < 2:
+        raise ValueError(f"n_dims must be at least 2, got {n_dims}")
+
+    n_voters = len(df)
+    columns = [
+        pl.Series(f"ideology_{k}", np.clip(rng.normal(0, 0.3, n_voters), -1, 1).astype(np.float32))
+        for k in range(2, n_dims)
+    ]
+
+    if salience:
+        weights = rng.dirichlet(np.full(n_dims, 2.0), n_voters) * n_dims
+        names = ["salience_x", "salience_y"] + [f"salience_{k}" for k in range(2, n_dims)]
+        columns += [
+            pl.Series(name, weights[:, d].astype(np.float32)) for d, name in enumerate(names)
+        ]
+
+    return df.with_columns(columns)
+
+
+def extra_position_columns(parties: list[dict]) -> list[str]:
+    """Issue dimensions beyond x/y used by any party config: position_2, position_3, ..."""
+    n_extra = 0
+    for p in parties:
+        while f"position_{n_extra + 2}" in p:
+            n_extra += 1
+    return [f"position_{k}" for k in range(2, n_extra + 2)]
+
+
 def generate_party_frame(
     parties: list[dict],
     include_nota: bool = False,
@@ -252,11 +302,13 @@ def generate_party_frame(
     Returns:
         Polars DataFrame with party attributes
     """
+    extra_dims = extra_position_columns(parties)
     party_data = [
         {
             "name": p.get("name", f"Party {i}"),
             "position_x": float(p.get("position_x", 0.0)),
             "position_y": float(p.get("position_y", 0.0)),
+            **{c: float(p.get(c, 0.0)) for c in extra_dims},
             "valence": float(p.get("valence", 50.0)),
             "incumbent": bool(p.get("incumbent", False)),
             "is_nota": False,
@@ -271,6 +323,7 @@ def generate_party_frame(
                 "name": "NOTA",
                 "position_x": 0.0,
                 "position_y": 0.0,
+                **{c: 0.0 for c in extra_dims},
                 "valence": 0.0,  # No appeal
                 "incumbent": False,
                 "is_nota": True,
@@ -13,17 +13,31 @@ from electoral_sim.engine.coalition import (
     minimum_winning_coalitions,
 )
 from electoral_sim.engine.government import (
+    GovernmentFleet,
     GovernmentSimulator,
+    collapse_hazard_curve,
     collapse_probability,
     cox_proportional_hazard,
+    government_survival_batch,
     hazard_rate,
     simulate_government_survival,
+    survival_distribution,
 )
 from electoral_sim.engine.numba_accel import (
     NUMBA_AVAILABLE,
+    compile_pair_utility,
     compute_utilities_numba,
     fptp_count_fast,
+    fused_utilities_fast,
+    mnl_sample,
     vote_mnl_fast,
+    vote_mnl_welfare_fast,
+)
+from electoral_sim.engine.power import (
+    banzhaf_index,
+    power_distribution,
+    power_indices,
+    shapley_shubik_index,
 )
 
 __all__ = [
@@ -39,12 +53,25 @@ __all__ = [
     # Government
     "collapse_probability",
     "simulate_government_survival",
+    "collapse_hazard_curve",
+    "survival_distribution",
+    "government_survival_batch",
     "hazard_rate",
     "cox_proportional_hazard",
     "GovernmentSimulator",
+    "GovernmentFleet",
+    # Power indices
+    "power_indices",
+    "banzhaf_index",
+    "shapley_shubik_index",
+    "power_distribution",
     # Acceleration
     "vote_mnl_fast",
+    "vote_mnl_welfare_fast",
+    "mnl_sample",
     "fptp_count_fast",
+    "fused_utilities_fast",
     "compute_utilities_numba",
+    "compile_pair_utility",
     "NUMBA_AVAILABLE",
 ]
@@ -7,10 +7,117 @@ Implements:
 - Coalition strain calculation
 """
 
-from itertools import combinations
+from functools import lru_cache
 
 import numpy as np
 
+from electoral_sim.engine.numba_accel import jit
+
+
+@jit(nopython=True, cache=True)
+def _mwc_search_numba(seats: np.ndarray, majority: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Depth-first search for minimum winning coalitions as bitmasks.
+
+    Parties must be sorted by seats in descending order. Each coalition is
+    built by adding ever-smaller parties, so:
+    - it is minimal iff removing its last (smallest) member loses the majority
+    - once it is winning, extending it can only produce non-minimal coalitions
+    - a branch is pruned when even all remaining parties cannot reach majority
+
+    Returns:
+        (masks, totals) over the sorted party indices
+    """
+    n = len(seats)
+    suffix = np.zeros(n + 1, dtype=np.float64)
+    for i in range(n - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + seats[i]
+
+    masks = np.empty(64, dtype=np.int64)
+    totals = np.empty(64, dtype=np.float64)
+    count = 0
+
+    chosen = np.empty(n, dtype=np.int64)
+    depth = 0
+    total = 0.0
+    mask = 0
+    i = 0
+
+    while True:
+        if i < n and total + suffix[i] >= majority:
+            total += seats[i]
+            if total >= majority:
+                if total - seats[i] < majority:
+                    if count == len(masks):
+                        masks = np.concatenate((masks, np.empty(count, dtype=np.int64)))
+                        totals = np.concatenate((totals, np.empty(count, dtype=np.float64)))
+                    masks[count] = mask | (1 << i)
+                    totals[count] = total
+                    count += 1
+                # Winning: skip extensions, try the next party instead
+                total -= seats[i]
+                i += 1
+            else:
+                chosen[depth] = i
+                depth += 1
+                mask |= 1 << i
+                i += 1
+        else:
+            # Backtrack
+            if depth == 0:
+                break
+            depth -= 1
+            j = chosen[depth]
+            total -= seats[j]
+            mask ^= 1 << j
+            i = j + 1
+
+    return masks[:count], totals[:count]
+
+
+def _mwc_arrays(seats: np.ndarray, majority_threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    MWCs of a seat vector as a (n_coalitions, n_parties) membership matrix and
+    (n_coalitions,) seat totals, ordered by size, then lexicographically.
+
+    Results are cached per seat vector and shared by every coalition function;
+    the returned arrays are read-only.
+    """
+    seats = np.asarray(seats)
+    majority = int(np.floor(seats.sum() * majority_threshold)) + 1
+    return _minimum_winning_masks(tuple(seats.tolist()), majority)
+
+
+@lru_cache(maxsize=256)
+def _minimum_winning_masks(seats: tuple, majority: int) -> tuple[np.ndarray, np.ndarray]:
+    """Cached MWC enumeration for one seat vector (see _mwc_arrays)."""
+    seats_arr = np.asarray(seats, dtype=np.float64)
+    if len(seats_arr) > 62:
+        raise ValueError(f"Coalition enumeration supports at most 62 parties, got {len(seats_arr)}")
+
+    n = len(seats_arr)
+    order = np.argsort(-seats_arr, kind="stable")
+    masks, totals = _mwc_search_numba(seats_arr[order], float(majority))
+
+    # Membership matrix in original party order
+    members = np.zeros((len(masks), n), dtype=bool)
+    members[:, order] = (masks[:, None] >> np.arange(n)) & 1
+
+    # Fewest parties first; equal sizes in lexicographic order of party indices,
+    # i.e. the coalition holding the lowest differing party comes first
+    keys = [~members[:, j] for j in range(n - 1, -1, -1)] + [members.sum(axis=1)]
+    rank = np.lexsort(keys)
+
+    members, totals = members[rank], totals[rank]
+    members.setflags(write=False)
+    totals.setflags(write=False)
+    return members, totals
+
+
+def _as_coalitions(members: np.ndarray, totals: np.ndarray, cast=int) -> list:
+    """Membership rows -> [(party_indices, total_seats), ...]."""
+    return [(np.flatnonzero(row).tolist(), cast(total)) for row, total in zip(members, totals)]
+
 
 def minimum_winning_coalitions(
     seats: np.ndarray,
@@ -23,40 +130,21 @@ def minimum_winning_coalitions(
     - Total seats >= majority
     - Removing any party makes it lose majority
 
+    Uses a pruned bitmask search (Numba-accelerated when available) instead
+    of enumerating all 2^n subsets, and caches the result per seat vector.
+
     Args:
         seats: Seat counts per party
         majority_threshold: Fraction of seats needed (default 0.5 = simple majority)
 
     Returns:
-        List of (party_indices, total_seats) tuples
+        List of (party_indices, total_seats) tuples, fewest parties first
     """
-    total_seats = seats.sum()
-    majority = int(np.floor(total_seats * majority_threshold)) + 1
-    n_parties = len(seats)
-
-    mwcs = []
-
-    # Check all possible coalitions (2^n - expensive for many parties!)
-    for size in range(1, n_parties + 1):
-        for coalition in combinations(range(n_parties), size):
-            coalition_seats = sum(seats[p] for p in coalition)
-
-            if coalition_seats >= majority:
-                # Check if it's minimal (removing any party loses majority)
-                is_minimal = True
-                for party in coalition:
-                    without_party = coalition_seats - seats[party]
-                    if without_party >= majority:
-                        is_minimal = False
-                        break
-
-                if is_minimal:
-                    mwcs.append((list(coalition), coalition_seats))
+    seats = np.asarray(seats)
+    members, totals = _mwc_arrays(seats, majority_threshold)
 
-    # Sort by size (fewest parties first)
-    mwcs.sort(key=lambda x: len(x[0]))
-
-    return mwcs
+    cast = int if np.issubdtype(seats.dtype, np.integer) else float
+    return _as_coalitions(members, totals, cast)
 
 
 def minimum_connected_winning(
@@ -84,22 +172,26 @@ def minimum_connected_winning(
     if positions.ndim == 2:
         positions = positions[:, 0]
 
-    # Get all MWCs first
-    mwcs = minimum_winning_coalitions(seats, majority_threshold)
-
-    mcws = []
-    for parties, total in mwcs:
-        party_positions = positions[parties]
-        policy_range = party_positions.max() - party_positions.min()
+    # Get all MWCs first (cached per seat vector)
+    seats = np.asarray(seats)
+    members, totals = _mwc_arrays(seats, majority_threshold)
 
-        # Check if all parties are within max_distance
-        if policy_range <= max_distance:
-            mcws.append((parties, total, policy_range))
+    # Policy range of every MWC at once
+    policy_ranges = np.where(members, positions, -np.inf).max(axis=1, initial=-np.inf) - np.where(
+        members, positions, np.inf
+    ).min(axis=1, initial=np.inf)
 
-    # Sort by policy range (most cohesive first)
-    mcws.sort(key=lambda x: x[2])
+    # Keep coalitions within max_distance, most cohesive first (stable on ties)
+    connected = np.flatnonzero(policy_ranges <= max_distance)
+    connected = connected[np.argsort(policy_ranges[connected], kind="stable")]
 
-    return mcws
+    cast = int if np.issubdtype(seats.dtype, np.integer) else float
+    return [
+        (parties, total, float(policy_ranges[k]))
+        for (parties, total), k in zip(
+            _as_coalitions(members[connected], totals[connected], cast), connected
+        )
+    ]
 
 
 def coalition_strain(
@@ -232,8 +324,8 @@ def form_government(
 
         if not mcws:
             # No connected winning coalition - try regular MWC
-            mwcs = minimum_winning_coalitions(seats, majority_threshold)
-            if not mwcs:
+            members, totals = _mwc_arrays(seats, majority_threshold)
+            if len(members) == 0:
                 return {
                     "success": False,
                     "reason": "No majority coalition possible",
@@ -242,7 +334,7 @@ def form_government(
                 }
 
             # Use smallest MWC
-            coalition_parties, coalition_seats = mwcs[0]
+            coalition_parties, coalition_seats = _as_coalitions(members[:1], totals[:1])[0]
             coalition_positions = positions[coalition_parties]
         else:
             # Use most cohesive MCW
@@ -436,36 +528,28 @@ def form_coalition_with_utility(
     # For now, let's stick to MWCs as the base set, as oversized usually drops office utility significantly
     # without always improving policy utility enough to compensate unless alpha is very low.
 
-    candidates = minimum_winning_coalitions(seats, majority_threshold)
-
-    best_coalition = []
-    best_utility = -1.0
-
-    for parties, size in candidates:
-        # Calculate Office Utility
-        # Normalized: minimal possible size / actual size
-        # Approximated by majority_needed / size
-        office_u = majority_needed / size
-
-        # Calculate Policy Utility
-        # 1 - strain
-        party_pos = positions[parties]
-        if positions.ndim == 2:
-            party_pos = party_pos[:, 0]  # Use primary dimension
-
-        mean_pos = np.average(party_pos, weights=seats[parties])
-        # Strain: weighted mean distance from coalition center
-        strain = np.average(np.abs(party_pos - mean_pos), weights=seats[parties])
-
-        # Normalize strain? typically 0 to 0.5.
-        # Let's use simple linear
-        policy_u = max(0.0, 1.0 - (strain * 2.0))  # scale up strain impact
-
-        # Total Utility
-        utility = (office_weight * office_u) + ((1.0 - office_weight) * policy_u)
-
-        if utility > best_utility:
-            best_utility = utility
-            best_coalition = parties
+    members, totals = _mwc_arrays(seats, majority_threshold)
+    if len(members) == 0:
+        return [], -1.0
+
+    # Office Utility: minimal possible size / actual size,
+    # approximated by majority_needed / size
+    office_u = majority_needed / totals
+
+    # Policy Utility: 1 - strain, on the primary dimension
+    party_pos = positions[:, 0] if positions.ndim == 2 else positions
+    weights = members * seats
+    weight_sums = weights.sum(axis=1)
+    mean_pos = weights @ party_pos / weight_sums
+    # Strain: weighted mean distance from coalition center
+    strain = (weights * np.abs(party_pos - mean_pos[:, None])).sum(axis=1) / weight_sums
+    # Let's use simple linear (scale up strain impact)
+    policy_u = np.maximum(0.0, 1.0 - (strain * 2.0))
+
+    # Total Utility (first best on ties)
+    utility = (office_weight * office_u) + ((1.0 - office_weight) * policy_u)
+    best = int(np.argmax(utility))
+    best_coalition = np.flatnonzero(members[best]).tolist()
+    best_utility = float(utility[best])
 
     return best_coalition, best_utility
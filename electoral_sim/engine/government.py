@@ -3,12 +3,14 @@ Government Stability and Collapse Models
 
 Implements:
 - Sigmoid, Linear, Exponential collapse probability
-- Survival time estimation
+- Closed-form survival curves and batched survival time estimation
+- GovernmentFleet: many governments simulated in lockstep
 """
 
 from typing import Literal
 
 import numpy as np
+import polars as pl
 
 
 def collapse_probability(
@@ -65,6 +67,145 @@ def collapse_probability(
     return np.clip(probability, 0.0, 1.0)
 
 
+def collapse_hazard_curve(
+    strain: float | np.ndarray,
+    stability: float | np.ndarray,
+    model: Literal["sigmoid", "linear", "exponential"] = "sigmoid",
+    base_rate: float = 0.05,
+    max_term: int = 60,
+) -> np.ndarray:
+    """
+    Monthly collapse probabilities for months 1..max_term, for one or many coalitions.
+
+    Vectorised form of collapse_probability(): the hazard depends only on the
+    month, so it is computed once per coalition instead of once per draw.
+
+    Args:
+        strain: Coalition strain, scalar or array
+        stability: Coalition stability, scalar or array (broadcast with strain)
+        model: Collapse model type
+        base_rate: Base monthly collapse probability
+        max_term: Maximum term length (collapse is certain in the last month)
+
+    Returns:
+        Array of shape broadcast(strain, stability) + (max_term,)
+    """
+    strain = np.asarray(strain, dtype=np.float64)[..., np.newaxis]
+    stability = np.asarray(stability, dtype=np.float64)[..., np.newaxis]
+    months = np.arange(1, max_term + 1)
+    time_factor = months / max_term
+
+    hazard = base_rate * (1.0 + strain) * (2.0 - stability)
+
+    if model == "sigmoid":
+        probability = hazard / (1.0 + np.exp(-10 * (time_factor - 0.5)))
+    elif model == "exponential":
+        probability = hazard * np.exp(2 * time_factor)
+    else:  # linear
+        probability = hazard * (1.0 + time_factor)
+
+    probability = np.clip(probability, 0.0, 1.0)
+    probability[..., -1] = 1.0
+    return probability
+
+
+def survival_distribution(
+    strain: float | np.ndarray,
+    stability: float | np.ndarray,
+    model: Literal["sigmoid", "linear", "exponential"] = "sigmoid",
+    max_term: int = 60,
+) -> dict[str, np.ndarray]:
+    """
+    Closed-form survival curve: S(t) = prod_{m <= t} (1 - p_m).
+
+    Args:
+        strain: Coalition strain, scalar or array
+        stability: Coalition stability, scalar or array
+        model: Collapse model type
+        max_term: Maximum term in months
+
+    Returns:
+        Dictionary with 'hazard', 'survival' (S(t)) and 'pmf' (P(T = t)),
+        each of shape (..., max_term) for months 1..max_term
+    """
+    hazard = collapse_hazard_curve(strain, stability, model, max_term=max_term)
+    survival = np.cumprod(1.0 - hazard, axis=-1)
+    previous = np.concatenate([np.ones_like(survival[..., :1]), survival[..., :-1]], axis=-1)
+    return {"hazard": hazard, "survival": survival, "pmf": previous * hazard}
+
+
+def government_survival_batch(
+    strain: float | np.ndarray,
+    stability: float | np.ndarray,
+    model: Literal["sigmoid", "linear", "exponential"] = "sigmoid",
+    max_term: int = 60,
+    n_simulations: int = 0,
+    seed: int | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Survival statistics for many coalitions at once.
+
+    With n_simulations = 0 the statistics are exact, computed from the
+    closed-form survival curve. Otherwise survival times are drawn by
+    inverse-CDF sampling, one uniform draw per simulated government.
+
+    Args:
+        strain: Coalition strain values (array or scalar)
+        stability: Coalition stability scores (broadcast with strain)
+        model: Collapse model type
+        max_term: Maximum term in months
+        n_simulations: Monte Carlo draws per coalition (0 = analytic)
+        seed: Random seed
+
+    Returns:
+        Dictionary of arrays shaped like broadcast(strain, stability) with the
+        same keys as simulate_government_survival()
+    """
+    dist = survival_distribution(strain, stability, model, max_term)
+    pmf = dist["pmf"]
+    shape = pmf.shape[:-1]
+    pmf = pmf.reshape(-1, max_term)
+    months = np.arange(1, max_term + 1)
+    early = months < max_term / 2
+
+    if n_simulations > 0:
+        rng = np.random.default_rng(seed)
+        n_rows = len(pmf)
+        cdf = np.cumsum(pmf, axis=1)
+        cdf[:, -1] = 1.0
+
+        # Offset each row so one searchsorted covers the whole batch
+        offsets = 2.0 * np.arange(n_rows)[:, np.newaxis]
+        u = rng.random((n_rows, n_simulations))
+        idx = np.searchsorted((cdf + offsets).ravel(), (u + offsets).ravel(), side="right")
+        times = (idx.reshape(n_rows, n_simulations) - max_term * np.arange(n_rows)[:, None]) + 1
+
+        stats = {
+            "mean_survival": times.mean(axis=1),
+            "median_survival": np.median(times, axis=1),
+            "std_survival": times.std(axis=1),
+            "full_term_prob": (times >= max_term).mean(axis=1),
+            "early_collapse_prob": (times < max_term / 2).mean(axis=1),
+            "min_survival": times.min(axis=1),
+            "max_survival": times.max(axis=1),
+        }
+    else:
+        mean = pmf @ months
+        cdf = np.cumsum(pmf, axis=1)
+        support = pmf > 0
+        stats = {
+            "mean_survival": mean,
+            "median_survival": (np.argmax(cdf >= 0.5, axis=1) + 1).astype(np.float64),
+            "std_survival": np.sqrt(np.maximum(pmf @ months**2 - mean**2, 0.0)),
+            "full_term_prob": pmf[:, -1],
+            "early_collapse_prob": pmf[:, early].sum(axis=1),
+            "min_survival": np.argmax(support, axis=1) + 1,
+            "max_survival": max_term - np.argmax(support[:, ::-1], axis=1),
+        }
+
+    return {key: value.reshape(shape) for key, value in stats.items()}
+
+
 def simulate_government_survival(
     strain: float,
     stability: float,
@@ -76,40 +217,30 @@ def simulate_government_survival(
     """
     Simulate government survival to get expected duration.
 
+    The monthly hazard is precomputed once and survival times are drawn in
+    one vectorised step (see government_survival_batch()).
+
     Args:
         strain: Coalition strain value
         stability: Coalition stability score
         model: Collapse model type
         max_term: Maximum term in months
-        n_simulations: Number of Monte Carlo simulations
+        n_simulations: Number of Monte Carlo simulations (0 = exact, analytic)
         seed: Random seed
 
     Returns:
         Dictionary with survival statistics
     """
-    rng = np.random.default_rng(seed)
-
-    survival_times = []
-
-    for _ in range(n_simulations):
-        for month in range(1, max_term + 1):
-            prob = collapse_probability(month, strain, stability, model, max_term=max_term)
-            if rng.random() < prob:
-                survival_times.append(month)
-                break
-        else:
-            survival_times.append(max_term)
-
-    survival_times = np.array(survival_times)
+    stats = government_survival_batch(strain, stability, model, max_term, n_simulations, seed)
 
     return {
-        "mean_survival": float(survival_times.mean()),
-        "median_survival": float(np.median(survival_times)),
-        "std_survival": float(survival_times.std()),
-        "full_term_prob": float((survival_times >= max_term).mean()),
-        "early_collapse_prob": float((survival_times < max_term / 2).mean()),
-        "min_survival": int(survival_times.min()),
-        "max_survival": int(survival_times.max()),
+        "mean_survival": float(stats["mean_survival"]),
+        "median_survival": float(stats["median_survival"]),
+        "std_survival": float(stats["std_survival"]),
+        "full_term_prob": float(stats["full_term_prob"]),
+        "early_collapse_prob": float(stats["early_collapse_prob"]),
+        "min_survival": int(stats["min_survival"]),
+        "max_survival": int(stats["max_survival"]),
     }
 
 
@@ -162,24 +293,25 @@ def hazard_rate(
 
 
 def cox_proportional_hazard(
-    time_in_office: int,
-    covariates: dict[str, float],
+    time_in_office: int | np.ndarray,
+    covariates: dict[str, float | np.ndarray],
     base_hazard: float = 0.01,
     coefficients: dict[str, float] | None = None,
-) -> float:
+) -> float | np.ndarray:
     """
     Calculate hazard rate using simplified Cox Proportional Hazards model.
 
     h(t|x) = h_0(t) * exp(sum(b_i * x_i))
 
     Args:
-        time_in_office: T (baseline hazard increases with time)
-        covariates: Dictionary of covariate values (x)
+        time_in_office: T (baseline hazard increases with time); scalar or array
+        covariates: Dictionary of covariate values (x); scalars or arrays
+            broadcasting with time_in_office
         base_hazard: Base hazard scalar
         coefficients: Dictionary of regression coefficients (b)
 
     Returns:
-        Hazard rate at time t given covariates x
+        Hazard rate at time t given covariates x (array if any input is)
 
     Default Coefficients (based on Warwick 1994):
         - majority_margin: -2.0 (larger majority = safer)
@@ -232,6 +364,7 @@ class GovernmentSimulator:
         self.coalition = coalition_parties or ["Government"]
         self.model = model
         self.rng = np.random.default_rng(seed)
+        self._hazard = collapse_hazard_curve(strain, stability, model)
 
         self.months_in_office = 0
         self.collapsed = False
@@ -257,12 +390,10 @@ class GovernmentSimulator:
 
         self.months_in_office += 1
 
-        prob = collapse_probability(
-            self.months_in_office,
-            self.strain,
-            self.stability,
-            model=self.model,
-        )
+        if self.months_in_office <= len(self._hazard):
+            prob = self._hazard[self.months_in_office - 1]
+        else:
+            prob = 1.0
 
         # Adjust for recent events (within last 3 months)
         recent_events = [
@@ -298,3 +429,177 @@ class GovernmentSimulator:
             "stability": self.stability,
             "n_events": len(self.events),
         }
+
+
+# Collapse reason codes used by GovernmentFleet
+COLLAPSE_REASONS = ("", "time_in_office", "policy_strain")
+
+
+class GovernmentFleet:
+    """
+    Simulates many governments in lockstep.
+
+    State is held in arrays (months in office, collapse flags, collapse
+    reasons) and recent events in fixed-size ring buffers per government, so
+    every step is a handful of vectorised operations regardless of fleet size.
+    Follows the same per-month rules as GovernmentSimulator.
+
+    Example:
+        fleet = GovernmentFleet(strain=strains, stability=stabilities, seed=42)
+        fleet.add_events([0, 5, 5], severity=[1.0, 0.5, 2.0])
+        durations = fleet.simulate(max_months=60)
+        print(fleet.to_frame())
+    """
+
+    def __init__(
+        self,
+        strain: np.ndarray,
+        stability: np.ndarray,
+        model: str = "sigmoid",
+        hazard: Literal["collapse", "cox"] = "collapse",
+        covariates: dict[str, np.ndarray | float] | None = None,
+        coefficients: dict[str, float] | None = None,
+        base_hazard: float = 0.01,
+        event_window: int = 3,
+        event_capacity: int = 8,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            strain: (n_governments,) coalition strain
+            stability: (n_governments,) coalition stability (broadcast with strain)
+            model: Collapse model for hazard='collapse'
+            hazard: 'collapse' (collapse_probability curves) or 'cox'
+                (cox_proportional_hazard with monthly probability 1 - exp(-h))
+            covariates: Cox covariates, each scalar or (n_governments,);
+                coalition_strain defaults to strain
+            coefficients: Cox coefficients (default: cox_proportional_hazard's)
+            base_hazard: Cox baseline hazard
+            event_window: Months an event keeps raising the collapse probability
+            event_capacity: Most recent events remembered per government
+            seed: Random seed
+        """
+        self.strain, self.stability = (
+            a.astype(np.float64) for a in np.broadcast_arrays(strain, stability)
+        )
+        n = len(self.strain)
+        self.n_governments = n
+        self.model = model
+        self.hazard = hazard
+        self.event_window = event_window
+        self.rng = np.random.default_rng(seed)
+
+        # Precomputed monthly collapse probabilities (n_governments, 60)
+        self._hazard = collapse_hazard_curve(self.strain, self.stability, model)
+
+        if hazard == "cox":
+            self.covariates = {"coalition_strain": self.strain, **(covariates or {})}
+            self.coefficients = coefficients
+            self.base_hazard = base_hazard
+        elif hazard != "collapse":
+            raise ValueError(f"Unknown hazard: {hazard}. Use 'collapse' or 'cox'")
+
+        self.months_in_office = np.zeros(n, dtype=np.int32)
+        self.collapsed = np.zeros(n, dtype=bool)
+        self.collapse_reason = np.zeros(n, dtype=np.int8)  # Index into COLLAPSE_REASONS
+
+        # Event ring buffers: month and severity of the latest event_capacity events
+        self.event_month = np.full((n, event_capacity), -(2**30), dtype=np.int32)
+        self.event_severity = np.zeros((n, event_capacity), dtype=np.float64)
+        self.event_head = np.zeros(n, dtype=np.int64)
+        self.n_events = np.zeros(n, dtype=np.int64)
+
+    def add_events(self, governments: np.ndarray, severity: np.ndarray | float = 1.0) -> None:
+        """
+        Record destabilizing events in the current month.
+
+        Args:
+            governments: Indices of affected governments (repeats allowed)
+            severity: Event severities, scalar or one per index
+        """
+        governments = np.asarray(governments, dtype=np.int64)
+        severity = np.broadcast_to(np.asarray(severity, dtype=np.float64), governments.shape)
+        if len(governments) == 0:
+            return
+
+        # Repeated governments take consecutive ring-buffer slots
+        order = np.argsort(governments, kind="stable")
+        governments, severity = governments[order], severity[order]
+        starts = np.flatnonzero(np.r_[True, governments[1:] != governments[:-1]])
+        counts = np.diff(np.r_[starts, len(governments)])
+        rank = np.arange(len(governments)) - np.repeat(starts, counts)
+
+        capacity = self.event_month.shape[1]
+        slots = (self.event_head[governments] + rank) % capacity
+        self.event_month[governments, slots] = self.months_in_office[governments]
+        self.event_severity[governments, slots] = severity
+
+        unique = governments[starts]
+        self.event_head[unique] += counts
+        self.n_events[unique] += counts
+
+    def collapse_probabilities(self) -> np.ndarray:
+        """Collapse probability of every government in its current month."""
+        months = self.months_in_office
+
+        if self.hazard == "cox":
+            h = cox_proportional_hazard(
+                months, self.covariates, self.base_hazard, self.coefficients
+            )
+            prob = 1.0 - np.exp(-h)
+        else:
+            max_term = self._hazard.shape[1]
+            in_term = (months >= 1) & (months <= max_term)
+            prob = np.ones(self.n_governments)
+            idx = np.clip(months - 1, 0, max_term - 1)
+            prob[in_term] = self._hazard[np.flatnonzero(in_term), idx[in_term]]
+
+        # Adjust for recent events (within the event window)
+        recent = (self.event_month >= (months - self.event_window)[:, None]) & (
+            self.event_month <= months[:, None]
+        )
+        boost = 0.1 * (self.event_severity * recent).sum(axis=1)
+        return np.minimum(1.0, prob + boost)
+
+    def step(self) -> np.ndarray:
+        """
+        Advance every surviving government by one month.
+
+        Returns:
+            Boolean mask of governments still in office
+        """
+        self._advance(~self.collapsed)
+        return ~self.collapsed
+
+    def simulate(self, max_months: int = 60) -> np.ndarray:
+        """Run until every government collapses or max_months. Returns survival times."""
+        while True:
+            running = ~self.collapsed & (self.months_in_office < max_months)
+            if not running.any():
+                break
+            self._advance(running)
+        return self.months_in_office.copy()
+
+    def _advance(self, active: np.ndarray) -> None:
+        """Advance the governments in the active mask by one month."""
+        self.months_in_office[active] += 1
+
+        draws = self.rng.random(self.n_governments)
+        falls = active & (draws < self.collapse_probabilities())
+
+        self.collapsed |= falls
+        self.collapse_reason[falls] = np.where(self.strain[falls] > 0.5, 2, 1)
+
+    def to_frame(self) -> pl.DataFrame:
+        """Per-government summary, mirroring GovernmentSimulator.summary()."""
+        return pl.DataFrame(
+            {
+                "government": np.arange(self.n_governments),
+                "months_in_office": self.months_in_office,
+                "collapsed": self.collapsed,
+                "collapse_reason": [COLLAPSE_REASONS[r] or None for r in self.collapse_reason],
+                "strain": self.strain,
+                "stability": self.stability,
+                "n_events": self.n_events,
+            }
+        )
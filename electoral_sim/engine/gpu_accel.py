@@ -72,11 +72,15 @@ def compute_utilities_gpu(
 def mnl_sample_gpu(
     utilities: np.ndarray,
     temperature: float,
+    random_vals: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Multinomial logit sampling using GPU.
 
     P(j) = exp(U_j/τ) / Σexp(U_k/τ)
+
+    random_vals, if given, are used as the (n_voters,) uniform draws
+    instead of drawing on the GPU.
     """
     if not CUPY_AVAILABLE:
         raise RuntimeError("CuPy not installed. Cannot use GPU acceleration.")
@@ -98,7 +102,10 @@ def mnl_sample_gpu(
     cumprobs = cp.cumsum(probs, axis=1)
 
     # Generate random values on GPU
-    random_vals = cp.random.random((utilities.shape[0], 1), dtype=cp.float32)
+    if random_vals is None:
+        random_vals = cp.random.random((utilities.shape[0], 1), dtype=cp.float32)
+    else:
+        random_vals = cp.asarray(random_vals, dtype=cp.float32)[:, cp.newaxis]
 
     # Perform sampling (find first index where random_val < cumprob)
     votes = (random_vals > cumprobs).sum(axis=1)
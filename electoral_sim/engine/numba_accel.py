@@ -24,6 +24,37 @@ except ImportError:
     prange = range
 
 
+# =============================================================================
+# PRECISION POLICY
+# =============================================================================
+
+# Floating-point types for utility matrices. float32 halves the memory traffic
+# of the utility -> sampling path; float64 is kept for validation runs.
+# Welfare and vote tallies are always accumulated in float64/int64.
+PRECISIONS = {"float32": np.float32, "float64": np.float64}
+
+# Canonical index dtypes. Agent stores keep constituencies as contiguous
+# int32 and votes are sampled into the narrowest integer type that holds a
+# party index; kernels accept these natively, so no per-election casts.
+CONSTITUENCY_DTYPE = np.int32
+
+
+def vote_dtype(n_parties: int) -> type:
+    """Narrowest signed integer type for party indices (int8 up to 127 parties)."""
+    if n_parties <= np.iinfo(np.int8).max:
+        return np.int8
+    if n_parties <= np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+
+def utility_dtype(precision: str) -> type:
+    """NumPy dtype for a precision name ('float32' or 'float64')."""
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {precision}. Use one of {list(PRECISIONS)}")
+    return PRECISIONS[precision]
+
+
 # =============================================================================
 # SEAT ALLOCATION (Numba-accelerated)
 # =============================================================================
@@ -89,7 +120,8 @@ def fptp_count_numba(
     """
     Count FPTP seats - Numba parallel accelerated.
 
-    Uses parallel processing across constituencies.
+    Uses parallel processing across constituencies. Accepts any integer
+    dtypes for constituencies and votes (int32 / int8 from the agent layer).
     """
     seats = np.zeros(n_parties, dtype=np.int64)
 
@@ -129,10 +161,12 @@ def compute_utilities_numba(
     Compute utility matrix using proximity model - Numba parallel.
 
     Utility = -distance + valence_weight * valence
+
+    The utility matrix has the dtype of voter_x (float32 or float64).
     """
     n_voters = len(voter_x)
     n_parties = len(party_x)
-    utilities = np.zeros((n_voters, n_parties), dtype=np.float64)
+    utilities = np.empty((n_voters, n_parties), dtype=voter_x.dtype)
 
     for i in prange(n_voters):
         for p in range(n_parties):
@@ -144,6 +178,75 @@ def compute_utilities_numba(
     return utilities
 
 
+# Distance metrics supported by the fused utility kernel
+DISTANCE_METRICS = {"euclidean": 0, "cityblock": 1}
+
+# Voters per block in the NumPy fallback (bounds temporaries to block x dims)
+_FALLBACK_BLOCK = 65_536
+
+
+def _as_float_array(values: np.ndarray) -> np.ndarray:
+    """Contiguous float32/float64 view of values, copying only when needed."""
+    if values.dtype in (np.float32, np.float64):
+        return np.ascontiguousarray(values)
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def fused_utilities_numba(
+    voter_positions: np.ndarray,
+    party_positions: np.ndarray,
+    distance_weight: float,
+    party_bias: np.ndarray,
+    voter_term: np.ndarray,
+    term_mask: np.ndarray,
+    out: np.ndarray,
+    salience: np.ndarray,
+    metric: int,
+    quadratic_weight: float,
+    directional_weight: float,
+) -> np.ndarray:
+    """
+    Fill a utility matrix from a compiled behavior plan - Numba parallel.
+
+    out[i, p] = -distance_weight * dist(v_i, c_p)
+                - quadratic_weight * ||v_i - c_p||^2
+                + directional_weight * <v_i, c_p>
+                + party_bias[p] + voter_term[i] * term_mask[p]
+
+    dist is the Euclidean (metric 0) or city-block (metric 1) distance; the
+    squared distance and the directional scalar product are taken from the
+    neutral point at the origin. All spatial terms are salience-weighted and
+    accumulated one dimension at a time in a single pass, so memory does not
+    grow with the number of dimensions. An empty salience array means equal
+    weights.
+    """
+    n_voters, dims = voter_positions.shape
+    n_parties = party_positions.shape[0]
+    weighted = salience.shape[0] > 0
+    spatial = distance_weight != 0.0 or quadratic_weight != 0.0 or directional_weight != 0.0
+
+    for i in prange(n_voters):
+        for p in range(n_parties):
+            u = party_bias[p] + voter_term[i] * term_mask[p]
+            if spatial:
+                acc = 0.0
+                sq = 0.0
+                dot = 0.0
+                for d in range(dims):
+                    s = salience[i, d] if weighted else 1.0
+                    diff = voter_positions[i, d] - party_positions[p, d]
+                    sq += s * diff * diff
+                    if metric == 1:
+                        acc += s * abs(diff)
+                    dot += s * voter_positions[i, d] * party_positions[p, d]
+                dist = np.sqrt(sq) if metric == 0 else acc
+                u += directional_weight * dot - distance_weight * dist - quadratic_weight * sq
+            out[i, p] = u
+
+    return out
+
+
 def fptp_count_fast(
     constituencies: np.ndarray,
     votes: np.ndarray,
@@ -156,12 +259,12 @@ def fptp_count_fast(
     Uses Numba when available, else vectorized NumPy with bincount.
     """
     # Vote counts is always fast with bincount
-    vote_counts = np.bincount(votes, minlength=n_parties).astype(np.int64)
+    vote_counts = np.bincount(votes, minlength=n_parties)
 
     if NUMBA_AVAILABLE:
         seats = fptp_count_numba(
-            constituencies.astype(np.int64),
-            votes.astype(np.int64),
+            np.ascontiguousarray(constituencies),
+            np.ascontiguousarray(votes),
             n_constituencies,
             n_parties,
         )
@@ -185,41 +288,125 @@ def fptp_count_fast(
 # =============================================================================
 
 
+# Placeholder for "no eligibility mask" in the sampling kernels
+_ALL_ELIGIBLE = np.zeros((0, 0), dtype=np.bool_)
+_NO_CONSTITUENCIES = np.zeros(0, dtype=CONSTITUENCY_DTYPE)
+
+
+@jit(nopython=True, cache=True)
+def _mnl_choice(
+    utilities: np.ndarray,
+    i: int,
+    temperature: float,
+    r: float,
+    eligible: np.ndarray,
+    c: int,
+) -> int:
+    """
+    Sample voter i's choice by inverting the softmax CDF at r.
+
+    With a non-empty eligible mask, parties with eligible[c, p] False are
+    treated as having -inf utility (probability 0).
+    """
+    n_parties = utilities.shape[1]
+    masked = eligible.shape[0] > 0
+
+    # Compute softmax (numerically stable)
+    max_u = -np.inf
+    fallback = 0
+    for p in range(n_parties):
+        if masked and not eligible[c, p]:
+            continue
+        if masked:
+            fallback = p
+        if utilities[i, p] > max_u:
+            max_u = utilities[i, p]
+
+    exp_sum = 0.0
+    for p in range(n_parties):
+        if masked and not eligible[c, p]:
+            continue
+        exp_sum += np.exp((utilities[i, p] - max_u) / temperature)
+
+    # Compute cumulative probabilities and sample
+    cumprob = 0.0
+    for p in range(n_parties):
+        if masked and not eligible[c, p]:
+            continue
+        prob = np.exp((utilities[i, p] - max_u) / temperature) / exp_sum
+        cumprob += prob
+        if r < cumprob:
+            return p
+    return fallback
+
+
 @jit(nopython=True, cache=True, parallel=True)
 def mnl_sample_numba(
     utilities: np.ndarray,
     temperature: float,
     random_vals: np.ndarray,
+    votes: np.ndarray,
+    constituencies: np.ndarray,
+    eligible: np.ndarray,
 ) -> np.ndarray:
     """
     Multinomial logit sampling - Numba parallel.
 
     P(j) = exp(U_j/τ) / Σexp(U_k/τ)
+
+    Writes choices into votes (any integer dtype). A non-empty
+    (n_constituencies, n_parties) eligible mask, looked up through each
+    voter's constituency, excludes parties from the choice set; pass
+    empty arrays for constituencies and eligible to allow every party.
+    """
+    masked = eligible.shape[0] > 0
+    for i in prange(utilities.shape[0]):
+        c = constituencies[i] if masked else 0
+        votes[i] = _mnl_choice(utilities, i, temperature, random_vals[i], eligible, c)
+
+    return votes
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def mnl_sample_welfare_numba(
+    utilities: np.ndarray,
+    temperature: float,
+    random_vals: np.ndarray,
+    constituencies: np.ndarray,
+    n_constituencies: int,
+    votes: np.ndarray,
+    eligible: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Multinomial logit sampling fused with welfare accumulation - Numba parallel.
+
+    Samples the same votes as mnl_sample_numba() and, in the same pass over
+    the utility matrix, sums each party's utility per constituency. Voters
+    are split into chunks with private accumulators, so no second pass or
+    atomic updates are needed. Choices are written into votes (any integer
+    dtype); the eligible mask restricts choices as in mnl_sample_numba().
+
+    Returns:
+        (votes, welfare) where welfare is (n_constituencies, n_parties)
     """
     n_voters, n_parties = utilities.shape
-    votes = np.zeros(n_voters, dtype=np.int64)
 
-    for i in prange(n_voters):
-        # Compute softmax (numerically stable)
-        max_u = utilities[i, 0]
-        for p in range(1, n_parties):
-            if utilities[i, p] > max_u:
-                max_u = utilities[i, p]
+    n_chunks = max(1, min(n_voters, 64))
+    chunk_size = (n_voters + n_chunks - 1) // n_chunks
+    partial = np.zeros((n_chunks, n_constituencies, n_parties), dtype=np.float64)
 
-        exp_sum = 0.0
-        for p in range(n_parties):
-            exp_sum += np.exp((utilities[i, p] - max_u) / temperature)
+    for k in prange(n_chunks):
+        for i in range(k * chunk_size, min((k + 1) * chunk_size, n_voters)):
+            c = constituencies[i]
+            for p in range(n_parties):
+                partial[k, c, p] += utilities[i, p]
+            votes[i] = _mnl_choice(utilities, i, temperature, random_vals[i], eligible, c)
 
-        # Compute cumulative probabilities and sample
-        cumprob = 0.0
-        for p in range(n_parties):
-            prob = np.exp((utilities[i, p] - max_u) / temperature) / exp_sum
-            cumprob += prob
-            if random_vals[i] < cumprob:
-                votes[i] = p
-                break
+    welfare = np.zeros((n_constituencies, n_parties), dtype=np.float64)
+    for k in range(n_chunks):
+        welfare += partial[k]
 
-    return votes
+    return votes, welfare
 
 
 # =============================================================================
@@ -268,20 +455,249 @@ def sainte_lague_fast(votes: np.ndarray, n_seats: int, threshold: float = 0.0) -
         return seats
 
 
-def vote_mnl_fast(utilities: np.ndarray, temperature: float, rng) -> np.ndarray:
-    """MNL voting with Numba acceleration."""
-    random_vals = rng.random(len(utilities))
+def _mnl_sample_numpy(
+    utilities: np.ndarray,
+    temperature: float,
+    random_vals: np.ndarray,
+    constituencies: np.ndarray | None,
+    eligible: np.ndarray | None,
+) -> np.ndarray:
+    """Vectorized NumPy fallback for mnl_sample()."""
+    if eligible is not None:
+        utilities = np.where(eligible[constituencies], utilities, -np.inf)
+    scaled = utilities / temperature
+    scaled -= scaled.max(axis=1, keepdims=True)
+    exp_utils = np.exp(scaled)
+    probs = exp_utils / exp_utils.sum(axis=1, keepdims=True)
+    cumprobs = np.cumsum(probs, axis=1)
+    votes = (random_vals[:, np.newaxis] > cumprobs).sum(axis=1)
+    return votes.astype(vote_dtype(utilities.shape[1]))
+
+
+def mnl_sample(
+    utilities: np.ndarray,
+    temperature: float,
+    random_vals: np.ndarray,
+    constituencies: np.ndarray | None = None,
+    eligible: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    MNL choices for given uniform draws, optionally restricted per constituency.
+
+    Args:
+        utilities: (n_voters, n_parties) utility matrix
+        temperature: Softmax temperature
+        random_vals: (n_voters,) uniform draws
+        constituencies: (n_voters,) constituency per voter (needed with eligible)
+        eligible: Optional (n_constituencies, n_parties) boolean mask; parties
+            outside a voter's mask get probability 0 (utility -inf)
+
+    Returns:
+        (n_voters,) votes in the narrowest integer dtype (see vote_dtype)
+    """
+    if not NUMBA_AVAILABLE:
+        return _mnl_sample_numpy(utilities, temperature, random_vals, constituencies, eligible)
+
+    votes = np.zeros(len(utilities), dtype=vote_dtype(utilities.shape[1]))
+    if eligible is None:
+        return mnl_sample_numba(
+            utilities, temperature, random_vals, votes, _NO_CONSTITUENCIES, _ALL_ELIGIBLE
+        )
+    return mnl_sample_numba(
+        utilities,
+        temperature,
+        random_vals,
+        votes,
+        np.ascontiguousarray(constituencies),
+        np.ascontiguousarray(eligible, dtype=np.bool_),
+    )
+
+
+def vote_mnl_fast(
+    utilities: np.ndarray,
+    temperature: float,
+    rng,
+    constituencies: np.ndarray | None = None,
+    eligible: np.ndarray | None = None,
+    random_vals: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    MNL voting with Numba acceleration (see mnl_sample for eligibility).
+
+    random_vals, if given, replaces the uniform draws from rng (e.g. to
+    sample a second ballot from the same draws).
+    """
+    if random_vals is None:
+        random_vals = rng.random(len(utilities))
+    return mnl_sample(utilities, temperature, random_vals, constituencies, eligible)
+
+
+def vote_mnl_welfare_fast(
+    utilities: np.ndarray,
+    temperature: float,
+    rng,
+    constituencies: np.ndarray,
+    n_constituencies: int,
+    eligible: np.ndarray | None = None,
+    random_vals: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    MNL voting plus per-constituency welfare sums in one pass.
+
+    Draws the same random numbers as vote_mnl_fast(), so votes are identical.
+    Welfare sums cover every party, eligible or not.
+
+    Returns:
+        (votes, welfare) where welfare is (n_constituencies, n_parties)
+    """
+    if random_vals is None:
+        random_vals = rng.random(len(utilities))
 
     if NUMBA_AVAILABLE:
-        return mnl_sample_numba(utilities, temperature, random_vals)
+        votes = np.zeros(len(utilities), dtype=vote_dtype(utilities.shape[1]))
+        return mnl_sample_welfare_numba(
+            utilities,
+            temperature,
+            random_vals,
+            np.ascontiguousarray(constituencies),
+            n_constituencies,
+            votes,
+            _ALL_ELIGIBLE if eligible is None else np.ascontiguousarray(eligible, dtype=np.bool_),
+        )
     else:
-        # Fallback to vectorized NumPy
-        scaled = utilities / temperature
-        scaled -= scaled.max(axis=1, keepdims=True)
-        exp_utils = np.exp(scaled)
-        probs = exp_utils / exp_utils.sum(axis=1, keepdims=True)
-        cumprobs = np.cumsum(probs, axis=1)
-        return (random_vals[:, np.newaxis] > cumprobs).sum(axis=1)
+        votes = _mnl_sample_numpy(utilities, temperature, random_vals, constituencies, eligible)
+        welfare = np.stack(
+            [
+                np.bincount(constituencies, weights=utilities[:, p], minlength=n_constituencies)
+                for p in range(utilities.shape[1])
+            ],
+            axis=1,
+        )
+        return votes, welfare
+
+
+def fused_utilities_fast(
+    voter_positions: np.ndarray,
+    party_positions: np.ndarray,
+    distance_weight: float,
+    party_bias: np.ndarray,
+    voter_term: np.ndarray,
+    term_mask: np.ndarray,
+    dtype=np.float32,
+    salience: np.ndarray | None = None,
+    metric: str = "euclidean",
+    quadratic_weight: float = 0.0,
+    directional_weight: float = 0.0,
+) -> np.ndarray:
+    """
+    Utility matrix from a compiled behavior plan in one pass.
+
+    Args:
+        voter_positions: (n_voters, dims) voter ideal points
+        party_positions: (n_parties, dims) party positions
+        distance_weight: Total weight of the distance (proximity) term
+        party_bias: (n_parties,) sum of party-only terms
+        voter_term: (n_voters,) sum of voter-only terms
+        term_mask: (n_parties,) parties the voter term applies to (0/1)
+        dtype: Output dtype
+        salience: Optional (n_voters, dims) per-voter issue weights
+        metric: 'euclidean' or 'cityblock'
+        quadratic_weight: Weight of the squared Euclidean distance
+        directional_weight: Weight of the directional scalar product
+
+    Returns:
+        (n_voters, n_parties) utility matrix
+    """
+    if metric not in DISTANCE_METRICS:
+        raise ValueError(f"Unknown metric: {metric}. Use one of {list(DISTANCE_METRICS)}")
+    if voter_positions.shape[1] != party_positions.shape[1]:
+        raise ValueError(
+            f"Voters have {voter_positions.shape[1]} issue dimensions, "
+            f"parties have {party_positions.shape[1]}"
+        )
+
+    n_voters, dims = voter_positions.shape
+    n_parties = len(party_positions)
+    out = np.empty((n_voters, n_parties), dtype=dtype)
+    party_bias = np.ascontiguousarray(party_bias, dtype=np.float64)
+    voter_term = np.ascontiguousarray(voter_term, dtype=np.float64)
+    term_mask = np.ascontiguousarray(term_mask, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        # float32 / float64 voter arrays are used as stored (no per-election copy)
+        return fused_utilities_numba(
+            _as_float_array(voter_positions),
+            np.ascontiguousarray(party_positions, dtype=np.float64),
+            float(distance_weight),
+            party_bias,
+            voter_term,
+            term_mask,
+            out,
+            np.empty((0, dims)) if salience is None else _as_float_array(salience),
+            DISTANCE_METRICS[metric],
+            float(quadratic_weight),
+            float(directional_weight),
+        )
+
+    # NumPy fallback: blocks of voters, one dimension at a time, so no
+    # (n_voters, n_parties, dims) temporary is built
+    for lo in range(0, n_voters, _FALLBACK_BLOCK):
+        hi = min(lo + _FALLBACK_BLOCK, n_voters)
+        block = party_bias[np.newaxis, :] + np.outer(voter_term[lo:hi], term_mask)
+        if distance_weight != 0.0 or quadratic_weight != 0.0 or directional_weight != 0.0:
+            acc = np.zeros((hi - lo, n_parties))
+            sq = np.zeros((hi - lo, n_parties))
+            dot = np.zeros((hi - lo, n_parties))
+            for d in range(dims):
+                s = 1.0 if salience is None else salience[lo:hi, d, np.newaxis]
+                v = voter_positions[lo:hi, d, np.newaxis]
+                c = party_positions[np.newaxis, :, d]
+                sq += s * (v - c) ** 2
+                if metric == "cityblock":
+                    acc += s * np.abs(v - c)
+                dot += s * v * c
+            dist = np.sqrt(sq) if metric == "euclidean" else acc
+            block += directional_weight * dot - distance_weight * dist - quadratic_weight * sq
+        out[lo:hi] = block
+    return out
+
+
+# =============================================================================
+# PLUGIN KERNELS
+# =============================================================================
+
+# Compiled accumulators, keyed by the plugin's scalar function
+_PAIR_KERNELS: dict = {}
+
+
+def compile_pair_utility(func):
+    """
+    Compile a scalar per-(voter, party) utility function into a kernel.
+
+    Args:
+        func: Plain Python function f(voter_row, party_row) -> float, where
+            voter_row and party_row are 1-D float64 arrays holding the
+            plugin's declared columns for one voter and one party
+
+    Returns:
+        kernel(voter_cols, party_cols, weight, out) that adds
+        weight * f(voter_cols[i], party_cols[p]) to out[i, p] in parallel
+    """
+    kernel = _PAIR_KERNELS.get(func)
+    if kernel is not None:
+        return kernel
+
+    scalar = jit(nopython=True)(func)
+
+    @jit(nopython=True, parallel=True)
+    def kernel(voter_cols, party_cols, weight, out):
+        for i in prange(voter_cols.shape[0]):
+            for p in range(party_cols.shape[0]):
+                out[i, p] += weight * scalar(voter_cols[i], party_cols[p])
+        return out
+
+    _PAIR_KERNELS[func] = kernel
+    return kernel
 
 
 # =============================================================================
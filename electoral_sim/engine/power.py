@@ -0,0 +1,194 @@
+"""
+Voting Power Indices
+
+Implements:
+- Banzhaf index (normalized swing counts)
+- Shapley-Shubik index (pivot probabilities over orderings)
+
+Both are computed with pseudo-polynomial dynamic programming over seat
+counts (generating functions) instead of enumerating all 2^n coalitions.
+For each parliament, one table counts the coalitions of every size k and
+seat total s below the quota; each party's own table is recovered from it
+by polynomial division, so the cost is O(n^2 * quota) per parliament.
+Batches of parliaments are processed in parallel.
+
+Ref: Brams & Affuso (1976); Matsui & Matsui (2000), "A survey of algorithms
+for calculating power indices of weighted majority games".
+"""
+
+import numpy as np
+import polars as pl
+
+from electoral_sim.engine.numba_accel import jit, prange
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def _power_indices_numba(seats: np.ndarray, quotas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Banzhaf swing counts and Shapley-Shubik indices for a batch of parliaments.
+
+    Args:
+        seats: (n_parliaments, n_parties) integer seat counts
+        quotas: (n_parliaments,) seats needed to win
+
+    Returns:
+        (swings, shapley) arrays of shape (n_parliaments, n_parties)
+    """
+    n_batch, n = seats.shape
+    swings = np.zeros((n_batch, n), dtype=np.float64)
+    shapley = np.zeros((n_batch, n), dtype=np.float64)
+
+    # Probability that a given ordering has exactly k parties before the pivot:
+    # k! (n - k - 1)! / n! = 1 / (n * C(n - 1, k))
+    order_weight = np.zeros(n, dtype=np.float64)
+    comb = 1.0
+    for k in range(n):
+        order_weight[k] = 1.0 / (n * comb)
+        comb = comb * (n - 1 - k) / (k + 1)
+
+    for b in prange(n_batch):
+        q = quotas[b]
+        if q <= 0:
+            continue
+
+        # counts[k, s]: coalitions of k parties with exactly s seats, for s < q
+        counts = np.zeros((n + 1, q), dtype=np.float64)
+        counts[0, 0] = 1.0
+        for j in range(n):
+            w = seats[b, j]
+            for k in range(j, -1, -1):
+                for s in range(q - 1, w - 1, -1):
+                    counts[k + 1, s] += counts[k, s - w]
+
+        # Divide out each party to count coalitions of the others
+        others = np.zeros((n, q), dtype=np.float64)
+        for i in range(n):
+            w = seats[b, i]
+            for k in range(n):
+                for s in range(q):
+                    others[k, s] = counts[k, s]
+                    if k > 0 and s >= w:
+                        others[k, s] -= others[k - 1, s - w]
+
+            # Party i swings coalitions with q - w <= s < q seats
+            lo = max(q - w, 0)
+            total = 0.0
+            pivots = 0.0
+            for k in range(n):
+                for s in range(lo, q):
+                    total += others[k, s]
+                    pivots += others[k, s] * order_weight[k]
+            swings[b, i] = total
+            shapley[b, i] = pivots
+
+    return swings, shapley
+
+
+def power_indices(
+    seats: np.ndarray,
+    majority_threshold: float = 0.5,
+    quota: int | np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Compute Banzhaf and Shapley-Shubik indices for one or many parliaments.
+
+    Args:
+        seats: (n_parties,) or (n_parliaments, n_parties) integer seat counts
+        majority_threshold: Fraction of seats needed (quota = floor(total * t) + 1)
+        quota: Explicit quota (scalar or per parliament); overrides majority_threshold
+
+    Returns:
+        Dictionary with 'banzhaf', 'shapley_shubik' (both summing to 1 per
+        parliament) and raw 'swings', shaped like seats
+
+    Example:
+        >>> power_indices(np.array([50, 49, 1]))["banzhaf"]
+        array([0.6, 0.2, 0.2])
+    """
+    seats = np.asarray(seats)
+    single = seats.ndim == 1
+    seats = np.atleast_2d(seats).astype(np.int64)
+    if (seats < 0).any():
+        raise ValueError("Seat counts must be non-negative")
+
+    if quota is None:
+        quotas = np.floor(seats.sum(axis=1) * majority_threshold).astype(np.int64) + 1
+    else:
+        quotas = np.broadcast_to(np.asarray(quota, dtype=np.int64), (len(seats),)).copy()
+
+    swings, shapley = _power_indices_numba(seats, quotas)
+
+    swing_totals = swings.sum(axis=1, keepdims=True)
+    banzhaf = np.divide(swings, swing_totals, out=np.zeros_like(swings), where=swing_totals > 0)
+
+    results = {"banzhaf": banzhaf, "shapley_shubik": shapley, "swings": swings}
+    if single:
+        results = {key: value[0] for key, value in results.items()}
+    return results
+
+
+def banzhaf_index(seats: np.ndarray, majority_threshold: float = 0.5) -> np.ndarray:
+    """
+    Normalized Banzhaf index: each party's share of all swings.
+
+    Args:
+        seats: (n_parties,) or (n_parliaments, n_parties) seat counts
+        majority_threshold: Fraction of seats needed for majority
+
+    Returns:
+        Banzhaf indices shaped like seats
+    """
+    return power_indices(seats, majority_threshold)["banzhaf"]
+
+
+def shapley_shubik_index(seats: np.ndarray, majority_threshold: float = 0.5) -> np.ndarray:
+    """
+    Shapley-Shubik index: probability of being pivotal in a random ordering.
+
+    Args:
+        seats: (n_parties,) or (n_parliaments, n_parties) seat counts
+        majority_threshold: Fraction of seats needed for majority
+
+    Returns:
+        Shapley-Shubik indices shaped like seats
+    """
+    return power_indices(seats, majority_threshold)["shapley_shubik"]
+
+
+def power_distribution(
+    results: list[dict] | np.ndarray,
+    party_names: list[str] | None = None,
+    majority_threshold: float = 0.5,
+) -> pl.DataFrame:
+    """
+    Power indices across many simulated parliaments.
+
+    Args:
+        results: Election results (e.g. from run_elections_batch()) or an
+            (n_parliaments, n_parties) seat matrix
+        party_names: Optional party names (default: "Party 0", "Party 1", ...)
+        majority_threshold: Fraction of seats needed for majority
+
+    Returns:
+        Long DataFrame with election, party, seats, banzhaf, shapley_shubik
+    """
+    if isinstance(results, np.ndarray):
+        seats = np.atleast_2d(results)
+    else:
+        seats = np.stack([np.asarray(r["seats"]) for r in results])
+
+    n_elections, n_parties = seats.shape
+    if party_names is None:
+        party_names = [f"Party {p}" for p in range(n_parties)]
+
+    indices = power_indices(seats, majority_threshold)
+
+    return pl.DataFrame(
+        {
+            "election": np.repeat(np.arange(n_elections), n_parties),
+            "party": party_names * n_elections,
+            "seats": seats.ravel().astype(np.int64),
+            "banzhaf": indices["banzhaf"].ravel(),
+            "shapley_shubik": indices["shapley_shubik"].ravel(),
+        }
+    )
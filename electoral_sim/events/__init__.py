@@ -1,3 +1,3 @@
-from electoral_sim.events.event_manager import Event, EventManager
+from electoral_sim.events.event_manager import EVENT_TYPES, Event, EventManager, EventStreams
 
-__all__ = ["Event", "EventManager"]
+__all__ = ["Event", "EventManager", "EventStreams", "EVENT_TYPES"]
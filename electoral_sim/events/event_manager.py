@@ -3,12 +3,35 @@ Event Manager Module
 
 Handles dynamic events such as scandals, economic shocks, and international crises
 that affect election outcomes.
+
+Events are stored as a struct of arrays (type, start, duration, severity,
+target), so expiry, linear decay and per-party modifiers are computed with
+vectorised operations instead of loops over Event objects. The same layout is
+used by EventStreams to hold many independent event streams, one per Monte
+Carlo replicate.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Literal
 
 import numpy as np
+import polars as pl
+
+# Event type codes stored in the "type" column
+EVENT_TYPES = ("scandal", "economic_shock", "international_crisis")
+_SCANDAL = EVENT_TYPES.index("scandal")
+_SHOCK = EVENT_TYPES.index("economic_shock")
+
+# Struct-of-arrays columns and their dtypes (target -1 = no target party)
+_COLUMNS = {
+    "id": np.int64,
+    "type": np.int8,
+    "start": np.int64,
+    "duration": np.int64,
+    "severity": np.float64,
+    "target": np.int64,
+}
 
 
 @dataclass
@@ -28,13 +51,99 @@ class Event:
         return self.start_step + self.duration
 
 
+def _empty_columns() -> dict[str, np.ndarray]:
+    return {name: np.empty(0, dtype=dtype) for name, dtype in _COLUMNS.items()}
+
+
+def _event_columns(events: list[Event]) -> dict[str, np.ndarray]:
+    """Convert Event objects to struct-of-arrays columns."""
+    return {
+        "id": np.array([e.id for e in events], dtype=np.int64),
+        "type": np.array([EVENT_TYPES.index(e.type) for e in events], dtype=np.int8),
+        "start": np.array([e.start_step for e in events], dtype=np.int64),
+        "duration": np.array([e.duration for e in events], dtype=np.int64),
+        "severity": np.array([e.severity for e in events], dtype=np.float64),
+        "target": np.array(
+            [-1 if e.target_party_id is None else e.target_party_id for e in events],
+            dtype=np.int64,
+        ),
+    }
+
+
+def _decayed_impact(
+    start: np.ndarray, duration: np.ndarray, severity: np.ndarray, step: int | np.ndarray
+) -> np.ndarray:
+    """
+    Current impact of each event, decaying linearly from full severity at the
+    start to zero at the end. Events that have not started or have ended
+    contribute zero.
+    """
+    elapsed = step - start
+    active = (elapsed >= 0) & (elapsed < duration)
+    progress = elapsed / np.maximum(duration, 1)
+    return np.where(active, severity * (1.0 - progress), 0.0)
+
+
+def _write_through(method: Callable) -> Callable:
+    """Wrap a list mutator so events it adds or removes are synced to the store."""
+
+    def mutate(self, *args):
+        before = {event.id: event for event in self}
+        result = method(self, *args)
+        after = {event.id: event for event in self}
+        for event_id in before.keys() - after.keys():
+            self._discard(event_id)
+        for event_id in after.keys() - before.keys():
+            self._manager.add_event(after[event_id])
+        return result
+
+    return mutate
+
+
+class _EventList(list):
+    """
+    Materialized events whose mutations write through to the manager's store.
+
+    Events added to the list are added with add_event(); events removed from
+    it (by id) are passed to the view's discard function.
+    """
+
+    def __init__(
+        self, manager: "EventManager", events: list[Event], discard: Callable[[int], None]
+    ):
+        super().__init__(events)
+        self._manager = manager
+        self._discard = discard
+
+    append = _write_through(list.append)
+    extend = _write_through(list.extend)
+    insert = _write_through(list.insert)
+    remove = _write_through(list.remove)
+    pop = _write_through(list.pop)
+    clear = _write_through(list.clear)
+    __setitem__ = _write_through(list.__setitem__)
+    __delitem__ = _write_through(list.__delitem__)
+    __iadd__ = _write_through(list.__iadd__)
+
+
 class EventManager:
     """
     Manages generation and tracking of events.
 
+    Events live in column arrays (see EVENT_TYPES for type codes). Events that
+    have ended are dropped from the live set each step; scheduled events with
+    a future start are kept until they run their course.
+
     Attributes:
+        columns: Struct-of-arrays store of every event (the full history)
         active_events: List of currently active events
-        history: List of past events
+        history: List of events that have started
+        scheduled: List of events with a future start
+
+    The event lists are built from the columns on access and write through:
+    adding an event to one calls add_event(); removing an event from
+    active_events ends it (it stays in history), and removing one from
+    history or scheduled deletes it, as remove_event() does.
     """
 
     def __init__(
@@ -43,11 +152,174 @@ class EventManager:
         self.rng = rng
         self.prob_scandal = prob_scandal
         self.prob_shock = prob_shock
-        self.active_events: list[Event] = []
-        self.history: list[Event] = []
+        self.columns = _empty_columns()
+        self.descriptions: list[str] = []
         self.event_counter = 0
         self.current_step = 0
 
+        # Indices into columns of events that have not yet ended
+        self._live = np.empty(0, dtype=np.int64)
+
+    @classmethod
+    def from_timeline(
+        cls,
+        timeline: list[Event] | pl.DataFrame,
+        rng: np.random.Generator | None = None,
+        prob_scandal: float = 0.0,
+        prob_shock: float = 0.0,
+    ) -> "EventManager":
+        """
+        Replay a deterministic scenario.
+
+        Args:
+            timeline: Events, or a DataFrame with columns type, start_step,
+                duration, severity and optional target_party_id
+            rng: Random generator (only used if random events are enabled)
+            prob_scandal: Per-step probability of additional random scandals
+            prob_shock: Per-step probability of additional random shocks
+
+        Returns:
+            EventManager with the timeline scheduled
+        """
+        manager = cls(rng or np.random.default_rng(), prob_scandal, prob_shock)
+        if isinstance(timeline, pl.DataFrame):
+            target = (
+                timeline["target_party_id"].fill_null(-1).to_numpy()
+                if "target_party_id" in timeline.columns
+                else -1
+            )
+            manager.schedule(
+                timeline["type"].to_list(),
+                timeline["start_step"].to_numpy(),
+                timeline["duration"].to_numpy(),
+                timeline["severity"].to_numpy(),
+                target,
+            )
+        else:
+            for event in timeline:
+                manager.add_event(event)
+        return manager
+
+    # =========================================================================
+    # STORE
+    # =========================================================================
+
+    def _append(self, columns: dict[str, np.ndarray], descriptions: list[str]) -> np.ndarray:
+        """Append event columns; returns their row indices."""
+        n_old = len(self.columns["id"])
+        for name, dtype in _COLUMNS.items():
+            self.columns[name] = np.concatenate([self.columns[name], columns[name].astype(dtype)])
+        self.descriptions.extend(descriptions)
+
+        rows = np.arange(n_old, n_old + len(descriptions))
+        self._live = np.concatenate([self._live, rows])
+        self.event_counter = max(self.event_counter, int(self.columns["id"].max(initial=-1)) + 1)
+        return rows
+
+    def add_event(self, event: Event) -> None:
+        """Add an event (e.g. an injected scandal) to the store."""
+        self._append(_event_columns([event]), [event.description])
+
+    def schedule(
+        self,
+        types: str | list[str] | np.ndarray,
+        start_steps: np.ndarray,
+        durations: np.ndarray,
+        severities: np.ndarray,
+        targets: np.ndarray | int = -1,
+    ) -> np.ndarray:
+        """
+        Schedule many events at once.
+
+        Args:
+            types: Event type names (or one name for all events)
+            start_steps: Step at which each event starts
+            durations: Duration of each event in steps
+            severities: Severity of each event
+            targets: Target party per event (-1 = none)
+
+        Returns:
+            IDs of the scheduled events
+        """
+        start_steps = np.atleast_1d(np.asarray(start_steps, dtype=np.int64))
+        n = len(start_steps)
+        if isinstance(types, str):
+            types = [types] * n
+        codes = np.array([EVENT_TYPES.index(t) for t in types], dtype=np.int8)
+        ids = np.arange(self.event_counter, self.event_counter + n, dtype=np.int64)
+
+        columns = {
+            "id": ids,
+            "type": codes,
+            "start": start_steps,
+            "duration": np.broadcast_to(np.asarray(durations), (n,)),
+            "severity": np.broadcast_to(np.asarray(severities), (n,)),
+            "target": np.broadcast_to(np.asarray(targets), (n,)),
+        }
+        self._append(columns, [""] * n)
+        return ids
+
+    def remove_event(self, event_id: int) -> None:
+        """Delete an event from the store; it no longer appears in any view."""
+        keep = self.columns["id"] != event_id
+        if keep.all():
+            raise ValueError(f"No event with id {event_id}")
+        new_row = np.cumsum(keep) - 1
+        self._live = new_row[self._live[keep[self._live]]]
+        self.columns = {name: col[keep] for name, col in self.columns.items()}
+        self.descriptions = [d for d, k in zip(self.descriptions, keep) if k]
+
+    def _end_event(self, event_id: int) -> None:
+        """Drop an event from the live set; it stays in the store (and history)."""
+        self._live = self._live[self.columns["id"][self._live] != event_id]
+
+    def _events(self, rows: np.ndarray, discard: Callable[[int], None]) -> list[Event]:
+        """Materialize Event objects for the given rows."""
+        cols = self.columns
+        events = [
+            Event(
+                id=int(cols["id"][i]),
+                type=EVENT_TYPES[cols["type"][i]],
+                start_step=int(cols["start"][i]),
+                duration=int(cols["duration"][i]),
+                severity=float(cols["severity"][i]),
+                target_party_id=None if cols["target"][i] < 0 else int(cols["target"][i]),
+                description=self.descriptions[i],
+            )
+            for i in rows
+        ]
+        return _EventList(self, events, discard)
+
+    @property
+    def active_events(self) -> list[Event]:
+        """Events in effect at the current step."""
+        live = self._live
+        active = (self.columns["start"][live] <= self.current_step) & (
+            self.columns["start"][live] + self.columns["duration"][live] > self.current_step
+        )
+        return self._events(live[active], self._end_event)
+
+    @active_events.setter
+    def active_events(self, events: list[Event]) -> None:
+        # Events left out are ended, new ones are added to the store
+        self.active_events[:] = events
+
+    @property
+    def history(self) -> list[Event]:
+        """Events that have started by the current step."""
+        rows = np.flatnonzero(self.columns["start"] <= self.current_step)
+        return self._events(rows, self.remove_event)
+
+    @property
+    def scheduled(self) -> list[Event]:
+        """Events that start after the current step."""
+        rows = np.flatnonzero(self.columns["start"] > self.current_step)
+        return self._events(rows, self.remove_event)
+
+    # =========================================================================
+    # STEP
+    # =========================================================================
+
     def step(self, n_parties: int) -> list[Event]:
         """
         Advance one step, potentially generating new events and expiring old ones.
@@ -59,7 +331,8 @@ class EventManager:
         new_events = []
 
         # 1. Clean up expired events
-        self.active_events = [e for e in self.active_events if e.end_step > self.current_step]
+        end = self.columns["start"][self._live] + self.columns["duration"][self._live]
+        self._live = self._live[end > self.current_step]
 
         # 2. Generate Scanals
         if self.rng.random() < self.prob_scandal:
@@ -67,19 +340,18 @@ class EventManager:
             severity = self.rng.beta(2, 5) * 50  # 0-50 valence penalty
             duration = self.rng.integers(3, 12)  # 3-12 months/steps
 
-            event = Event(
-                id=self.event_counter,
-                type="scandal",
-                start_step=self.current_step,
-                duration=duration,
-                severity=severity,
-                target_party_id=target,
-                description=f"Scandal hitting Party {target} (Severity: {severity:.1f})",
+            new_events.append(
+                Event(
+                    id=self.event_counter,
+                    type="scandal",
+                    start_step=self.current_step,
+                    duration=duration,
+                    severity=severity,
+                    target_party_id=target,
+                    description=f"Scandal hitting Party {target} (Severity: {severity:.1f})",
+                )
             )
-            self.event_counter += 1
-            self.active_events.append(event)
-            self.history.append(event)
-            new_events.append(event)
+            self.add_event(new_events[-1])
 
         # 3. Generate Economic Shocks
         if self.rng.random() < self.prob_shock:
@@ -90,48 +362,188 @@ class EventManager:
             severity = -magnitude if is_negative else magnitude
             duration = self.rng.integers(6, 24)
 
-            event = Event(
-                id=self.event_counter,
-                type="economic_shock",
-                start_step=self.current_step,
-                duration=duration,
-                severity=severity,
-                target_party_id=None,  # Affects incumbent usually
-                description=f"Economic {'Crash' if is_negative else 'Boom'} ({severity:.1f}%)",
+            new_events.append(
+                Event(
+                    id=self.event_counter,
+                    type="economic_shock",
+                    start_step=self.current_step,
+                    duration=duration,
+                    severity=severity,
+                    target_party_id=None,  # Affects incumbent usually
+                    description=f"Economic {'Crash' if is_negative else 'Boom'} ({severity:.1f}%)",
+                )
             )
-            self.event_counter += 1
-            self.active_events.append(event)
-            self.history.append(event)
-            new_events.append(event)
+            self.add_event(new_events[-1])
 
         return new_events
 
-    def get_valence_modifiers(self) -> dict[int, float]:
+    # =========================================================================
+    # MODIFIERS
+    # =========================================================================
+
+    def _live_impacts(self) -> tuple[np.ndarray, np.ndarray]:
+        """(rows, impact) of live events at the current step."""
+        rows = self._live
+        cols = self.columns
+        impact = _decayed_impact(
+            cols["start"][rows], cols["duration"][rows], cols["severity"][rows], self.current_step
+        )
+        return rows, impact
+
+    def get_valence_modifiers(self, n_parties: int) -> np.ndarray:
         """
         Get total valence penalty/bonus for each party from active events.
-        """
-        modifiers = {}
-        for event in self.active_events:
-            if event.type == "scandal" and event.target_party_id is not None:
-                # Decay effect over time?
-                # Simple linear decay: full severity at start, 0 at end
-                progress = (self.current_step - event.start_step) / event.duration
-                current_impact = -event.severity * (1.0 - progress)
 
-                pid = event.target_party_id
-                modifiers[pid] = modifiers.get(pid, 0.0) + current_impact
+        Scandals cost their target party its severity, decaying linearly to
+        zero over the scandal's duration.
+
+        Args:
+            n_parties: Number of parties (targets outside the range are ignored)
 
-        return modifiers
+        Returns:
+            (n_parties,) valence modifiers
+        """
+        rows, impact = self._live_impacts()
+        target = self.columns["target"][rows]
+        hits = (self.columns["type"][rows] == _SCANDAL) & (target >= 0) & (target < n_parties)
+        return 0.0 - np.bincount(target[hits], weights=impact[hits], minlength=n_parties)
 
     def get_economic_modifier(self) -> float:
         """
         Get total modification to economic growth from active shocks.
         """
-        total_shock = 0.0
-        for event in self.active_events:
-            if event.type == "economic_shock":
-                # Decay
-                progress = (self.current_step - event.start_step) / event.duration
-                current_impact = event.severity * (1.0 - progress)
-                total_shock += current_impact
-        return total_shock
+        rows, impact = self._live_impacts()
+        return float(impact[self.columns["type"][rows] == _SHOCK].sum())
+
+
+class EventStreams:
+    """
+    Many independent event streams, one per Monte Carlo replicate.
+
+    Holds every stream's events in one struct of arrays with a stream column,
+    so the modifiers of all replicates at a step are a single bincount.
+
+    Example:
+        streams = EventStreams.sample(n_streams=1000, n_steps=48, n_parties=5, seed=1)
+        valence = streams.valence_modifiers(step=24, n_parties=5)  # (1000, 5)
+        growth = streams.economic_modifiers(step=24)  # (1000,)
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray], stream: np.ndarray, n_streams: int):
+        """
+        Args:
+            columns: Event columns (type, start, duration, severity, target)
+            stream: (n_events,) stream index of each event
+            n_streams: Number of streams
+        """
+        self.columns = {name: np.asarray(columns[name], dtype=_COLUMNS[name]) for name in _COLUMNS}
+        self.stream = np.asarray(stream, dtype=np.int64)
+        self.n_streams = n_streams
+
+    @classmethod
+    def sample(
+        cls,
+        n_streams: int,
+        n_steps: int,
+        n_parties: int,
+        prob_scandal: float = 0.01,
+        prob_shock: float = 0.005,
+        seed: int | None = None,
+    ) -> "EventStreams":
+        """
+        Draw independent random event streams with EventManager's distributions.
+
+        Events start at steps 1..n_steps, as EventManager.step() would create them.
+
+        Args:
+            n_streams: Number of streams (replicates)
+            n_steps: Steps per stream
+            n_parties: Number of parties scandals can target
+            prob_scandal: Per-step scandal probability
+            prob_shock: Per-step economic shock probability
+            seed: Random seed
+
+        Returns:
+            EventStreams
+        """
+        rng = np.random.default_rng(seed)
+
+        # Scandals: target, 0-50 valence penalty, 3-12 steps
+        s_stream, s_step = np.nonzero(rng.random((n_streams, n_steps)) < prob_scandal)
+        n_s = len(s_stream)
+        s_target = rng.integers(0, n_parties, n_s)
+        s_severity = rng.beta(2, 5, n_s) * 50
+        s_duration = rng.integers(3, 12, n_s)
+
+        # Economic shocks: 70% negative, up to 5% GDP shift, 6-24 steps
+        e_stream, e_step = np.nonzero(rng.random((n_streams, n_steps)) < prob_shock)
+        n_e = len(e_stream)
+        sign = np.where(rng.random(n_e) < 0.7, -1.0, 1.0)
+        e_severity = sign * rng.beta(2, 5, n_e) * 5.0
+        e_duration = rng.integers(6, 24, n_e)
+
+        stream = np.concatenate([s_stream, e_stream])
+        order = np.lexsort((np.concatenate([s_step, e_step]), stream))
+        columns = {
+            "id": np.arange(n_s + n_e),
+            "type": np.repeat(np.array([_SCANDAL, _SHOCK]), [n_s, n_e]),
+            "start": np.concatenate([s_step, e_step]) + 1,
+            "duration": np.concatenate([s_duration, e_duration]),
+            "severity": np.concatenate([s_severity, e_severity]),
+            "target": np.concatenate([s_target, np.full(n_e, -1)]),
+        }
+        columns = {name: col[order] for name, col in columns.items()}
+        columns["id"] = np.arange(n_s + n_e)
+        return cls(columns, stream[order], n_streams)
+
+    def _impacts(self, step: int) -> np.ndarray:
+        cols = self.columns
+        return _decayed_impact(cols["start"], cols["duration"], cols["severity"], step)
+
+    def valence_modifiers(self, step: int, n_parties: int) -> np.ndarray:
+        """
+        Valence modifiers of every stream at a step.
+
+        Returns:
+            (n_streams, n_parties) valence modifiers
+        """
+        impact = self._impacts(step)
+        target = self.columns["target"]
+        hits = (self.columns["type"] == _SCANDAL) & (target >= 0) & (target < n_parties)
+        flat = self.stream[hits] * n_parties + target[hits]
+        modifiers = np.bincount(flat, weights=impact[hits], minlength=self.n_streams * n_parties)
+        return 0.0 - modifiers.reshape(self.n_streams, n_parties)
+
+    def economic_modifiers(self, step: int) -> np.ndarray:
+        """
+        Economic growth modifiers of every stream at a step.
+
+        Returns:
+            (n_streams,) growth modifiers
+        """
+        impact = self._impacts(step)
+        shocks = self.columns["type"] == _SHOCK
+        return np.bincount(self.stream[shocks], weights=impact[shocks], minlength=self.n_streams)
+
+    def manager(self, stream: int, rng: np.random.Generator | None = None) -> EventManager:
+        """EventManager replaying one stream (no additional random events)."""
+        rows = np.flatnonzero(self.stream == stream)
+        manager = EventManager(rng or np.random.default_rng(), prob_scandal=0.0, prob_shock=0.0)
+        manager._append({name: col[rows] for name, col in self.columns.items()}, [""] * len(rows))
+        return manager
+
+    def to_frame(self) -> pl.DataFrame:
+        """Events of all streams as a DataFrame."""
+        cols = self.columns
+        return pl.DataFrame(
+            {
+                "stream": self.stream,
+                "type": [EVENT_TYPES[t] for t in cols["type"]],
+                "start_step": cols["start"],
+                "duration": cols["duration"],
+                "severity": cols["severity"],
+                "target_party_id": pl.Series(
+                    np.where(cols["target"] >= 0, cols["target"], None).tolist(), dtype=pl.Int64
+                ),
+            }
+        )
@@ -6,6 +6,7 @@ from electoral_sim.metrics.indices import (
     gallagher_index,
     herfindahl_hirschman_index,
     loosemore_hanby_index,
+    partisan_bias,
     seat_share,
     seats_votes_ratio,
     turnout_rate,
@@ -18,6 +19,7 @@ __all__ = [
     "effective_number_of_parties",
     "herfindahl_hirschman_index",
     "efficiency_gap",
+    "partisan_bias",
     "turnout_rate",
     "vote_share",
     "seat_share",
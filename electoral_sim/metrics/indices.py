@@ -94,7 +94,7 @@ def efficiency_gap(
     party_a_votes: np.ndarray,
     party_b_votes: np.ndarray,
     party_a_seats: np.ndarray,
-) -> float:
+) -> float | np.ndarray:
     """
     Efficiency Gap for gerrymandering detection.
 
@@ -104,32 +104,43 @@ def efficiency_gap(
     Note: >7% threshold suggests potential gerrymandering
 
     Args:
-        party_a_votes: Votes for party A in each district
+        party_a_votes: Votes for party A in each district; (n_plans, n_districts)
+            scores many plans at once
         party_b_votes: Votes for party B in each district
         party_a_seats: Binary array (1 if A won, 0 if B won)
 
     Returns:
-        Efficiency gap (-1 to 1, positive favors A)
+        Efficiency gap (-1 to 1, positive when A wastes more votes), one per plan
+        for 2-D input
     """
-    total_votes = party_a_votes.sum() + party_b_votes.sum()
+    votes_a = np.asarray(party_a_votes)
+    votes_b = np.asarray(party_b_votes)
+    a_won = np.asarray(party_a_seats) == 1
+    votes_to_win = (votes_a + votes_b) // 2 + 1
 
-    a_wasted = 0
-    b_wasted = 0
+    # Winners waste their surplus, losers every vote
+    a_wasted = np.where(a_won, votes_a - votes_to_win, votes_a).sum(axis=-1)
+    b_wasted = np.where(a_won, votes_b, votes_b - votes_to_win).sum(axis=-1)
+    return (a_wasted - b_wasted) / (votes_a.sum(axis=-1) + votes_b.sum(axis=-1))
 
-    for i in range(len(party_a_seats)):
-        votes_a = party_a_votes[i]
-        votes_b = party_b_votes[i]
-        district_total = votes_a + votes_b
-        votes_to_win = district_total // 2 + 1
 
-        if party_a_seats[i] == 1:  # A won
-            a_wasted += votes_a - votes_to_win  # Surplus votes
-            b_wasted += votes_b  # All losing votes
-        else:  # B won
-            b_wasted += votes_b - votes_to_win
-            a_wasted += votes_a
+def partisan_bias(district_shares: np.ndarray) -> float | np.ndarray:
+    """
+    Partisan bias of the seats-votes curve at an even vote.
+
+    District shares are moved by a uniform swing until party A averages 50%;
+    the bias is A's seat share at that point minus 50%.
+
+    Args:
+        district_shares: Party A's two-party vote share in each district;
+            (n_plans, n_districts) scores many plans at once
 
-    return (a_wasted - b_wasted) / total_votes
+    Returns:
+        Partisan bias (-0.5 to 0.5, positive favors A), one per plan for 2-D input
+    """
+    shares = np.asarray(district_shares, dtype=float)
+    swung = shares - shares.mean(axis=-1, keepdims=True) + 0.5
+    return (swung > 0.5).mean(axis=-1) - 0.5
 
 
 def turnout_rate(votes_cast: int, eligible_voters: int) -> float:
@@ -4,6 +4,8 @@
 # EU Parliament
 from electoral_sim.presets.eu.election import (
     EU_MEMBER_STATES,
+    EU_NATIONAL_METHODS,
+    EU_NATIONAL_THRESHOLDS,
     EU_POLITICAL_GROUPS,
     EUElectionResult,
     simulate_eu_election,
@@ -23,6 +25,12 @@ from electoral_sim.presets.uk.config import UK_PARTIES, uk_config
 
 # USA
 from electoral_sim.presets.usa.config import USA_PARTIES, usa_config
+from electoral_sim.presets.usa.election import (
+    USA_DISTRICT_STATES,
+    USA_STATES,
+    USAPresidentialResult,
+    simulate_usa_presidential,
+)
 
 __all__ = [
     # India
@@ -35,9 +43,15 @@ __all__ = [
     "EUElectionResult",
     "EU_MEMBER_STATES",
     "EU_POLITICAL_GROUPS",
+    "EU_NATIONAL_METHODS",
+    "EU_NATIONAL_THRESHOLDS",
     # USA
     "usa_config",
     "USA_PARTIES",
+    "simulate_usa_presidential",
+    "USAPresidentialResult",
+    "USA_STATES",
+    "USA_DISTRICT_STATES",
     # UK
     "uk_config",
     "UK_PARTIES",
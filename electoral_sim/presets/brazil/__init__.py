@@ -1,3 +1,7 @@
-from electoral_sim.presets.brazil.config import BRAZIL_PARTIES, brazil_config
+from electoral_sim.presets.brazil.config import (
+    BRAZIL_PARTIES,
+    brazil_config,
+    brazil_presidential_config,
+)
 
-__all__ = ["brazil_config", "BRAZIL_PARTIES"]
+__all__ = ["brazil_config", "brazil_presidential_config", "BRAZIL_PARTIES"]
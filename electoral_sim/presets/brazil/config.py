@@ -1,4 +1,4 @@
-"""Brazil Election Preset - Chamber of Deputies."""
+"""Brazil Election Presets - Chamber of Deputies and Presidency."""
 
 from electoral_sim.core.config import Config, PartyConfig
 
@@ -33,6 +33,34 @@ def brazil_config(
     )
 
 
+def brazil_presidential_config(
+    n_voters: int = 300_000,
+    **kwargs,
+) -> Config:
+    """
+    Preset configuration for Brazil (Presidency).
+
+    One national constituency, Two-Round System: an absolute majority of
+    valid votes wins in the first round, otherwise the top two meet in a
+    runoff sampled from the first round's utilities.
+    """
+    parties = [
+        PartyConfig("PT", -0.4, 0.2, 60),
+        PartyConfig("PL", 0.5, 0.4, 60),
+        PartyConfig("MDB", 0.0, 0.0, 45),
+        PartyConfig("PDT", -0.3, 0.0, 40),
+        PartyConfig("União Brasil", 0.1, -0.1, 40),
+    ]
+
+    return Config(
+        n_voters=n_voters,
+        n_constituencies=1,
+        parties=parties,
+        electoral_system="TRS",
+        **kwargs,
+    )
+
+
 BRAZIL_PARTIES = {
     "PT": {"position_x": -0.4, "position_y": 0.2, "valence": 60},
     "PL": {"position_x": 0.5, "position_y": 0.4, "valence": 60},
@@ -2,6 +2,8 @@
 
 from electoral_sim.presets.eu.election import (
     EU_MEMBER_STATES,
+    EU_NATIONAL_METHODS,
+    EU_NATIONAL_THRESHOLDS,
     EU_POLITICAL_GROUPS,
     EUElectionResult,
     simulate_eu_election,
@@ -12,4 +14,6 @@ __all__ = [
     "EUElectionResult",
     "EU_MEMBER_STATES",
     "EU_POLITICAL_GROUPS",
+    "EU_NATIONAL_METHODS",
+    "EU_NATIONAL_THRESHOLDS",
 ]
@@ -13,6 +13,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from electoral_sim.core.regional import Region, RegionalElection
+
 # =============================================================================
 # EU PARLIAMENT DATA
 # =============================================================================
@@ -184,6 +186,35 @@ COUNTRY_GROUP_WEIGHTS = {
 }
 
 
+# National electoral rules (approximate, 2024). Countries not listed use D'Hondt
+# without a threshold; Ireland and Malta use STV, which is not modelled here.
+EU_NATIONAL_METHODS = {
+    "Germany": "sainte_lague",
+    "Sweden": "sainte_lague",
+    "Latvia": "sainte_lague",
+    "Italy": "hare",
+    "Lithuania": "hare",
+    "Cyprus": "hare",
+}
+
+EU_NATIONAL_THRESHOLDS = {
+    "France": 0.05,
+    "Poland": 0.05,
+    "Czech Republic": 0.05,
+    "Hungary": 0.05,
+    "Lithuania": 0.05,
+    "Romania": 0.05,
+    "Slovakia": 0.05,
+    "Croatia": 0.05,
+    "Latvia": 0.05,
+    "Italy": 0.04,
+    "Austria": 0.04,
+    "Sweden": 0.04,
+    "Greece": 0.03,
+    "Cyprus": 0.018,
+}
+
+
 @dataclass
 class EUElectionResult:
     """Results of EU Parliament election simulation."""
@@ -233,39 +264,94 @@ class EUElectionResult:
         return "\n".join(lines)
 
 
+def _country_turnout(base_turnout: float) -> float:
+    """
+    Mean of clip(2 * base_turnout * Beta(3, 3), 0.2, 0.9), the per-voter turnout probability.
+
+    The Beta(3, 3) density 30 x^2 (1 - x)^2 is integrated with the midpoint rule.
+    """
+    x = (np.arange(10_000) + 0.5) / 10_000
+    density = 30 * x**2 * (1 - x) ** 2
+    return float(np.mean(np.clip(2 * base_turnout * x, 0.2, 0.9) * density))
+
+
+def _random_turnout(rng: np.random.Generator) -> float:
+    """Mean turnout of one country (EU average ~50%, varies by country)."""
+    return _country_turnout(0.50 + rng.normal(0, 0.1))
+
+
 def simulate_eu_election(
     n_voters_per_mep: int = 5000,
     seed: int | None = None,
     verbose: bool = True,
+    allocation_method: str | dict[str, str] = "dhondt",
+    threshold: float | dict[str, float] = 0.0,
+    n_jobs: int = 1,
 ) -> EUElectionResult:
     """
     Simulate European Parliament Election.
 
+    Member states are the regions of a RegionalElection: ballots are tallied
+    per country with one bincount and all 27 national allocations run in a
+    single allocate_seats_batch() call.
+
     Args:
         n_voters_per_mep: Voters simulated per MEP seat (affects accuracy vs speed)
-            - 1000 = quick (~5 seconds)
-            - 5000 = normal (~15 seconds)
-            - 20000 = detailed (~60 seconds)
+            - 1000 = quick
+            - 5000 = normal
+            - 20000 = detailed (14.4M voters)
         seed: Random seed for reproducibility
         verbose: Print progress
+        allocation_method: Method for every country, or a {country: method}
+            dict (countries not listed use D'Hondt); see EU_NATIONAL_METHODS
+        threshold: National threshold for every country, or a {country: share}
+            dict (countries not listed have none); see EU_NATIONAL_THRESHOLDS
+        n_jobs: Worker processes for simulating countries (1 = sequential);
+            results are identical for any value
 
     Returns:
         EUElectionResult with full results
     """
     from electoral_sim.metrics.indices import effective_number_of_parties, gallagher_index
 
-    rng = np.random.default_rng(seed)
-
-    # Prepare group list
     group_names = list(EU_POLITICAL_GROUPS.keys())
-    n_groups = len(group_names)
-
-    # Results storage
-    all_seats = dict.fromkeys(group_names, 0)
-    all_votes = dict.fromkeys(group_names, 0)
-    country_results = {}
-    total_voters = 0
-    total_voted = 0
+    countries = list(EU_MEMBER_STATES)
+    total_meps = sum(EU_MEMBER_STATES.values())
+
+    if isinstance(allocation_method, dict):
+        methods = [allocation_method.get(c, "dhondt") for c in countries]
+    else:
+        methods = [allocation_method] * len(countries)
+    if isinstance(threshold, dict):
+        thresholds = [threshold.get(c, 0.0) for c in countries]
+    else:
+        thresholds = [threshold] * len(countries)
+
+    regions = []
+    for k, (country, meps) in enumerate(EU_MEMBER_STATES.items()):
+        # Country-specific group strength, normalised over all groups (5% for missing)
+        weights = COUNTRY_GROUP_WEIGHTS.get(country, COUNTRY_GROUP_WEIGHTS["_default"])
+        strength = np.array([weights.get(g, 0.05) for g in group_names])
+        strength /= strength.sum()
+        regions.append(
+            Region(
+                name=country,
+                seats=meps,
+                party_weights=dict(zip(group_names, strength)),
+                # Voters turn out independently of their choice
+                turnout=_random_turnout,
+                allocation=methods[k],
+                threshold=thresholds[k],
+            )
+        )
+
+    election = RegionalElection(
+        EU_POLITICAL_GROUPS,
+        regions,
+        voters_per_seat=n_voters_per_mep,
+        temperature=0.5,
+        n_jobs=n_jobs,
+    )
 
     start_time = time.perf_counter()
 
@@ -273,108 +359,32 @@ def simulate_eu_election(
         print("🇪🇺 Simulating EU Parliament Election (720 MEPs, 27 States)")
         print("=" * 60)
 
-    # Simulate each member state
-    for country, n_meps in EU_MEMBER_STATES.items():
-        if verbose:
-            print(f"  {country} ({n_meps} MEPs)...", end=" ", flush=True)
-
-        country_start = time.perf_counter()
-
-        # Get group weights for this country
-        weights = COUNTRY_GROUP_WEIGHTS.get(country, COUNTRY_GROUP_WEIGHTS["_default"])
-
-        # Normalize weights to include all groups
-        normalized_weights = {}
-        for g in group_names:
-            normalized_weights[g] = weights.get(g, 0.05)  # Default 5% for missing
-        total_w = sum(normalized_weights.values())
-        normalized_weights = {k: v / total_w for k, v in normalized_weights.items()}
-
-        # Create voters
-        n_voters = n_voters_per_mep * n_meps
-        total_voters += n_voters
-
-        # Generate voter ideologies
-        ideology_x = rng.normal(0, 0.3, n_voters)
-        ideology_y = rng.normal(0, 0.3, n_voters)
-
-        # Compute utilities for each group
-        utilities = np.zeros((n_voters, n_groups))
-        for g, group in enumerate(group_names):
-            gx = EU_POLITICAL_GROUPS[group]["position_x"]
-            gy = EU_POLITICAL_GROUPS[group]["position_y"]
-            val = EU_POLITICAL_GROUPS[group]["valence"]
-
-            # Distance-based utility
-            dist = np.sqrt((ideology_x - gx) ** 2 + (ideology_y - gy) ** 2)
-            utility = -dist * 0.3 + 0.005 * val
-
-            # Country-specific group strength
-            weight = normalized_weights.get(group, 0.05)
-            utility += weight * 3.0
-
-            utilities[:, g] = utility
-
-        # MNL voting
-        temperature = 0.5
-        scaled = utilities / temperature
-        scaled -= scaled.max(axis=1, keepdims=True)
-        exp_utils = np.exp(scaled)
-        probs = exp_utils / exp_utils.sum(axis=1, keepdims=True)
-
-        # Sample votes
-        cumprobs = np.cumsum(probs, axis=1)
-        random_vals = rng.random((n_voters, 1))
-        votes = (random_vals > cumprobs).sum(axis=1)
-
-        # Turnout (EU average ~50%, varies by country)
-        base_turnout = 0.50 + rng.normal(0, 0.1)  # Country variation
-        turnout_prob = np.clip(rng.beta(3, 3, n_voters) * base_turnout * 2, 0.2, 0.9)
-        will_vote = rng.random(n_voters) < turnout_prob
-        voted_count = will_vote.sum()
-        total_voted += voted_count
-
-        # Count votes
-        country_votes = dict.fromkeys(group_names, 0)
-        valid_votes = votes[will_vote]
-        for v in valid_votes:
-            country_votes[group_names[v]] += 1
-
-        # Allocate seats using D'Hondt (most common in EU)
-        vote_counts = np.array([country_votes[g] for g in group_names])
-
-        # D'Hondt allocation
-        seats = np.zeros(n_groups, dtype=int)
-        for _ in range(n_meps):
-            quotients = vote_counts / (seats + 1)
-            winner = np.argmax(quotients)
-            seats[winner] += 1
-
-        country_seats = {group_names[i]: int(seats[i]) for i in range(n_groups)}
-
-        # Aggregate
-        for group in group_names:
-            all_seats[group] += country_seats[group]
-            all_votes[group] += country_votes[group]
-
-        country_results[country] = {
-            "seats": country_seats,
-            "votes": country_votes,
-            "turnout": voted_count / n_voters,
+    # (27, n_groups) vote matrix, allocated in one batched call
+    result = election.run(seed)
+    votes, seats = result.votes, result.seats
+
+    country_results = {
+        country: {
+            "seats": dict(zip(group_names, seats[k].tolist())),
+            "votes": dict(zip(group_names, votes[k].tolist())),
+            "turnout": float(votes[k].sum() / result.voters[k]),
+            "method": methods[k],
+            "threshold": float(thresholds[k]),
         }
+        for k, country in enumerate(countries)
+    }
 
-        country_time = time.perf_counter() - country_start
-        if verbose:
-            top_group = max(country_seats.items(), key=lambda x: x[1])
-            print(f"done ({country_time*1000:.0f}ms) - {top_group[0]}: {top_group[1]}")
+    if verbose:
+        for k, country in enumerate(countries):
+            top = int(seats[k].argmax())
+            meps = EU_MEMBER_STATES[country]
+            print(f"  {country:16} ({meps:>2} MEPs) {group_names[top]}: {seats[k, top]}")
 
     # Calculate metrics
-    total_votes_cast = sum(all_votes.values())
-    vote_shares = {g: v / total_votes_cast for g, v in all_votes.items()}
-    seat_shares = {g: s / 720 for g, s in all_seats.items()}
-
-    vote_array = np.array(list(vote_shares.values()))
-    seat_array = np.array(list(seat_shares.values()))
+    all_votes = votes.sum(axis=0)
+    all_seats = dict(zip(group_names, seats.sum(axis=0).tolist()))
+    vote_array = all_votes / all_votes.sum()
+    seat_array = seats.sum(axis=0) / total_meps
 
     gal_idx = gallagher_index(vote_array, seat_array)
     enp_v = effective_number_of_parties(vote_array)
@@ -394,9 +404,9 @@ def simulate_eu_election(
 
     return EUElectionResult(
         seats=all_seats,
-        vote_shares=vote_shares,
+        vote_shares=dict(zip(group_names, vote_array.tolist())),
         country_results=country_results,
-        turnout=total_voted / total_voters,
+        turnout=result.turnout,
         gallagher_index=gal_idx,
         enp_votes=enp_v,
         enp_seats=enp_s,
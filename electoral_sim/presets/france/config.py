@@ -6,12 +6,16 @@ from electoral_sim.core.config import Config, PartyConfig
 def france_config(
     n_voters: int = 300_000,
     n_constituencies: int = 577,
+    runoff_qualify: float = 0.125,  # Share of registered voters reaching round two
     **kwargs,
 ) -> Config:
     """
     Preset configuration for France (National Assembly).
 
-    577 constituencies, Two-Round System (simulated as FPTP with major alliances).
+    577 constituencies, Two-Round System: a first-round majority wins
+    outright; otherwise the top two and every candidate with 12.5% of
+    registered voters go to a second round, sampled from the first round's
+    utilities restricted to the qualifiers.
     """
     parties = [
         PartyConfig("NFP", -0.5, 0.3, 60),  # Left Alliance
@@ -24,7 +28,8 @@ def france_config(
         n_voters=n_voters,
         n_constituencies=n_constituencies,
         parties=parties,
-        electoral_system="FPTP",
+        electoral_system="TRS",
+        runoff_qualify=runoff_qualify,
         **kwargs,
     )
 
@@ -6,12 +6,16 @@ from electoral_sim.core.config import Config, PartyConfig
 def germany_config(
     n_voters: int = 500_000,
     n_constituencies: int = 299,  # Direct mandates
+    list_temperature: float = 0.6,  # Second votes: more ticket splitting
     **kwargs,
 ) -> Config:
     """
     Preset configuration for Germany (Bundestag).
 
-    MMP system with 5% threshold.
+    MMP: first votes elect 299 districts by plurality, second votes fill a
+    598-seat house by Sainte-Laguë with a 5% threshold or 3 district seats
+    (basic-mandate clause), and overhang is compensated by levelling seats.
+    Second votes are a little noisier than first votes (ticket splitting).
     """
     parties = [
         PartyConfig("CDU/CSU", 0.2, 0.1, 50),
@@ -26,9 +30,10 @@ def germany_config(
         n_voters=n_voters,
         n_constituencies=n_constituencies,
         parties=parties,
-        electoral_system="PR",
+        electoral_system="MMP",
         allocation_method="sainte_lague",
         threshold=0.05,
+        list_temperature=list_temperature,
         **kwargs,
     )
 
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 import numpy as np
 import polars as pl
 
+from electoral_sim.core.regional import Region, RegionalElection
+
 # =============================================================================
 # INDIA ELECTION DATA
 # =============================================================================
@@ -181,6 +183,21 @@ def get_phase_states() -> dict[int, list[str]]:
     return INDIA_ELECTION_PHASES.copy()
 
 
+# State-level ideology shifts (x, y)
+RIGHT_LEANING_STATES = ("Gujarat", "Rajasthan", "Madhya Pradesh", "Uttar Pradesh")
+LEFT_LEANING_STATES = ("Kerala", "West Bengal", "Tamil Nadu")
+
+# Alliances
+NDA_PARTIES = {"BJP", "JD(U)", "TDP", "SAD"}
+INDIA_BLOC_PARTIES = {"INC", "AAP", "TMC", "DMK", "SP", "RJD", "SS-UBT", "NCP-SP", "JMM"}
+
+# Mean turnout probability, 0.85 * E[Beta(5, 2.5)] (~57%)
+TURNOUT_RATE = 0.85 * 5 / 7.5
+
+# Voters per state kept in IndiaElectionResult.voter_df
+VOTER_SAMPLE_SIZE = 100
+
+
 @dataclass
 class IndiaElectionResult:
     """Results of India general election simulation."""
@@ -200,6 +217,8 @@ class IndiaElectionResult:
     nota_contested_list: list[str] = field(default_factory=list)  # List of "State: Constituency #"
     voter_df: pl.DataFrame | None = None
     party_positions: np.ndarray | None = None
+    # One row per PC: state, constituency, winner, runner_up, margin, nota_votes, votes_cast
+    constituency_results: pl.DataFrame | None = None
 
     def __str__(self):
         lines = ["=" * 60]
@@ -248,10 +267,15 @@ def simulate_india_election(
     include_nota: bool = False,  # NEW: Enable NOTA tracking
     use_real_names: bool = True,  # TECHNICAL: Use real constituency names
     historical_data_path: str | None = None,  # TECHNICAL: Seed with historical data
+    n_jobs: int = 1,
 ) -> IndiaElectionResult:
     """
     Simulate India General Election.
 
+    States are the regions of a RegionalElection: all 543 constituencies are
+    tallied into one (constituency x party) matrix, and winners, runners-up,
+    NOTA margins and state totals are computed from it in vectorised form.
+
     Args:
         n_voters_per_constituency: Voters per constituency
         seed: Random seed
@@ -259,6 +283,8 @@ def simulate_india_election(
         include_nota: Include NOTA
         use_real_names: Use real PC names
         historical_data_path: Path to CSV with previous results
+        n_jobs: Worker processes for simulating states (1 = sequential);
+            results are identical for any value
 
     Returns:
         IndiaElectionResult with full results
@@ -271,262 +297,157 @@ def simulate_india_election(
 
     # Load historical seeding if provided
     viability_seeding = None
-    pc_viability = {}
     incumbent_parties = set()
     if historical_data_path:
         loader = HistoricalDataLoader(historical_data_path)
         viability_seeding = loader.get_viability_weights()
-        pc_viability = loader.get_constituency_viability()
         incumbent_parties = set(loader.get_incumbents())
         if verbose:
             print(f"  Seeded with historical data from {historical_data_path}")
 
-    rng = np.random.default_rng(seed)
-
-    # Prepare party list
-    party_names = list(INDIA_PARTIES.keys())
-    party_data = [
-        {
-            "name": name,
-            "position_x": data["position_x"],
-            "position_y": data["position_y"],
-            "valence": data["valence"],
-            "incumbent": name in incumbent_parties,
-            "viability": viability_seeding.get(name, 0.05) if viability_seeding else None,
-        }
-        for name, data in INDIA_PARTIES.items()
-    ]
-
-    # Add NOTA if enabled
+    # NOTA is a protest vote - small but universal appeal, lower than active parties
+    parties = dict(INDIA_PARTIES)
+    party_bias = {}
     if include_nota:
-        party_names.append("NOTA")
-        party_data.append(
-            {
-                "name": "NOTA",
-                "position_x": 0.0,
-                "position_y": 0.0,
-                "valence": 15,  # Low valence - protest vote
-            }
+        parties["NOTA"] = {"position_x": 0.0, "position_y": 0.0, "valence": 15}
+        party_bias["NOTA"] = -1.0
+    if viability_seeding:
+        # Boost based on national viability
+        for name in parties:
+            party_bias[name] = party_bias.get(name, 0.0) + 0.5 * viability_seeding.get(name, 0.0)
+    party_names = list(parties)
+
+    # States: seats, ideology shift, party strength (main factor)
+    regions = [
+        Region(
+            name=state,
+            seats=n_seats,
+            party_weights=STATE_PARTY_WEIGHTS.get(state, DEFAULT_WEIGHTS),
+            ideology_shift=(
+                (0.1, 0.1)
+                if state in RIGHT_LEANING_STATES
+                else (-0.1, 0.0) if state in LEFT_LEANING_STATES else (0.0, 0.0)
+            ),
+            # Each voter votes with probability 0.85 * Beta(5, 2.5)
+            turnout=TURNOUT_RATE,
         )
-
-    n_parties = len(party_names)
-
-    # Results storage
-    all_seats = dict.fromkeys(party_names, 0)
-    all_votes = dict.fromkeys(party_names, 0)
-    state_results = {}
-    total_voters = 0
-    total_voted = 0
-
-    # NOTA close race tracking
-    nota_contested_seats = 0
-    nota_contested_list = []
+        for state, n_seats in INDIA_STATES.items()
+    ]
+    states = list(INDIA_STATES)
+    n_constituencies = sum(INDIA_STATES.values())
+
+    election = RegionalElection(
+        parties,
+        regions,
+        voters_per_seat=n_voters_per_constituency,
+        temperature=0.5,  # Makes elections more competitive
+        party_bias=party_bias,
+        seatless=("NOTA",),
+        n_jobs=n_jobs,
+    )
 
     start_time = time.perf_counter()
+    if verbose:
+        print(f"  Simulating {len(states)} states ({n_constituencies} seats)...", flush=True)
 
-    global_const_id = 0
-    voter_df_sample = None
-    # Simulate each state
-    for state, n_constituencies in INDIA_STATES.items():
-        if verbose:
-            print(f"  Simulating {state} ({n_constituencies} seats)...", end=" ", flush=True)
-
-        state_start = time.perf_counter()
-
-        # Get party weights for this state
-        state_weights = STATE_PARTY_WEIGHTS.get(state, DEFAULT_WEIGHTS)
-
-        # Create voters with state-specific ideology distribution
-        n_voters = n_voters_per_constituency * n_constituencies
-        total_voters += n_voters
-
-        # Generate voter ideologies influenced by state patterns
-        base_ideology_x = rng.normal(0, 0.3, n_voters)
-        base_ideology_y = rng.normal(0, 0.3, n_voters)
-
-        # State-specific shifts
-        if state in ["Gujarat", "Rajasthan", "Madhya Pradesh", "Uttar Pradesh"]:
-            base_ideology_x += 0.1  # Slightly right-leaning
-            base_ideology_y += 0.1  # Slightly conservative
-        elif state in ["Kerala", "West Bengal", "Tamil Nadu"]:
-            base_ideology_x -= 0.1  # Slightly left-leaning
-
-        # Assign constituency
-        constituencies = rng.integers(0, n_constituencies, n_voters)
-
-        # Compute utilities for each party
-        utilities = np.zeros((n_voters, n_parties))
-        for p, party in enumerate(party_names):
-            # Handle NOTA separately (not in INDIA_PARTIES dict)
-            if party == "NOTA":
-                px, py, val = 0.0, 0.0, 15.0
-            else:
-                px = INDIA_PARTIES[party]["position_x"]
-                py = INDIA_PARTIES[party]["position_y"]
-                val = INDIA_PARTIES[party]["valence"]
-
-            # Distance-based utility (smaller weight)
-            dist = np.sqrt((base_ideology_x - px) ** 2 + (base_ideology_y - py) ** 2)
-            utility = -dist * 0.3 + 0.005 * val
-
-            # State-specific party strength (main factor)
-            if party == "NOTA":
-                # NOTA is a protest vote - small but universal appeal
-                utility -= 1.0  # Lower than active parties
-            else:
-                # Use PC-level weights if available, else state weights
-                # This is a bit complex in vectorized form, so we simplify:
-                # If we have historical data for ANY party in this state, use it.
-                if party in state_weights:
-                    utility += state_weights[party] * 3.0
-
-                # Boost based on national viability if historical seeding used
-                if viability_seeding and party in viability_seeding:
-                    utility += viability_seeding[party] * 0.5
-
-            utilities[:, p] = utility
-
-        # MNL voting (higher temperature = more randomness/closer races)
-        temperature = 0.5  # Makes elections more competitive
-        scaled = utilities / temperature
-        scaled -= scaled.max(axis=1, keepdims=True)
-        exp_utils = np.exp(scaled)
-        probs = exp_utils / exp_utils.sum(axis=1, keepdims=True)
-
-        # Sample votes
-        cumprobs = np.cumsum(probs, axis=1)
-        random_vals = rng.random((n_voters, 1))
-        votes = (random_vals > cumprobs).sum(axis=1)
-
-        # Turnout (~67% average)
-        turnout_prob = rng.beta(5, 2.5, n_voters) * 0.85
-        will_vote = rng.random(n_voters) < turnout_prob
-        voted_count = will_vote.sum()
-        total_voted += voted_count
-
-        # FPTP counting
-        state_seats = dict.fromkeys(party_names, 0)
-        state_votes = dict.fromkeys(party_names, 0)
-
-        for c in range(n_constituencies):
-            c_mask = (constituencies == c) & will_vote
-            c_votes = votes[c_mask]
-
-            if len(c_votes) == 0:
-                continue
-
-            # Count votes per party
-            vote_counts = np.bincount(c_votes, minlength=n_parties)
-
-            # Total votes
-            for p, count in enumerate(vote_counts):
-                state_votes[party_names[p]] += count
-
-            # Winner
-            winner_idx = np.argmax(vote_counts)
-            winner = party_names[winner_idx]
-
-            # NOTA close race detection
-            if include_nota and "NOTA" in party_names:
-                nota_idx = party_names.index("NOTA")
-                nota_votes = vote_counts[nota_idx]
-
-                # Find runner-up (second highest)
-                sorted_counts = np.sort(vote_counts)[::-1]
-                winner_votes = sorted_counts[0]
-                runner_up_votes = sorted_counts[1] if len(sorted_counts) > 1 else 0
-                margin = winner_votes - runner_up_votes
-
-                # If NOTA > margin, race is contested
-                if nota_votes > margin and winner != "NOTA":
-                    nota_contested_seats += 1
-                    c_name = (
-                        manager.get_name(global_const_id + c) if manager else f"Constituency {c+1}"
-                    )
-                    nota_contested_list.append(f"{state}: {c_name}")
-
-            # Award seat (NOTA doesn't win seats)
-            if winner != "NOTA":
-                state_seats[winner] += 1
-
-        # Aggregate
-        for party in party_names:
-            all_seats[party] += state_seats[party]
-            all_votes[party] += state_votes[party]
-
-        state_results[state] = {
-            "seats": state_seats,
-            "votes": state_votes,
-            "turnout": voted_count / n_voters,
-        }
+    result = election.run(seed, sample_size=VOTER_SAMPLE_SIZE)
 
-        state_time = time.perf_counter() - state_start
-        if verbose:
-            top_party = max(state_seats.items(), key=lambda x: x[1])
-            print(f"done ({state_time*1000:.0f}ms) - {top_party[0]}: {top_party[1]} seats")
-
-        # Sample for visualization
-        state_voter_df = pl.DataFrame(
-            {
-                "ideology_x": base_ideology_x,
-                "ideology_y": base_ideology_y,
-                "vote": [party_names[v] for v in votes],
-                "state": state,
-            }
-        )
-        state_sample = state_voter_df.sample(min(100, len(state_voter_df)), seed=seed)
-        if voter_df_sample is None:
-            voter_df_sample = state_sample
-        else:
-            voter_df_sample = pl.concat([voter_df_sample, state_sample])
+    # National tally matrix: one row per PC, states in INDIA_STATES order
+    tallies = result.district_tallies
+    state_of_pc = result.district_region
+    state_starts = np.concatenate([[0], np.cumsum(list(INDIA_STATES.values()))[:-1]])
+    winner, runner_up, margin = result.district_results()
+    seated = winner >= 0
+    if include_nota:
+        # NOTA doesn't win seats
+        seated &= winner != party_names.index("NOTA")
+    seats = result.seats.sum(axis=0)
+    state_seats = result.seats
+
+    state_results = {
+        state: {
+            "seats": dict(zip(party_names, state_seats[s].tolist())),
+            "votes": dict(zip(party_names, result.votes[s].tolist())),
+            "turnout": float(result.votes[s].sum() / result.voters[s]),
+        }
+        for s, state in enumerate(states)
+    }
+
+    # Constituency table and NOTA close races (NOTA > victory margin)
+    pc_names = (
+        manager.df["name"].to_list()
+        if manager
+        else [f"Constituency {c - state_starts[s] + 1}" for c, s in enumerate(state_of_pc)]
+    )
+    nota_votes = tallies[:, -1] if include_nota else np.zeros(n_constituencies, np.int64)
+    names = np.array([*party_names, ""], dtype=object)  # -1 (no winner) maps to ""
+    constituency_results = pl.DataFrame(
+        {
+            "state": np.array(states)[state_of_pc],
+            "constituency": pc_names,
+            "winner": names[winner].tolist(),
+            "runner_up": names[runner_up].tolist(),
+            "margin": margin,
+            "nota_votes": nota_votes,
+            "votes_cast": tallies.sum(axis=1),
+        }
+    )
+    contested = seated & (nota_votes > margin) if include_nota else np.zeros_like(seated)
+    nota_contested_list = [
+        f"{states[state_of_pc[c]]}: {pc_names[c]}" for c in np.flatnonzero(contested)
+    ]
 
-        global_const_id += n_constituencies
+    if verbose:
+        for s, state in enumerate(states):
+            top = int(state_seats[s].argmax())
+            print(f"    {state:22} {party_names[top]}: {state_seats[s, top]} seats")
 
     # Calculate metrics
-    total_votes = sum(all_votes.values())
-    vote_shares = {p: v / total_votes for p, v in all_votes.items()}
-    seat_shares = {p: s / 543 for p, s in all_seats.items()}
-
-    vote_array = np.array(list(vote_shares.values()))
-    seat_array = np.array(list(seat_shares.values()))
+    vote_array = result.vote_shares
+    seat_array = seats / n_constituencies
 
     gal_idx = gallagher_index(vote_array, seat_array)
     enp_v = effective_number_of_parties(vote_array)
     enp_s = effective_number_of_parties(seat_array)
 
-    # Alliance totals
-    nda_parties = {"BJP", "JD(U)", "TDP", "SAD"}  # NDA
-    india_parties = {"INC", "AAP", "TMC", "DMK", "SP", "RJD", "SS-UBT", "NCP-SP", "JMM"}  # INDIA
-
-    nda_seats = sum(all_seats.get(p, 0) for p in nda_parties)
-    india_seats = sum(all_seats.get(p, 0) for p in india_parties)
-    others_seats = 543 - nda_seats - india_seats
+    all_seats = dict(zip(party_names, seats.tolist()))
+    nda_seats = sum(all_seats.get(p, 0) for p in NDA_PARTIES)
+    india_seats = sum(all_seats.get(p, 0) for p in INDIA_BLOC_PARTIES)
+    others_seats = n_constituencies - nda_seats - india_seats
 
     elapsed = time.perf_counter() - start_time
 
     if verbose:
         print(f"\nTotal simulation time: {elapsed:.2f}s")
 
-    # Collect party positions for mapping
-    # We take the positions from the last used config logic
-    # (Since INDIA_PARTIES is global, we can use that)
-    party_pos = np.array([[p["position_x"], p["position_y"]] for p in INDIA_PARTIES.values()])
+    # Sample of voters for visualization
+    voter_df = pl.DataFrame(
+        {
+            "ideology_x": result.sample_positions[:, 0],
+            "ideology_y": result.sample_positions[:, 1],
+            "vote": names[result.sample_votes].tolist(),
+            "state": np.array(states)[result.sample_region],
+        }
+    )
 
     return IndiaElectionResult(
         seats=all_seats,
-        vote_shares=vote_shares,
+        vote_shares=dict(zip(party_names, vote_array.tolist())),
         state_results=state_results,
-        turnout=total_voted / total_voters,
+        turnout=result.turnout,
         gallagher_index=gal_idx,
         enp_votes=enp_v,
         enp_seats=enp_s,
         nda_seats=nda_seats,
         india_seats=india_seats,
         others_seats=others_seats,
-        nota_contested_seats=nota_contested_seats,
+        nota_contested_seats=len(nota_contested_list),
         nota_contested_list=nota_contested_list,
-        voter_df=voter_df_sample if "voter_df_sample" in locals() else None,
-        party_positions=party_pos,
+        voter_df=voter_df,
+        party_positions=np.array(
+            [[p["position_x"], p["position_y"]] for p in INDIA_PARTIES.values()]
+        ),
+        constituency_results=constituency_results,
     )
 
 
@@ -1,5 +1,18 @@
 """USA Preset."""
 
 from electoral_sim.presets.usa.config import USA_PARTIES, usa_config
+from electoral_sim.presets.usa.election import (
+    USA_DISTRICT_STATES,
+    USA_STATES,
+    USAPresidentialResult,
+    simulate_usa_presidential,
+)
 
-__all__ = ["usa_config", "USA_PARTIES"]
+__all__ = [
+    "usa_config",
+    "USA_PARTIES",
+    "simulate_usa_presidential",
+    "USAPresidentialResult",
+    "USA_STATES",
+    "USA_DISTRICT_STATES",
+]
@@ -11,7 +11,8 @@ def usa_config(
     """
     Preset configuration for USA (House of Representatives).
 
-    435 districts, two-party system (FPTP).
+    435 districts, two-party system (FPTP). For the presidency through the
+    Electoral College see simulate_usa_presidential().
     """
     parties = [
         PartyConfig("Democratic", -0.4, -0.2, 50),
@@ -0,0 +1,273 @@
+"""
+USA Presidential Election Simulator
+
+Simulates the Electoral College with:
+- 538 electors: 50 states + DC
+- Winner-take-all states and the district rule in Maine and Nebraska
+- State partisan lean from the 2020 presidential margins
+- Fast Monte Carlo of correlated state swings on the simulated state shares
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from electoral_sim.core.regional import Region, RegionalElection
+from electoral_sim.presets.usa.config import USA_PARTIES
+from electoral_sim.systems.electoral_college import (
+    electoral_college_monte_carlo,
+    electoral_college_votes,
+)
+
+# =============================================================================
+# ELECTORAL COLLEGE DATA
+# =============================================================================
+
+# State -> (electors 2024-2028, 2020 presidential margin in points, D - R)
+USA_STATES = {
+    "Alabama": (9, -25.5),
+    "Alaska": (3, -10.1),
+    "Arizona": (11, 0.3),
+    "Arkansas": (6, -27.6),
+    "California": (54, 29.2),
+    "Colorado": (10, 13.5),
+    "Connecticut": (7, 20.0),
+    "Delaware": (3, 19.0),
+    "District of Columbia": (3, 86.8),
+    "Florida": (30, -3.4),
+    "Georgia": (16, 0.2),
+    "Hawaii": (4, 29.5),
+    "Idaho": (4, -30.8),
+    "Illinois": (19, 17.0),
+    "Indiana": (11, -16.1),
+    "Iowa": (6, -8.2),
+    "Kansas": (6, -14.6),
+    "Kentucky": (8, -25.9),
+    "Louisiana": (8, -18.6),
+    "Maine": (4, 9.1),
+    "Maryland": (10, 33.2),
+    "Massachusetts": (11, 33.5),
+    "Michigan": (15, 2.8),
+    "Minnesota": (10, 7.1),
+    "Mississippi": (6, -16.5),
+    "Missouri": (10, -15.4),
+    "Montana": (4, -16.4),
+    "Nebraska": (5, -19.1),
+    "Nevada": (6, 2.4),
+    "New Hampshire": (4, 7.4),
+    "New Jersey": (14, 15.9),
+    "New Mexico": (5, 10.8),
+    "New York": (28, 23.1),
+    "North Carolina": (16, -1.3),
+    "North Dakota": (3, -33.4),
+    "Ohio": (17, -8.0),
+    "Oklahoma": (7, -33.1),
+    "Oregon": (8, 16.1),
+    "Pennsylvania": (19, 1.2),
+    "Rhode Island": (4, 20.8),
+    "South Carolina": (9, -11.7),
+    "South Dakota": (3, -26.2),
+    "Tennessee": (11, -23.2),
+    "Texas": (40, -5.6),
+    "Utah": (6, -20.5),
+    "Vermont": (3, 35.4),
+    "Virginia": (13, 10.1),
+    "Washington": (12, 19.2),
+    "West Virginia": (4, -38.9),
+    "Wisconsin": (10, 0.6),
+    "Wyoming": (3, -43.4),
+}
+
+# States using the district rule -> 2020 margin per congressional district
+USA_DISTRICT_STATES = {
+    "Maine": (23.1, -7.4),
+    "Nebraska": (-15.0, 6.5, -53.1),
+}
+
+
+@dataclass
+class USAPresidentialResult:
+    """Results of USA presidential election simulation."""
+
+    electoral_votes: dict[str, int]  # Party -> electors
+    vote_shares: dict[str, float]
+    state_results: dict[str, dict]
+    turnout: float
+    winner: str | None  # None without an Electoral College majority
+    party_names: list[str]
+    electors: np.ndarray  # (n_states,) in USA_STATES order
+    state_shares: np.ndarray  # (n_states, n_parties) simulated vote shares
+    district_shares: np.ndarray  # (n_districts, n_parties)
+    district_state: np.ndarray  # (n_districts,) state index of each district
+    majority_threshold: int = 270
+
+    def monte_carlo(
+        self,
+        n_scenarios: int = 100_000,
+        national_sd: float = 0.02,
+        state_sd: float = 0.025,
+        district_sd: float = 0.02,
+        seed: int | None = None,
+    ) -> dict:
+        """
+        Win probabilities from correlated swings on the simulated state shares.
+
+        Voters are not re-simulated; see electoral_college_monte_carlo().
+
+        Returns:
+            Dictionary from electoral_college_monte_carlo(); party columns
+            follow party_names
+        """
+        return electoral_college_monte_carlo(
+            self.state_shares,
+            self.electors,
+            self.district_shares,
+            self.district_state,
+            n_scenarios=n_scenarios,
+            national_sd=national_sd,
+            state_sd=state_sd,
+            district_sd=district_sd,
+            seed=seed,
+        )
+
+    def __str__(self):
+        lines = ["=" * 60]
+        lines.append("USA PRESIDENTIAL ELECTION RESULTS")
+        lines.append("=" * 60)
+        lines.append(f"\nTurnout: {self.turnout:.1%}")
+        lines.append(f"\n{'Party':15} {'Electors':>8} {'Vote %':>8}")
+        lines.append("-" * 35)
+        for party, electors in sorted(self.electoral_votes.items(), key=lambda x: -x[1]):
+            vote_pct = self.vote_shares.get(party, 0) * 100
+            lines.append(f"{party:15} {electors:>8} {vote_pct:>7.1f}%")
+        lines.append("-" * 35)
+        lines.append(f"\nMajority threshold: {self.majority_threshold}")
+        lines.append(f"Winner: {self.winner or 'No majority (contingent election)'}")
+        return "\n".join(lines)
+
+
+def _lean_weights(margin: float, temperature: float, strength_weight: float) -> dict:
+    """Democratic party strength whose MNL share matches a D - R margin in points."""
+    share = 0.5 + margin / 200
+    return {"Democratic": temperature * np.log(share / (1 - share)) / strength_weight}
+
+
+def simulate_usa_presidential(
+    voters_per_seat: int = 1000,
+    turnout: float = 0.66,
+    national_swing: float = 0.0,
+    seed: int | None = None,
+    verbose: bool = True,
+    n_jobs: int = 1,
+) -> USAPresidentialResult:
+    """
+    Simulate a USA presidential election through the Electoral College.
+
+    Winner-take-all states and every Maine and Nebraska congressional district
+    are regions of one RegionalElection; their tallies feed
+    electoral_college_votes(). The simulated state shares are kept on the
+    result for USAPresidentialResult.monte_carlo().
+
+    Args:
+        voters_per_seat: Voters simulated per House seat (DC counts as one)
+        turnout: Mean turnout probability
+        national_swing: Uniform swing added to every margin (points, D - R)
+        seed: Random seed for reproducibility
+        verbose: Print progress
+        n_jobs: Worker processes for simulating states (1 = sequential);
+            results are identical for any value
+
+    Returns:
+        USAPresidentialResult with full results
+    """
+    party_names = list(USA_PARTIES)
+    states = list(USA_STATES)
+    temperature, strength_weight = 0.5, 3.0
+
+    regions, region_state = [], []
+    for s, (state, (electors, margin)) in enumerate(USA_STATES.items()):
+        house_seats = max(electors - 2, 1)
+        district_margins = USA_DISTRICT_STATES.get(state)
+        if district_margins is None:
+            district_margins, seats = (margin,), [house_seats]
+        else:
+            seats = [house_seats // len(district_margins)] * len(district_margins)
+        for d, district_margin in enumerate(district_margins):
+            name = state if len(district_margins) == 1 else f"{state} CD-{d + 1}"
+            weights = _lean_weights(district_margin + national_swing, temperature, strength_weight)
+            regions.append(Region(name, seats[d], weights, turnout=turnout))
+            region_state.append(s)
+    region_state = np.array(region_state)
+
+    election = RegionalElection(
+        USA_PARTIES,
+        regions,
+        voters_per_seat=voters_per_seat,
+        temperature=temperature,
+        strength_weight=strength_weight,
+        n_jobs=n_jobs,
+    )
+
+    start_time = time.perf_counter()
+    if verbose:
+        print("🇺🇸 Simulating USA Presidential Election (538 Electors, 51 States)")
+        print("=" * 60)
+
+    result = election.run(seed)
+    P = len(party_names)
+    state_votes = np.zeros((len(states), P), dtype=np.int64)
+    np.add.at(state_votes, region_state, result.votes)
+    district_states = [states.index(state) for state in USA_DISTRICT_STATES]
+    districts = np.flatnonzero(np.isin(region_state, district_states))
+    district_votes = result.votes[districts]
+    district_state = region_state[districts]
+
+    electors = np.array([USA_STATES[state][0] for state in states])
+    votes = electoral_college_votes(state_votes, electors, district_votes, district_state)
+    totals = votes.sum(axis=0)
+    majority = np.flatnonzero(totals > electors.sum() / 2)
+
+    state_results = {
+        state: {
+            "electoral_votes": dict(zip(party_names, votes[s].tolist())),
+            "votes": dict(zip(party_names, state_votes[s].tolist())),
+            "winner": party_names[int(state_votes[s].argmax())],
+        }
+        for s, state in enumerate(states)
+    }
+
+    def shares(tallies):
+        return tallies / np.maximum(tallies.sum(axis=1, keepdims=True), 1)
+
+    all_votes = state_votes.sum(axis=0)
+    if verbose:
+        print(f"\nTotal simulation time: {time.perf_counter() - start_time:.2f}s")
+
+    return USAPresidentialResult(
+        electoral_votes=dict(zip(party_names, totals.tolist())),
+        vote_shares=dict(zip(party_names, (all_votes / all_votes.sum()).tolist())),
+        state_results=state_results,
+        turnout=result.turnout,
+        winner=party_names[majority[0]] if len(majority) else None,
+        party_names=party_names,
+        electors=electors,
+        state_shares=shares(state_votes),
+        district_shares=shares(district_votes),
+        district_state=district_state,
+        majority_threshold=int(electors.sum()) // 2 + 1,
+    )
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+if __name__ == "__main__":
+    print()
+    result = simulate_usa_presidential(seed=2024)
+    print()
+    print(result)
+    scenarios = result.monte_carlo(seed=2024)
+    for party, p in zip(result.party_names, scenarios["win_probability"]):
+        print(f"{party:15} {p:>7.1%}")
@@ -3,10 +3,12 @@
 from electoral_sim.systems.allocation import (
     ALLOCATION_METHODS,
     allocate_seats,
+    allocate_seats_batch,
     dhondt_allocation,
     droop_quota_allocation,
     fptp_allocation,
     hare_quota_allocation,
+    mmp_allocation,
     sainte_lague_allocation,
 )
 from electoral_sim.systems.alternative import (
@@ -16,6 +18,10 @@ from electoral_sim.systems.alternative import (
     irv_election,
     stv_election,
 )
+from electoral_sim.systems.electoral_college import (
+    electoral_college_monte_carlo,
+    electoral_college_votes,
+)
 
 __all__ = [
     # PR allocation
@@ -25,6 +31,8 @@ __all__ = [
     "droop_quota_allocation",
     "fptp_allocation",
     "allocate_seats",
+    "allocate_seats_batch",
+    "mmp_allocation",
     "ALLOCATION_METHODS",
     # Alternative systems
     "irv_election",
@@ -32,4 +40,7 @@ __all__ = [
     "approval_voting",
     "condorcet_winner",
     "generate_rankings",
+    # Electoral college
+    "electoral_college_votes",
+    "electoral_college_monte_carlo",
 ]
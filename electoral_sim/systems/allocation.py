@@ -2,6 +2,8 @@
 Electoral Systems: Seat allocation methods and electoral rules
 """
 
+from collections.abc import Sequence
+
 import numpy as np
 import polars as pl
 
@@ -92,6 +94,8 @@ def hare_quota_allocation(votes: np.ndarray, n_seats: int, threshold: float = 0.
     if threshold > 0:
         vote_shares = votes / total_votes
         votes = np.where(vote_shares >= threshold, votes, 0)
+        # The quota is taken over qualifying votes only
+        total_votes = votes.sum()
 
     quota = total_votes / n_seats
 
@@ -131,6 +135,8 @@ def droop_quota_allocation(votes: np.ndarray, n_seats: int, threshold: float = 0
     if threshold > 0:
         vote_shares = votes / total_votes
         votes = np.where(vote_shares >= threshold, votes, 0)
+        # The quota is taken over qualifying votes only
+        total_votes = votes.sum()
 
     quota = np.floor(total_votes / (n_seats + 1)) + 1
 
@@ -220,3 +226,169 @@ def allocate_seats(
         raise ValueError(f"Unknown method: {method}. Use one of {list(ALLOCATION_METHODS.keys())}")
 
     return ALLOCATION_METHODS[method](votes, n_seats, threshold)
+
+
+# Divisor sequences for batched highest-averages allocation
+DIVISORS = {
+    "dhondt": lambda seats: seats + 1,
+    "sainte_lague": lambda seats: 2 * seats + 1,
+}
+
+
+def allocate_seats_batch(
+    votes: np.ndarray,
+    n_seats: int | Sequence[int] | np.ndarray,
+    method: str | Sequence[str] = "dhondt",
+    threshold: float | Sequence[float] | np.ndarray = 0.0,
+) -> np.ndarray:
+    """
+    Allocate seats in many districts (or member states) at once.
+
+    Row r gets the same result as allocate_seats(votes[r], n_seats[r],
+    method[r], threshold[r]). Rows sharing a method are allocated together:
+    divisor methods award one seat per row per step, quota methods rank all
+    remainders in one argsort.
+
+    Args:
+        votes: (n_rows, n_parties) vote counts
+        n_seats: Seats per row (scalar or (n_rows,))
+        method: Method for every row, or one per row
+        threshold: Minimum vote share within the row (scalar or (n_rows,))
+
+    Returns:
+        (n_rows, n_parties) seats per party
+
+    Raises:
+        ValueError: If a row with seats has no votes clearing its threshold
+    """
+    votes = np.asarray(votes, dtype=float)
+    n_rows, n_parties = votes.shape
+    n_seats = np.broadcast_to(np.asarray(n_seats, dtype=np.int64), (n_rows,))
+    threshold = np.broadcast_to(np.asarray(threshold, dtype=float), (n_rows,))
+    methods = np.array([method] * n_rows if isinstance(method, str) else list(method))
+    if len(methods) != n_rows:
+        raise ValueError(f"Got {len(methods)} methods for {n_rows} rows")
+
+    if (threshold > 0).any():
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = votes / votes.sum(axis=1, keepdims=True)
+        votes = np.where(shares >= threshold[:, np.newaxis], votes, 0)
+
+    empty = (votes.sum(axis=1) <= 0) & (n_seats > 0)
+    if empty.any():
+        raise ValueError(f"No qualifying votes in rows {np.flatnonzero(empty).tolist()}")
+
+    # Rows without seats stay all zeros
+    seats = np.zeros((n_rows, n_parties), dtype=np.int64)
+    for m in np.unique(methods):
+        rows = np.flatnonzero((methods == m) & (n_seats > 0))
+        if m in DIVISORS:
+            seats[rows] = _divisor_batch(votes[rows], n_seats[rows], DIVISORS[m])
+        elif m in ("hare", "droop"):
+            seats[rows] = _quota_batch(votes[rows], n_seats[rows], m)
+        else:
+            raise ValueError(f"Unknown method: {m}. Use one of {list(ALLOCATION_METHODS.keys())}")
+    return seats
+
+
+def _divisor_batch(votes: np.ndarray, n_seats: np.ndarray, divisor) -> np.ndarray:
+    """Highest averages for every row: each step awards one seat per unfinished row."""
+    seats = np.zeros(votes.shape, dtype=np.int64)
+    rows = np.arange(len(votes))
+    for step in range(int(n_seats.max(initial=0))):
+        active = rows[step < n_seats]
+        winners = np.argmax(votes[active] / divisor(seats[active]), axis=1)
+        seats[active, winners] += 1
+    return seats
+
+
+def _quota_batch(votes: np.ndarray, n_seats: np.ndarray, method: str) -> np.ndarray:
+    """Largest remainder (Hare or Droop quota over qualifying votes) for every row."""
+    totals = votes.sum(axis=1)
+    if method == "hare":
+        quota = totals / n_seats
+    else:
+        quota = np.floor(totals / (n_seats + 1)) + 1
+    quota = quota[:, np.newaxis]
+
+    seats = np.floor(votes / quota).astype(np.int64)
+    remaining = n_seats - seats.sum(axis=1)
+
+    # Rank of each party's remainder within its row (0 = largest)
+    order = np.argsort(-(votes - seats * quota), axis=1)
+    rank = np.empty_like(order)
+    np.put_along_axis(rank, order, np.arange(votes.shape[1])[np.newaxis, :], axis=1)
+    return seats + (rank < remaining[:, np.newaxis])
+
+
+def mmp_allocation(
+    list_votes: np.ndarray,
+    direct_seats: np.ndarray,
+    n_seats: int,
+    method: str = "sainte_lague",
+    threshold: float = 0.05,
+    basic_mandates: int = 3,
+    levelling: bool = True,
+) -> dict:
+    """
+    Mixed-member proportional allocation with overhang and levelling seats.
+
+    Parties qualify for list seats with threshold of the second votes or
+    basic_mandates district seats. Qualified parties are entitled to a
+    proportional share of the house; district seats of parties that do not
+    qualify come off the top. A party winning more districts than its
+    entitlement keeps them (overhang). With levelling, the house is enlarged
+    to the smallest size at which every entitlement covers its districts;
+    candidate sizes are searched in windows with allocate_seats_batch().
+
+    Args:
+        list_votes: (n_parties,) second (list) votes
+        direct_seats: (n_parties,) district seats won on first votes
+        n_seats: Nominal house size (districts plus list seats)
+        method: Allocation method for list seats
+        threshold: Minimum second-vote share for list seats (0-1)
+        basic_mandates: District seats that qualify a party regardless of threshold
+        levelling: Add levelling seats until overhang is compensated
+
+    Returns:
+        Dictionary with seats, direct_seats, list_seats, overhang_seats,
+        levelling_seats, house_size and qualified per party
+    """
+    votes = np.asarray(list_votes, dtype=float)
+    direct = np.asarray(direct_seats, dtype=np.int64)
+    total = votes.sum()
+    shares = votes / total if total > 0 else np.zeros_like(votes)
+    qualified = (shares >= threshold) | (direct >= basic_mandates)
+    votes = np.where(qualified, votes, 0.0)
+    # District seats levelling must cover (a party without list votes cannot be levelled)
+    covered = np.where(qualified & (votes > 0), direct, 0)
+
+    base = max(n_seats - int(direct[~qualified].sum()), 0)
+    entitled = allocate_seats_batch(votes[np.newaxis], base, method)[0]
+    overhang = np.where(qualified, np.maximum(direct - entitled, 0), 0)
+
+    if levelling and (covered > entitled).any():
+        # Divisor methods are house monotone: the first size that covers every
+        # party's districts is the smallest levelled house
+        lo, window = base + 1, max(2 * int(overhang.sum()), 8)
+        while True:
+            sizes = np.arange(lo, lo + window)
+            rows = np.broadcast_to(votes, (window, len(votes)))
+            batch = allocate_seats_batch(rows, sizes, method)
+            ok = np.flatnonzero((batch >= covered).all(axis=1))
+            if len(ok):
+                entitled = batch[ok[0]]
+                break
+            lo, window = lo + window, 2 * window
+
+    seats = np.where(qualified, np.maximum(entitled, direct), direct)
+    house_size = int(seats.sum())
+    return {
+        "seats": seats,
+        "direct_seats": direct,
+        "list_seats": seats - direct,
+        "overhang_seats": overhang,
+        "levelling_seats": max(house_size - n_seats - int(overhang.sum()), 0),
+        "house_size": house_size,
+        "qualified": qualified,
+    }
@@ -0,0 +1,135 @@
+"""
+Electoral College: weighted aggregation of state-level contests
+
+States award electors winner-take-all, or by the district rule (Maine,
+Nebraska): the statewide winner takes the at-large electors and each
+congressional district's winner one elector. A Monte Carlo path resamples
+correlated state swings on top of fixed state vote shares, without
+re-simulating voters.
+"""
+
+import numpy as np
+
+
+def electoral_college_votes(
+    state_tallies: np.ndarray,
+    electors: np.ndarray,
+    district_tallies: np.ndarray | None = None,
+    district_state: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Electoral votes won per state and party.
+
+    States with districts in district_state use the district rule: one
+    elector per district, the remaining electors at-large. Every other state
+    is winner-take-all. Ties go to the lower party index; states (or
+    districts) where nobody voted award no electors.
+
+    Args:
+        state_tallies: (n_states, n_parties) statewide votes
+        electors: (n_states,) electors per state
+        district_tallies: (n_districts, n_parties) votes per elector district
+        district_state: (n_districts,) state index of each district
+
+    Returns:
+        (n_states, n_parties) electoral votes
+    """
+    from electoral_sim.core.counting import constituency_winners
+
+    tallies = np.asarray(state_tallies)
+    S, P = tallies.shape
+    at_large = np.array(electors, dtype=np.int64)
+    votes = np.zeros((S, P), dtype=np.int64)
+
+    if district_tallies is not None:
+        district_state = np.asarray(district_state, dtype=np.int64)
+        at_large -= np.bincount(district_state, minlength=S)
+        winner, _, _ = constituency_winners(np.asarray(district_tallies))
+        won = winner >= 0
+        votes += np.bincount(district_state[won] * P + winner[won], minlength=S * P).reshape(S, P)
+    if (at_large < 0).any():
+        raise ValueError("A state has more districts than electors")
+
+    winner, _, _ = constituency_winners(tallies)
+    won = np.flatnonzero(winner >= 0)
+    votes[won, winner[won]] += at_large[won]
+    return votes
+
+
+def electoral_college_monte_carlo(
+    state_shares: np.ndarray,
+    electors: np.ndarray,
+    district_shares: np.ndarray | None = None,
+    district_state: np.ndarray | None = None,
+    n_scenarios: int = 100_000,
+    national_sd: float = 0.02,
+    state_sd: float = 0.025,
+    district_sd: float = 0.02,
+    seed: int | None = None,
+    chunk_size: int = 10_000,
+) -> dict:
+    """
+    Win probabilities from correlated swings on fixed state vote shares.
+
+    Each scenario adds a national swing, shared by every state, and an
+    independent swing per state to each party's vote share; districts add
+    their own swing on top of their state's. Winners are the parties with
+    the largest swung share, aggregated with the rules of
+    electoral_college_votes(). Scenarios run in chunks of chunk_size.
+
+    Args:
+        state_shares: (n_states, n_parties) statewide vote shares
+        electors: (n_states,) electors per state
+        district_shares: (n_districts, n_parties) vote shares per elector district
+        district_state: (n_districts,) state index of each district
+        n_scenarios: Number of scenarios
+        national_sd: Standard deviation of the national swing in each party's share
+        state_sd: Standard deviation of each state's own swing
+        district_sd: Standard deviation of each district's own swing
+        seed: Random seed
+        chunk_size: Scenarios drawn at once (bounds memory)
+
+    Returns:
+        Dictionary with win_probability (n_parties,), no_majority_probability,
+        state_win_probability (n_states, n_parties), mean_electoral_votes
+        (n_parties,) and electoral_votes (n_scenarios, n_parties)
+    """
+    rng = np.random.default_rng(seed)
+    shares = np.asarray(state_shares, dtype=float)
+    S, P = shares.shape
+    at_large = np.array(electors, dtype=np.int64)
+    if district_shares is not None:
+        district_shares = np.asarray(district_shares, dtype=float)
+        district_state = np.asarray(district_state, dtype=np.int64)
+        at_large -= np.bincount(district_state, minlength=S)
+    if (at_large < 0).any():
+        raise ValueError("A state has more districts than electors")
+
+    electoral_votes = np.zeros((n_scenarios, P), dtype=np.int64)
+    state_wins = np.zeros((S, P), dtype=np.int64)
+    for start in range(0, n_scenarios, chunk_size):
+        n = min(chunk_size, n_scenarios - start)
+        swing = rng.normal(0, national_sd, (n, 1, P)) + rng.normal(0, state_sd, (n, S, P))
+        winner = np.argmax(shares + swing, axis=2)
+        if district_shares is not None:
+            district_swing = swing[:, district_state] + rng.normal(
+                0, district_sd, (n, len(district_state), P)
+            )
+            district_winner = np.argmax(district_shares + district_swing, axis=2)
+
+        chunk = electoral_votes[start : start + n]
+        for p in range(P):
+            won = winner == p
+            chunk[:, p] = won @ at_large
+            state_wins[:, p] += won.sum(axis=0)
+            if district_shares is not None:
+                chunk[:, p] += (district_winner == p).sum(axis=1)
+
+    majority = electoral_votes > np.sum(electors) / 2
+    return {
+        "win_probability": majority.mean(axis=0),
+        "no_majority_probability": float(1 - majority.any(axis=1).mean()),
+        "state_win_probability": state_wins / n_scenarios,
+        "mean_electoral_votes": electoral_votes.mean(axis=0),
+        "electoral_votes": electoral_votes,
+    }
@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+
+from electoral_sim import BehaviorEngine, DirectionalModel, MixedSpatialModel, ProximityModel
+from electoral_sim import ValenceModel
+from electoral_sim.engine.numba_accel import compute_utilities_numba
+
+
+def _time(fn, repeats=3):
+    fn()  # warm up JIT
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark_spatial(n_voters=1_000_000, n_parties=8, n_dims=2):
+    print(f"--- Benchmarking {n_voters:,} voters, {n_parties} parties, {n_dims}D ---")
+
+    rng = np.random.default_rng(42)
+    voters = rng.normal(size=(n_voters, n_dims)).astype(np.float32)
+    parties = rng.normal(size=(n_parties, n_dims)).astype(np.float32)
+    voter_data = {"n_voters": n_voters, "positions": voters}
+    party_data = {
+        "n_parties": n_parties,
+        "positions": parties,
+        "valence": rng.uniform(0, 100, n_parties),
+        "incumbents": np.zeros(n_parties, dtype=bool),
+    }
+
+    valence = party_data["valence"]
+    baseline = _time(
+        lambda: compute_utilities_numba(
+            voters[:, 0], voters[:, 1], parties[:, 0], parties[:, 1], valence
+        )
+    )
+    print(f"  compute_utilities_numba:      {baseline:.3f}s")
+
+    plans = {
+        "proximity + valence": [ProximityModel()],
+        "directional + valence": [DirectionalModel()],
+        "mixed + valence": [MixedSpatialModel(beta=0.5)],
+        "all three + valence": [ProximityModel(), DirectionalModel(), MixedSpatialModel()],
+    }
+    for name, spatial in plans.items():
+        engine = BehaviorEngine()
+        for model in [*spatial, ValenceModel()]:
+            engine.add_model(model)
+        elapsed = _time(lambda: engine.compute_all(voter_data, party_data))
+        print(f"  {name:<29} {elapsed:.3f}s ({elapsed / baseline:.2f}x baseline)")
+
+
+if __name__ == "__main__":
+    benchmark_spatial(1_000_000)
+    benchmark_spatial(10_000_000)
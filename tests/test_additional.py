@@ -26,6 +26,263 @@ class TestBehaviorEngineAdvanced:
         results = model.run_election()
         assert results is not None
 
+    def test_engine_compiled_plan(self):
+        """Test the compiled plan matches summing each model's utility matrix."""
+        from electoral_sim import (
+            BehaviorEngine,
+            ProximityModel,
+            RetrospectiveModel,
+            SociotropicPocketbookModel,
+            ValenceModel,
+            WastedVoteModel,
+        )
+
+        rng = np.random.default_rng(0)
+        n_voters, n_parties = 200, 4
+        voter_data = {"n_voters": n_voters, "positions": rng.normal(size=(n_voters, 2))}
+        incumbents = np.array([True, False, False, True])
+        viability = np.array([0.5, 0.3, 0.02, 0.18])
+        party_data = {
+            "n_parties": n_parties,
+            "positions": rng.normal(size=(n_parties, 2)),
+            "valence": rng.uniform(0, 100, n_parties),
+            "incumbents": incumbents,
+            "viability": viability,
+        }
+
+        models = [
+            (ProximityModel(weight=1.5), 0.5),
+            (ValenceModel(weight=0.01), 1.0),
+            (RetrospectiveModel(weight=0.5), 2.0),
+            (WastedVoteModel(penalty=2.0), 1.0),
+            (SociotropicPocketbookModel(), 1.0),
+        ]
+        engine = BehaviorEngine()
+        for m, w in models:
+            engine.add_model(m, weight=w)
+
+        plan = engine.compile()
+        assert len(plan.distance) == 1
+        assert len(plan.party_terms) == 3
+        assert len(plan.voter_terms) == 1
+        assert engine.compile() is plan
+
+        utilities = engine.compute_all(voter_data, party_data, growth=0.02)
+        assert utilities.dtype == np.float32
+
+        expected = (
+            0.5 * models[0][0].compute_utility(voter_data["positions"], party_data["positions"])
+            + models[1][0].compute_utility(n_voters, party_data["valence"])
+            + 2.0 * models[2][0].compute_utility(n_voters, n_parties, incumbents, 0.02)
+            + models[3][0].compute_utility(n_voters, viability)
+            + models[4][0].compute_utility(n_voters, n_parties, incumbents, 0.02)
+        )
+        np.testing.assert_allclose(utilities, expected, rtol=1e-5, atol=1e-5)
+
+    def test_engine_plan_subclasses_and_optional_incumbents(self):
+        """Test model subclasses keep their fused terms and incumbents are optional."""
+        from electoral_sim import (
+            BehaviorEngine,
+            ProximityModel,
+            SociotropicPocketbookModel,
+            ValenceModel,
+        )
+
+        class ScaledValence(ValenceModel):
+            pass
+
+        class Pocketbook(SociotropicPocketbookModel):
+            pass
+
+        rng = np.random.default_rng(1)
+        voter_data = {"n_voters": 50, "positions": rng.normal(size=(50, 2))}
+        party_data = {
+            "n_parties": 3,
+            "positions": rng.normal(size=(3, 2)),
+            "valence": np.array([10.0, 50.0, 90.0]),
+        }
+
+        engine = BehaviorEngine(precision="float64")
+        engine.add_model(ProximityModel())
+        engine.add_model(ScaledValence(weight=0.01))
+        assert len(engine.compile().party_terms) == 1
+        # No incumbency term in the plan, so no "incumbents" entry is needed
+        utilities = engine.compute_all(voter_data, party_data)
+        expected = (
+            ProximityModel().compute_utility(voter_data["positions"], party_data["positions"])
+            + 0.01 * party_data["valence"]
+        )
+        np.testing.assert_allclose(utilities, expected)
+
+        engine.add_model(Pocketbook())
+        assert len(engine.compile().voter_terms) == 1
+
+    def test_engine_precision(self):
+        """Test float32 default and float64 validation precision."""
+        from electoral_sim import ElectionModel, ProximityModel
+
+        model32 = ElectionModel(n_voters=2000, seed=7)
+        model64 = ElectionModel(n_voters=2000, seed=7, precision="float64")
+        u32 = model32._compute_utilities()
+        u64 = model64._compute_utilities()
+
+        assert u32.dtype == np.float32
+        assert u64.dtype == np.float64
+        np.testing.assert_allclose(u32, u64, rtol=1e-5, atol=1e-5)
+        np.testing.assert_array_equal(
+            model32.run_election()["vote_counts"], model64.run_election()["vote_counts"]
+        )
+
+        positions = np.random.default_rng(0).normal(size=(50, 3))
+        centers = np.zeros((2, 3))
+        np.testing.assert_allclose(
+            ProximityModel(weight=2.0).compute_utility(positions, centers)[:, 0],
+            -2.0 * np.linalg.norm(positions, axis=1),
+        )
+
+        with pytest.raises(ValueError):
+            ElectionModel(n_voters=100, precision="float16")
+
+    def test_engine_precision_not_overridden(self):
+        """Test a float64 engine keeps its precision unless the model sets one."""
+        from electoral_sim import BehaviorEngine, ElectionModel, ProximityModel
+
+        engine = BehaviorEngine(precision="float64")
+        engine.add_model(ProximityModel(weight=1.0))
+        model = ElectionModel(n_voters=1000, seed=3, behavior_engine=engine)
+        assert model._compute_utilities().dtype == np.float64
+
+        model32 = ElectionModel(n_voters=1000, seed=3, behavior_engine=engine, precision="float32")
+        assert model32._compute_utilities().dtype == np.float32
+
+    def test_n_dimensional_issue_space(self):
+        """Test salience-weighted distances in a 4-dimensional issue space."""
+        from electoral_sim import ElectionModel, ProximityModel
+
+        rng = np.random.default_rng(1)
+        voters = rng.normal(size=(300, 4))
+        parties = rng.normal(size=(3, 4))
+        salience = rng.uniform(0.5, 1.5, size=(300, 4))
+        diff = voters[:, np.newaxis, :] - parties[np.newaxis, :, :]
+
+        euclid = ProximityModel().compute_utility(voters, parties, salience=salience)
+        np.testing.assert_allclose(euclid, -np.sqrt((salience[:, None] * diff**2).sum(axis=2)))
+
+        cityblock = ProximityModel(metric="cityblock", dimensionality=2)
+        np.testing.assert_allclose(
+            cityblock.compute_utility(voters, parties),
+            -np.abs(diff[:, :, :2]).sum(axis=2),
+        )
+
+        party_list = [
+            {"name": "A", "position_x": -0.3, "position_y": 0.1, "position_2": 0.5},
+            {"name": "B", "position_x": 0.3, "position_y": -0.1, "position_2": -0.5},
+        ]
+        model = ElectionModel(
+            n_voters=500, parties=party_list, n_dims=4, issue_salience=True, seed=3
+        )
+        assert model.voters.get_positions().shape == (500, 4)
+        assert model.voters.get_salience().shape == (500, 4)
+        # position_3 is missing from the configs and defaults to 0
+        np.testing.assert_array_equal(model.parties.get_positions(n_dims=4)[:, 3], 0.0)
+        assert model.run_election()["vote_counts"].sum() > 0
+
+    def test_directional_and_mixed_models(self):
+        """Test directional and Merrill mixed utilities, alone and fused in a plan."""
+        from electoral_sim import (
+            BehaviorEngine,
+            DirectionalModel,
+            MixedSpatialModel,
+            ProximityModel,
+            ValenceModel,
+        )
+        from electoral_sim.behavior import SpatialModel
+
+        rng = np.random.default_rng(2)
+        voters = rng.normal(size=(300, 3))
+        parties = rng.normal(size=(4, 3))
+        salience = rng.uniform(0.5, 1.5, size=(300, 3))
+        dot = (salience[:, None] * voters[:, None] * parties[None]).sum(axis=2)
+        sq = (salience[:, None] * (voters[:, None] - parties[None]) ** 2).sum(axis=2)
+
+        directional = DirectionalModel(weight=2.0)
+        np.testing.assert_allclose(directional.compute_utility(voters, parties, salience), 2 * dot)
+        mixed = MixedSpatialModel(beta=0.3)
+        np.testing.assert_allclose(
+            mixed.compute_utility(voters, parties, salience), 0.3 * dot - 0.7 * sq
+        )
+        with pytest.raises(ValueError):
+            MixedSpatialModel(beta=1.5)
+
+        class Incomplete(SpatialModel):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+        engine = BehaviorEngine(precision="float64")
+        models = [ProximityModel(), directional, mixed, ValenceModel(weight=0.01)]
+        for model in models:
+            engine.add_model(model)
+        voter_data = {"n_voters": 300, "positions": voters, "salience": salience}
+        party_data = {
+            "n_parties": 4,
+            "positions": parties,
+            "valence": rng.uniform(0, 100, 4),
+            "incumbents": np.zeros(4, dtype=bool),
+        }
+        assert len(engine.compile().distance) == 3
+        expected = sum(m.compute_utility(voters, parties, salience) for m in models[:3])
+        expected = expected + 0.01 * party_data["valence"]
+        np.testing.assert_allclose(engine.compute_all(voter_data, party_data), expected)
+
+    def test_kernel_model_plugin(self):
+        """Test JIT-compiled plugin kernels and their error reporting."""
+        from electoral_sim import BehaviorEngine, ElectionModel, KernelModel, ProximityModel
+
+        def age_gap(voter, party):
+            return -0.1 * abs(voter[0] - party[0])
+
+        rng = np.random.default_rng(4)
+        age = rng.uniform(18, 90, 500)
+        leader_age = np.array([40.0, 55.0, 70.0])
+        voter_data = {"n_voters": 500, "positions": rng.normal(size=(500, 2)), "age": age}
+        party_data = {
+            "n_parties": 3,
+            "positions": rng.normal(size=(3, 2)),
+            "incumbents": np.zeros(3, dtype=bool),
+            "leader_age": leader_age,
+        }
+
+        engine = BehaviorEngine(precision="float64")
+        engine.add_model(ProximityModel())
+        engine.add_kernel(age_gap, voter_columns=["age"], party_columns=["leader_age"], weight=2)
+        assert len(engine.compile().kernel_terms) == 1
+        expected = ProximityModel().compute_utility(
+            voter_data["positions"], party_data["positions"]
+        ) - 0.2 * np.abs(age[:, None] - leader_age[None, :])
+        np.testing.assert_allclose(engine.compute_all(voter_data, party_data), expected)
+
+        # Columns are also read from the agent DataFrames
+        engine = BehaviorEngine()
+        engine.add_model(ProximityModel())
+        engine.add_kernel(age_gap, voter_columns=["ideology_x"], party_columns=["position_x"])
+        model = ElectionModel(n_voters=300, seed=5, behavior_engine=engine)
+        assert model.run_election()["vote_counts"].sum() > 0
+
+        with pytest.raises(TypeError, match="two arguments"):
+            KernelModel(lambda voter: 0.0)
+        with pytest.raises(KeyError, match="income"):
+            KernelModel(age_gap, voter_columns=["income"]).compute_utility(voter_data, party_data)
+
+        def not_a_number(voter, party):
+            return "high"
+
+        with pytest.raises(TypeError, match="not_a_number"):
+            KernelModel(not_a_number, ["age"], ["leader_age"]).compute_utility(
+                voter_data, party_data
+            )
+
     def test_proximity_weight(self):
         """Test proximity model with custom weight."""
         from electoral_sim import ProximityModel
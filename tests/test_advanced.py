@@ -21,6 +21,86 @@ class TestCoalitionFormation:
 
         assert callable(coalition_strain)
 
+    def test_minimum_winning_coalitions_matches_brute_force(self):
+        """Pruned bitmask search finds exactly the minimal winning subsets, in order."""
+        from itertools import combinations
+
+        from electoral_sim import minimum_winning_coalitions
+
+        seats = np.array([30, 25, 20, 15, 6, 4, 0])
+        majority = 51
+
+        expected = []
+        for size in range(1, len(seats) + 1):
+            for c in combinations(range(len(seats)), size):
+                total = seats[list(c)].sum()
+                if total >= majority and all(total - seats[p] < majority for p in c):
+                    expected.append((list(c), int(total)))
+
+        assert minimum_winning_coalitions(seats) == expected
+
+    def test_many_party_coalitions(self):
+        """Twenty parties enumerate quickly and share the cached result."""
+        from electoral_sim import form_government, minimum_connected_winning
+
+        rng = np.random.default_rng(0)
+        seats = rng.integers(1, 40, 20)
+        positions = rng.normal(size=20)
+
+        gov = form_government(seats, positions)
+        assert gov["success"]
+        assert gov["seats"] >= gov["majority"]
+
+        mcws = minimum_connected_winning(seats, positions, max_distance=10.0)
+        ranges = [r for _, _, r in mcws]
+        assert ranges == sorted(ranges)
+
+
+class TestPowerIndices:
+    """Tests for Banzhaf and Shapley-Shubik power indices."""
+
+    def test_known_values(self):
+        """[50, 49, 1] with quota 51: every party swings, the largest most often."""
+        from electoral_sim import power_indices
+
+        indices = power_indices(np.array([50, 49, 1]))
+
+        np.testing.assert_allclose(indices["banzhaf"], [0.6, 0.2, 0.2])
+        np.testing.assert_allclose(indices["shapley_shubik"], [2 / 3, 1 / 6, 1 / 6])
+
+    def test_dummy_and_dictator(self):
+        """Zero-seat parties have no power; a majority party has all of it."""
+        from electoral_sim import banzhaf_index, shapley_shubik_index
+
+        seats = np.array([60, 25, 15, 0])
+        np.testing.assert_allclose(banzhaf_index(seats), [1, 0, 0, 0])
+        np.testing.assert_allclose(shapley_shubik_index(seats), [1, 0, 0, 0])
+
+    def test_batched_matches_single(self):
+        """Batched computation equals per-parliament computation."""
+        from electoral_sim import power_indices
+
+        rng = np.random.default_rng(1)
+        batch = rng.integers(0, 50, (20, 8))
+        batched = power_indices(batch)
+
+        for b in range(len(batch)):
+            single = power_indices(batch[b])
+            np.testing.assert_allclose(batched["banzhaf"][b], single["banzhaf"])
+            np.testing.assert_allclose(batched["shapley_shubik"][b], single["shapley_shubik"])
+        np.testing.assert_allclose(batched["shapley_shubik"].sum(axis=1), 1.0)
+
+    def test_power_distribution_from_batch(self):
+        """Power distribution over run_elections_batch results."""
+        from electoral_sim import ElectionModel, power_distribution
+
+        model = ElectionModel(n_voters=2000, n_constituencies=15, electoral_system="PR", seed=2)
+        results = model.run_elections_batch(n_elections=3)
+
+        df = power_distribution(results, model.parties.df["name"].to_list())
+        assert len(df) == 3 * model.n_parties
+        assert set(df.columns) == {"election", "party", "seats", "banzhaf", "shapley_shubik"}
+
 
 class TestGovernmentSimulation:
     """Tests for government stability simulation."""
@@ -47,12 +127,89 @@ class TestGovernmentSimulation:
 
         assert GovernmentSimulator is not None
 
+    def test_hazard_curve_matches_scalar(self):
+        """Vectorised hazard curve equals collapse_probability month by month."""
+        from electoral_sim import collapse_hazard_curve, collapse_probability
+
+        curve = collapse_hazard_curve(0.4, 0.6, "linear", max_term=24)
+        expected = [collapse_probability(m, 0.4, 0.6, "linear", max_term=24) for m in range(1, 25)]
+        np.testing.assert_allclose(curve, expected)
+
+    def test_analytic_survival_matches_monte_carlo(self):
+        """Closed-form survival statistics agree with inverse-CDF draws."""
+        from electoral_sim import simulate_government_survival
+
+        exact = simulate_government_survival(0.3, 0.7, n_simulations=0)
+        mc = simulate_government_survival(0.3, 0.7, n_simulations=20000, seed=0)
+
+        assert mc["mean_survival"] == pytest.approx(exact["mean_survival"], rel=0.02)
+        assert mc["full_term_prob"] == pytest.approx(exact["full_term_prob"], abs=0.01)
+
+    def test_survival_batch(self):
+        """Batch over (strain, stability) pairs; more strain means shorter survival."""
+        from electoral_sim import government_survival_batch, survival_distribution
+
+        strain = np.array([0.0, 0.5, 1.5])
+        stability = np.array([0.9, 0.6, 0.2])
+        stats = government_survival_batch(strain, stability)
+
+        assert stats["mean_survival"].shape == (3,)
+        assert np.all(np.diff(stats["mean_survival"]) < 0)
+
+        dist = survival_distribution(strain, stability)
+        np.testing.assert_allclose(dist["pmf"].sum(axis=1), 1.0)
+
     def test_simulate_government_survival_import(self):
         """Test simulate_government_survival import."""
         from electoral_sim import simulate_government_survival
 
         assert callable(simulate_government_survival)
 
+    def test_government_fleet_matches_simulator(self):
+        """Test fleet survival times match the single-government simulator."""
+        from electoral_sim import GovernmentFleet, GovernmentSimulator
+
+        n = 2000
+        fleet = GovernmentFleet(strain=np.full(n, 0.3), stability=0.5, seed=3)
+        durations = fleet.simulate(max_months=60)
+        singles = [GovernmentSimulator(0.3, 0.5, seed=i).simulate(60) for i in range(n)]
+
+        assert durations.max() <= 60
+        assert abs(durations.mean() - np.mean(singles)) < 2.0
+        assert fleet.to_frame().height == n
+
+    def test_government_fleet_events(self):
+        """Test fleet events use ring buffers and raise collapse probability."""
+        from electoral_sim import GovernmentFleet
+
+        fleet = GovernmentFleet(strain=np.zeros(3), stability=0.5, event_capacity=2, seed=0)
+        fleet.months_in_office[:] = 1
+        base = fleet.collapse_probabilities()
+        fleet.add_events([1, 2, 2, 2], severity=[1.0, 0.5, 0.5, 2.0])
+
+        assert fleet.n_events.tolist() == [0, 1, 3]
+        # Government 2 keeps only its two most recent events
+        assert sorted(fleet.event_severity[2].tolist()) == [0.5, 2.0]
+        np.testing.assert_allclose(fleet.collapse_probabilities() - base, [0.0, 0.1, 0.25])
+
+    def test_government_fleet_cox_hazard(self):
+        """Test fleet with Cox proportional hazards."""
+        from electoral_sim import GovernmentFleet
+
+        fleet = GovernmentFleet(
+            strain=np.array([0.0, 1.0]),
+            stability=0.5,
+            hazard="cox",
+            covariates={"n_parties": np.array([2, 6])},
+            seed=1,
+        )
+        fleet.months_in_office[:] = 12
+        prob = fleet.collapse_probabilities()
+        assert prob[1] > prob[0]
+
+        with pytest.raises(ValueError):
+            GovernmentFleet(strain=np.zeros(2), stability=0.5, hazard="unknown")
+
 
 class TestFormGovernment:
     """Tests for government formation."""
@@ -251,3 +251,214 @@ class TestBatchRunner:
 
         with pytest.raises(ValueError, match="No results available"):
             runner.get_summary_stats()
+
+
+class TestSobolSensitivity:
+    """Test Saltelli sampling and Sobol index estimation."""
+
+    def test_saltelli_design_shape(self):
+        """Design has N * (d + 2) rows and AB_i differs from A only in column i."""
+        from electoral_sim.analysis import saltelli_sample
+
+        bounds = {"a": (0.0, 1.0), "b": (10.0, 20.0), "c": (-1.0, 1.0)}
+        X = saltelli_sample(bounds, 16, np.random.default_rng(0))
+
+        assert X.shape == (16 * 5, 3)
+        A, B = X[:16], X[16:32]
+        AB_1 = X[48:64]
+        assert np.array_equal(AB_1[:, 1], B[:, 1])
+        assert np.array_equal(AB_1[:, [0, 2]], A[:, [0, 2]])
+        assert X[:, 1].min() >= 10.0 and X[:, 1].max() <= 20.0
+
+    def test_indices_linear_model(self):
+        """Analytic check: y = 4*x1 + x2 (x3 inert) has S1 = ST = (16/17, 1/17, 0)."""
+        from electoral_sim.analysis import saltelli_sample, sobol_indices
+
+        bounds = {"x1": (0.0, 1.0), "x2": (0.0, 1.0), "x3": (0.0, 1.0)}
+        X = saltelli_sample(bounds, 4096, np.random.default_rng(1))
+        y = 4 * X[:, 0] + X[:, 1]
+
+        indices = sobol_indices(y, 3, n_bootstrap=50, seed=0)
+
+        np.testing.assert_allclose(indices["S1"], [16 / 17, 1 / 17, 0.0], atol=0.05)
+        np.testing.assert_allclose(indices["ST"], [16 / 17, 1 / 17, 0.0], atol=0.05)
+        assert np.all(indices["S1_conf"] >= 0)
+
+    def test_sobol_sweep_configs(self):
+        """Sobol sweep keeps integer ranges as ints and applies fixed params."""
+        sweep = ParameterSweep(
+            {"n_voters": [500, 1500], "temperature": [0.2, 1.0]},
+            sweep_type="sobol",
+            n_samples=8,
+            fixed_params={"n_constituencies": 3},
+            seed=7,
+        )
+        configs = sweep.generate_configs()
+
+        assert len(configs) == len(sweep) == 8 * 4
+        assert all(isinstance(c["n_voters"], int) for c in configs)
+        assert all(0.2 <= c["temperature"] <= 1.0 for c in configs)
+        assert configs == sweep.generate_configs()  # Seeded design
+
+    def test_sobol_sweep_requires_ranges(self):
+        """Sobol sweep parameters must be [low, high] pairs."""
+        sweep = ParameterSweep({"a": [1, 2, 3]}, sweep_type="sobol")
+        with pytest.raises(ValueError, match="low, high"):
+            sweep.generate_configs()
+
+    def test_batch_runner_sobol_indices(self):
+        """End-to-end Sobol analysis on ElectionModel outputs."""
+        sweep = ParameterSweep(
+            {"temperature": [0.1, 1.0], "anti_incumbency": [-0.5, 0.0]},
+            sweep_type="sobol",
+            n_samples=8,
+            fixed_params={"n_voters": 1000, "n_constituencies": 3},
+            seed=3,
+        )
+        runner = BatchRunner(ElectionModel, sweep, seed=42, verbose=False)
+        runner.run()
+
+        indices = runner.get_sobol_indices(n_bootstrap=20)
+
+        assert len(indices) == 5 * 2  # 5 metrics x 2 parameters
+        assert set(indices["parameter"].to_list()) == {"temperature", "anti_incumbency"}
+        assert indices["ST"].is_finite().all()
+
+    def test_sobol_indices_require_sobol_sweep(self):
+        """Non-Sobol sweeps cannot produce Sobol indices."""
+        sweep = ParameterSweep({"n_voters": [1000]}, fixed_params={"n_constituencies": 3})
+        runner = BatchRunner(ElectionModel, sweep, seed=1, verbose=False)
+        runner.run()
+
+        with pytest.raises(ValueError, match="sweep_type='sobol'"):
+            runner.get_sobol_indices()
+
+
+class TestSystemComparison:
+    """Test paired system comparison with common random numbers."""
+
+    def test_shared_ballots_across_systems(self):
+        """Every system counts the same turnout and vote totals in a replicate."""
+        from electoral_sim.analysis import compare_systems
+
+        model = ElectionModel(n_voters=2000, n_constituencies=5, seed=11)
+        comp = compare_systems(
+            model,
+            ["FPTP", "PR", {"electoral_system": "PR", "allocation_method": "sainte_lague"}],
+            n_replicates=3,
+        )
+
+        assert len(comp.results_df) == 3 * 3
+        assert comp.baseline == "FPTP"
+        per_rep = comp.results_df.group_by("replicate").agg(
+            pl.col("turnout").n_unique(), pl.col("enp_votes").n_unique()
+        )
+        assert (per_rep["turnout"] == 1).all()
+        assert (per_rep["enp_votes"] == 1).all()
+
+        # Vote-based metrics are identical, so their paired difference is zero
+        assert (comp.differences_df["enp_votes"] == 0).all()
+        assert set(comp.differences_df["system"].to_list()) == {"PR", "PR-sainte_lague"}
+
+    def test_summary_and_model_state(self):
+        """Counting does not mutate model results; summary has one row per metric."""
+        from electoral_sim.analysis import compare_systems
+
+        model = ElectionModel(n_voters=1000, n_constituencies=4, seed=5)
+        comp = compare_systems(model, ["FPTP", "PR"], n_replicates=4)
+        summary = comp.summary()
+
+        assert model.election_results == []
+        assert len(summary) == 5  # 1 system x 5 metrics
+        assert (summary["se_diff"] >= 0).all()
+
+    def test_duplicate_labels_raise(self):
+        """System labels must be unique."""
+        from electoral_sim.analysis import compare_systems
+
+        model = ElectionModel(n_voters=500, n_constituencies=2, seed=1)
+        with pytest.raises(ValueError, match="unique"):
+            compare_systems(model, ["PR", "PR"])
+
+
+class TestRedistrictingEnsemble:
+    """Tests for ReCom redistricting ensembles."""
+
+    @staticmethod
+    def _is_contiguous(plan, edges, district):
+        """Flood fill one district over the precinct graph."""
+        members = set(np.flatnonzero(plan == district).tolist())
+        neighbours = {m: [] for m in members}
+        for u, v in edges.tolist():
+            if u in members and v in members:
+                neighbours[u].append(v)
+                neighbours[v].append(u)
+        seen, stack = set(), [next(iter(members))]
+        while stack:
+            u = stack.pop()
+            if u not in seen:
+                seen.add(u)
+                stack.extend(neighbours[u])
+        return seen == members
+
+    def test_plans_are_contiguous_and_balanced(self):
+        """Every recorded plan keeps contiguity and the population tolerance."""
+        from electoral_sim.analysis import RedistrictingEnsemble, grid_graph
+
+        rng = np.random.default_rng(0)
+        edges = grid_graph(12, 12)
+        population = rng.integers(80, 120, 144)
+        votes_a = rng.binomial(population, 0.5)
+        tallies = np.column_stack([votes_a, population - votes_a])
+
+        ensemble = RedistrictingEnsemble(edges, tallies, n_districts=6, tolerance=0.05)
+        result = ensemble.run(n_steps=60, n_chains=2, thin=3, seed=4)
+
+        assert result.plans.shape == (40, 144)
+        np.testing.assert_array_equal(np.bincount(result.chain), [20, 20])
+        assert (result.acceptance_rate > 0.5).all()
+        ideal = population.sum() / 6
+        for plan in result.plans[::5]:
+            district_pop = np.bincount(plan, weights=population, minlength=6)
+            assert np.abs(district_pop / ideal - 1).max() <= 0.05
+            assert all(self._is_contiguous(plan, edges, d) for d in range(6))
+
+        again = ensemble.run(n_steps=60, n_chains=2, thin=3, seed=4)
+        np.testing.assert_array_equal(again.plans, result.plans)
+
+        with pytest.raises(ValueError, match="tolerance"):
+            ensemble.run(n_steps=1, initial_plan=np.zeros(144, dtype=int))
+
+    def test_scores_from_precinct_tallies(self):
+        """Batch scores match per-plan tallies and the scalar efficiency gap."""
+        from electoral_sim.analysis import RedistrictingEnsemble, grid_graph
+        from electoral_sim.metrics.indices import efficiency_gap
+
+        model = ElectionModel(n_voters=8000, n_constituencies=64, seed=2)
+        tallies = model.cast_ballots().constituency_tallies
+        ensemble = RedistrictingEnsemble(grid_graph(8, 8), tallies, n_districts=4, tolerance=0.1)
+        result = ensemble.run(n_steps=20, n_chains=1, seed=1)
+
+        plan = result.plans[-1]
+        for d in range(4):
+            np.testing.assert_array_equal(
+                result.district_tallies[-1, d], tallies[plan == d].sum(axis=0)
+            )
+        np.testing.assert_array_equal(result.seats.sum(axis=1), 4)
+
+        a, b = result.district_tallies[-1, :, 0], result.district_tallies[-1, :, 1]
+        a_won = result.district_tallies[-1].argmax(axis=1) == 0
+        expected = efficiency_gap(a, b, a_won.astype(int))
+        assert result.efficiency_gap[-1] == pytest.approx(expected)
+        assert result.percentile("efficiency_gap", result.efficiency_gap.max()) == 1.0
+
+    def test_tied_district_has_one_winner(self):
+        """A tied district counts as the same party's win for seats and efficiency gap."""
+        from electoral_sim.analysis import score_plans
+        from electoral_sim.metrics.indices import efficiency_gap
+
+        tallies = np.array([[50, 50], [30, 70]])
+        scores = score_plans(np.array([[0, 1]]), tallies, n_districts=2)
+        np.testing.assert_array_equal(scores["seats"], [[1, 1]])
+        expected = efficiency_gap(tallies[:, 0], tallies[:, 1], np.array([1, 0]))
+        assert scores["efficiency_gap"][0] == pytest.approx(expected)
@@ -124,6 +124,113 @@ class TestAlternativeVotingSystems:
         assert rankings.shape == (3, 3)
 
 
+class TestBallotSetCounting:
+    """Tests for BallotSet and the multi-system counting dispatcher."""
+
+    @staticmethod
+    def _ballots():
+        from electoral_sim.core import BallotSet
+
+        # Two constituencies, three parties; plurality choice is the utility favourite
+        utilities = np.array(
+            [
+                [3.0, 2.0, 1.0],
+                [3.0, 2.0, 1.0],
+                [1.0, 3.0, 2.0],
+                [1.0, 2.0, 3.0],
+                [1.0, 2.0, 3.0],
+                [3.0, 1.0, 2.0],
+                [1.0, 3.0, 2.0],
+                [2.0, 3.0, 1.0],
+            ]
+        )
+        votes = utilities.argmax(axis=1)
+        will_vote = np.array([True] * 5 + [True, True, False])
+        constituencies = np.array([0, 0, 0, 0, 0, 1, 1, 1])
+        return BallotSet(utilities, votes, will_vote, constituencies, n_constituencies=2)
+
+    def test_shared_tallies(self):
+        """First preferences, compressed rankings and pairwise matrix."""
+        ballots = self._ballots()
+
+        np.testing.assert_array_equal(ballots.constituency_tallies, [[2, 1, 2], [1, 1, 0]])
+        np.testing.assert_array_equal(ballots.first_preferences, [3, 2, 2])
+        assert ballots.turnout == 7 / 8
+
+        cid, rankings, counts = ballots.compressed_rankings
+        assert counts.sum() == 7
+        assert len(cid) == 5  # Duplicate rankings collapse
+        assert ballots.pairwise[1, 0] == 4  # B over A on 4 of 7 counted ballots
+
+    def test_single_winner_rules(self):
+        """FPTP, IRV and Condorcet rules diverge on the same ballots."""
+        from electoral_sim.core import condorcet_winners, count_ballots
+
+        ballots = self._ballots()
+
+        # Constituency 0: A and C tie on first preferences (A wins on index),
+        # B is eliminated under IRV and transfers to C; B is the Condorcet winner
+        assert count_ballots(ballots, "FPTP")["winners"][0] == 0
+        assert count_ballots(ballots, "IRV")["winners"][0] == 2
+        assert condorcet_winners(ballots)[0] == 1
+        assert count_ballots(ballots, "minimax")["winners"][0] == 1
+        assert count_ballots(ballots, "copeland")["winners"][0] == 1
+
+    def test_two_round_qualifiers(self):
+        """Top-two and registered-share qualifying, ranked and sampled runoffs."""
+        from electoral_sim.core import count_ballots, runoff_qualifiers
+
+        ballots = self._ballots()
+        np.testing.assert_array_equal(ballots.registered, [5, 3])
+
+        # No majority anywhere: top two qualify; B's 1 vote is 20% of registered
+        top_two = runoff_qualifiers(ballots.constituency_tallies)
+        np.testing.assert_array_equal(top_two, [[True, False, True], [True, True, False]])
+        wide = runoff_qualifiers(ballots.constituency_tallies, ballots.registered, 0.2)
+        np.testing.assert_array_equal(wide[0], [True, True, True])
+        assert not runoff_qualifiers(np.array([[3, 1, 1]])).any()
+
+        # B's voter transfers to C in the A-C runoff; a three-way runoff repeats
+        # the A-C tie, which goes to A on index
+        assert count_ballots(ballots, "TRS")["winners"][0] == 2
+        result = count_ballots(ballots, "TRS", runoff_qualify=0.2)
+        assert result["winners"][0] == 0
+        assert result["runoffs"] == 2
+
+        # Sampled second-round ballots take precedence over rankings
+        ballots.set_runoff(top_two, np.array([0, 0, 0, 2, 2, 1, 1]))
+        np.testing.assert_array_equal(ballots.runoff_tallies, [[3, 0, 2], [0, 2, 0]])
+        np.testing.assert_array_equal(count_ballots(ballots, "TRS")["winners"], [0, 1])
+
+    def test_all_systems_allocate_seats(self):
+        """Every system returns seats and the shared first-preference counts."""
+        from electoral_sim.core import COUNTING_SYSTEMS, count_ballots
+
+        ballots = self._ballots()
+        for system in COUNTING_SYSTEMS:
+            result = count_ballots(ballots, system, district_magnitude=2)
+            np.testing.assert_array_equal(result["vote_counts"], [3, 2, 2])
+            # STV elects 2 per constituency; MMP adds as many list seats as districts
+            expected = 4 if system in ("STV", "MMP") else 2
+            assert result["seats"].sum() == expected, system
+
+        with pytest.raises(ValueError, match="Unknown system"):
+            count_ballots(ballots, "borda")
+
+    def test_model_counts_alternative_systems(self):
+        """ElectionModel counts one ballot set under several systems."""
+        from electoral_sim import ElectionModel
+
+        model = ElectionModel(n_voters=5000, n_constituencies=10, seed=4)
+        ballots = model.cast_ballots()
+        for system in ["FPTP", "TRS", "IRV", "approval"]:
+            result = model.count_ballots(ballots, system)
+            assert result["seats"].sum() == 10
+            assert np.isfinite(result["vse"])
+
+        assert model.with_system("IRV").run_election()["system"] == "IRV"
+
+
 class TestCoalitionBasics:
     """Basic tests for coalition module."""
 
@@ -451,6 +451,68 @@ class TestPresetFeatureIntegration:
         # The Reserved party should win the reserved constituency
         assert results["seats"][1] >= 1
 
+    def test_reserved_constituency_eligibility_mask(self):
+        """Test reserved seats redistribute choices instead of invalidating votes."""
+        from electoral_sim import ElectionModel
+        from electoral_sim.engine.numba_accel import mnl_sample
+
+        parties = [
+            {"name": "General", "position_x": 0.2, "position_y": 0.2},
+            {"name": "Reserved", "position_x": -0.2, "position_y": -0.2},
+            {"name": "Other", "position_x": 0.5, "position_y": -0.5},
+        ]
+        model = ElectionModel(
+            n_voters=3000,
+            n_constituencies=3,
+            parties=parties,
+            constituency_constraints={0: ["Reserved", "Other"], 2: ["Reserved"]},
+            metrics=("gallagher", "vse"),
+            seed=42,
+        )
+        eligible = model._eligibility()
+        assert eligible.tolist() == [
+            [False, True, True],
+            [True, True, True],
+            [False, True, False],
+        ]
+        assert model._eligibility() is eligible  # Compiled once
+
+        ballots = model.cast_ballots()
+        constituencies = model.voters.get_constituencies()
+        assert eligible[constituencies, ballots.votes].all()
+        # Every voter who turned out casts a counted ballot
+        np.testing.assert_array_equal(ballots.counted, ballots.will_vote)
+        n_counted = ballots.will_vote[constituencies == 2].sum()
+        assert ballots.constituency_tallies[2].tolist() == [0, n_counted, 0]
+        # Derived ballots respect the mask too
+        cid = ballots.constituencies
+        assert (ballots.rankings[cid == 2, 0] == 1).all()
+        assert not ballots.approvals[~eligible[cid]].any()
+        assert (ballots.scores[~eligible[cid]] == 0).all()
+
+        # Alienation and indifference only look at eligible parties: every
+        # voter in constituency 2 has a single option, so all are indifferent
+        utilities = np.zeros((3000, 3))
+        utilities[:, 0] = 5.0  # Close only to the ineligible General party
+        utilities[:, 1] = -3.0
+        prob = model._turnout_probability(utilities)
+        base = model.voters.get_turnout_prob()
+        in_two = constituencies == 2
+        np.testing.assert_allclose(prob[in_two], np.clip(base[in_two] - 0.5, 0.1, 1.0))
+        in_one = constituencies == 1
+        np.testing.assert_allclose(prob[in_one], base[in_one])
+
+        # Kernel and NumPy fallback agree on the masked choice set
+        utilities = np.zeros((4, 3))
+        r = np.array([0.1, 0.6, 0.1, 0.9])
+        votes = mnl_sample(utilities, 1.0, r, np.array([0, 0, 2, 1], dtype=np.int32), eligible)
+        assert votes.tolist() == [1, 2, 1, 2]
+
+        with pytest.raises(ValueError):
+            ElectionModel(
+                n_voters=100, parties=parties, constituency_constraints={0: ["Nobody"]}
+            ).cast_ballots()
+
     def test_india_simulation(self):
         """Test India-specific election simulation."""
         from electoral_sim import simulate_india_election
@@ -463,6 +525,39 @@ class TestPresetFeatureIntegration:
         assert result.nda_seats >= 0
         assert result.india_seats >= 0
 
+    def test_india_tally_matrix(self):
+        """Test India results agree with the national tally matrix, for any n_jobs."""
+        from electoral_sim import simulate_india_election
+
+        result = simulate_india_election(
+            n_voters_per_constituency=100, seed=7, verbose=False, include_nota=True
+        )
+        pcs = result.constituency_results
+        assert len(pcs) == 543
+
+        # Seats are the PC winners; NOTA never takes a seat
+        won = pcs.filter(pl.col("winner") != "NOTA")["winner"].value_counts()
+        assert dict(zip(won["winner"], won["count"])) == {
+            p: n for p, n in result.seats.items() if n > 0
+        }
+        assert (pcs["margin"] >= 0).all()
+        contested = pcs.filter(
+            (pl.col("nota_votes") > pl.col("margin")) & (pl.col("winner") != "NOTA")
+        )
+        assert len(contested) == result.nota_contested_seats
+
+        # State totals are the grouped PC rows
+        by_state = pcs.group_by("state").agg(pl.col("votes_cast").sum())
+        for state, votes_cast in zip(by_state["state"], by_state["votes_cast"]):
+            assert sum(result.state_results[state]["votes"].values()) == votes_cast
+        assert len(result.voter_df) == 100 * len(result.state_results)
+
+        parallel = simulate_india_election(
+            n_voters_per_constituency=100, seed=7, verbose=False, include_nota=True, n_jobs=2
+        )
+        assert parallel.seats == result.seats
+        assert parallel.constituency_results.equals(pcs)
+
     def test_voter_knowledge_attributes(self):
         """Test political_knowledge and misinfo_susceptibility voter attributes."""
         from electoral_sim import ElectionModel
@@ -684,6 +779,64 @@ class TestP3Features:
         assert perception.min() >= 0
         assert perception.max() <= 1
 
+    def test_column_requests(self):
+        """Engine should fetch only the declared columns, as cached arrays."""
+        from electoral_sim import (
+            BehaviorEngine,
+            ElectionModel,
+            ProximityModel,
+            SociotropicPocketbookModel,
+        )
+
+        engine = BehaviorEngine()
+        engine.add_model(ProximityModel())
+        engine.add_model(SociotropicPocketbookModel())
+        engine.add_kernel(lambda v, p: 0.0, voter_columns=["age"], party_columns=["valence"])
+        plan = engine.compile()
+        assert plan.voter_columns == ("economic_perception", "personal_income_change", "age")
+        assert plan.party_columns == ("valence",)
+
+        model = ElectionModel(n_voters=1000, seed=42, behavior_engine=engine)
+        columns = model.voters.get_columns(plan.voter_columns)
+        # personal_income_change is optional and absent from generated voters
+        assert set(columns) == {"economic_perception", "age"}
+        assert model.voters.get_column("age") is columns["age"]
+        with pytest.raises(KeyError):
+            model.voters.get_column("shoe_size")
+
+        model.voters.df = model.voters.df.with_columns(pl.lit(30).alias("age"))
+        model.voters.invalidate_cache()
+        assert (model.voters.get_column("age") == 30).all()
+        assert model.run_election()["vote_counts"].sum() > 0
+
+    def test_agent_store_in_place_updates(self):
+        """Column updates should write into the buffers and keep old frames intact."""
+        from electoral_sim import ElectionModel
+
+        model = ElectionModel(n_voters=500, seed=42)
+        voters = model.voters
+        buffer = voters.get_ideology_x()
+        positions = voters.get_positions()
+        assert voters.get_positions() is positions
+
+        voters.set_columns({"ideology_x": np.zeros(500)})
+        assert voters.get_ideology_x() is buffer
+        assert buffer.dtype == np.float32 and (buffer == 0).all()
+        assert (voters.get_positions()[:, 0] == 0).all()
+        assert voters.df["ideology_x"].sum() == 0
+
+        # A frame handed out through .df is never changed by later updates
+        frame = voters.df
+        voters.set_columns({"ideology_x": np.ones(500)})
+        assert frame["ideology_x"].sum() == 0
+        assert voters.df["ideology_x"].sum() == 500
+        with pytest.raises(ValueError):
+            voters.set_columns({"ideology_x": np.ones(3)})
+
+        model.run_election()
+        assert model.parties.df["seats"].sum() == model.n_constituencies
+        assert model.parties.get_names() == model.parties.df["name"].to_list()
+
     def test_sociotropic_pocketbook_model(self):
         """Test SociotropicPocketbookModel computes utility correctly."""
         from electoral_sim import SociotropicPocketbookModel
@@ -766,6 +919,176 @@ class TestP3Features:
         assert result.eurosceptic_seats >= 0
         assert result.turnout > 0 and result.turnout < 1
 
+    def test_eu_national_rules(self):
+        """Test per-country methods and thresholds with batched allocation."""
+        from electoral_sim.presets.eu.election import (
+            EU_NATIONAL_METHODS,
+            EU_NATIONAL_THRESHOLDS,
+            simulate_eu_election,
+        )
+        from electoral_sim.systems.allocation import allocate_seats
+
+        result = simulate_eu_election(
+            n_voters_per_mep=200,
+            seed=3,
+            verbose=False,
+            allocation_method=EU_NATIONAL_METHODS,
+            threshold={**EU_NATIONAL_THRESHOLDS, "Italy": 0.25},
+        )
+        assert sum(result.seats.values()) == 720
+
+        for country, data in result.country_results.items():
+            votes = np.array(list(data["votes"].values()))
+            expected = allocate_seats(
+                votes, sum(data["seats"].values()), data["method"], data["threshold"]
+            )
+            assert list(data["seats"].values()) == expected.tolist(), country
+        italy = result.country_results["Italy"]
+        assert italy["method"] == "hare"
+        # A 25% threshold leaves at most three groups with seats
+        assert sum(seats > 0 for seats in italy["seats"].values()) <= 3
+
+        parallel = simulate_eu_election(
+            n_voters_per_mep=200,
+            seed=3,
+            verbose=False,
+            allocation_method=EU_NATIONAL_METHODS,
+            threshold={**EU_NATIONAL_THRESHOLDS, "Italy": 0.25},
+            n_jobs=2,
+        )
+        assert parallel.country_results == result.country_results
+
+    def test_mmp_counting(self):
+        """Test MMP counting with split tickets from one utility pass."""
+        from electoral_sim import ElectionModel
+
+        model = ElectionModel.from_preset("germany", n_voters=30_000, seed=4)
+        assert model.electoral_system == "MMP"
+        ballots = model.cast_ballots()
+        assert 0 < ballots.split_ticket_share < 0.5
+
+        results = model.count_ballots(ballots)
+        assert results["system"] == "MMP"
+        assert results["direct_seats"].sum() == (results["winners"] >= 0).sum()
+        assert results["seats"].sum() == results["house_size"] >= 598
+        assert (results["seats"] >= results["direct_seats"]).all()
+        np.testing.assert_array_equal(results["vote_counts"], ballots.list_preferences)
+        np.testing.assert_array_equal(results["district_vote_counts"], ballots.first_preferences)
+
+        # Same temperature: both ballots come from the same draw, so tickets match
+        straight = ElectionModel.from_preset(
+            "germany", n_voters=30_000, seed=4, list_temperature=0.5
+        ).cast_ballots()
+        assert straight.split_ticket_share == 0.0
+        np.testing.assert_array_equal(straight.list_preferences, straight.first_preferences)
+
+        # Ballots cast for another system count MMP as straight tickets
+        fptp = ElectionModel(n_voters=3000, n_constituencies=5, seed=4)
+        fptp_results = fptp.count_ballots(fptp.cast_ballots(), electoral_system="MMP")
+        assert fptp_results["split_ticket_share"] == 0.0
+        assert fptp_results["house_size"] >= 10
+
+    def test_two_round_resample(self):
+        """Test TRS second rounds resample only runoff voters among qualifiers."""
+        from electoral_sim import ElectionModel
+
+        model = ElectionModel.from_preset("france", n_voters=20_000, n_constituencies=20, seed=6)
+        assert model.electoral_system == "TRS"
+        ballots = model.cast_ballots()
+        qualifiers = ballots.runoff_qualifiers
+        runoff = qualifiers.any(axis=1)
+        assert runoff.any()
+
+        in_runoff = runoff[ballots.constituencies]
+        votes = ballots.runoff_votes
+        assert (votes[~in_runoff] == -1).all()
+        assert qualifiers[ballots.constituencies[in_runoff], votes[in_runoff]].all()
+        assert ballots.runoff_tallies[runoff].sum() == in_runoff.sum()
+
+        results = model.count_ballots(ballots)
+        assert results["runoffs"] == runoff.sum()
+        assert qualifiers[runoff, results["winners"][runoff]].all()
+        decided = ~runoff & (ballots.constituency_tallies.sum(axis=1) > 0)
+        np.testing.assert_array_equal(
+            results["winners"][decided], ballots.constituency_tallies[decided].argmax(axis=1)
+        )
+
+        president = ElectionModel.from_preset("brazil_presidential", n_voters=20_000, seed=6)
+        assert president.run_election()["seats"].sum() == 1
+
+    def test_regional_election(self):
+        """Test mixed FPTP / PR regions, seatless options and custom engines."""
+        from electoral_sim import (
+            BehaviorEngine,
+            ProximityModel,
+            Region,
+            RegionalBiasModel,
+            RegionalElection,
+        )
+        from electoral_sim.systems.allocation import allocate_seats
+
+        parties = {
+            "A": {"position_x": -0.3, "position_y": 0.0, "valence": 50},
+            "B": {"position_x": 0.3, "position_y": 0.0, "valence": 50},
+            "None": {"position_x": 0.0, "position_y": 0.0, "valence": 0},
+        }
+        regions = [
+            Region("North", 6, {"A": 1.0}, ideology_shift=(-0.2, 0.0)),
+            Region("South", 4, {"B": 1.0}, turnout=lambda rng: 0.5),
+            Region("Capital", 5, {"None": 0.2}, allocation="sainte_lague", threshold=0.1),
+        ]
+        election = RegionalElection(parties, regions, voters_per_seat=300, seatless=("None",))
+        result = election.run(seed=5, sample_size=10)
+
+        np.testing.assert_array_equal(result.seats.sum(axis=1), [6, 4, 5])
+        assert result.seats[:, 2].sum() == 0
+        assert result.seats[0, 0] > result.seats[0, 1]
+        assert result.seats[1, 1] > result.seats[1, 0]
+        assert len(result.district_tallies) == 10
+        np.testing.assert_array_equal(result.district_tallies.sum(axis=0), result.votes[:2].sum(0))
+        assert result.votes[1].sum() / result.voters[1] == pytest.approx(0.5, abs=0.05)
+        expected = allocate_seats(result.votes[2] * [1, 1, 0], 5, "sainte_lague", 0.1)
+        np.testing.assert_array_equal(result.seats[2], expected)
+        assert len(result.sample_votes) == 30
+
+        engine = BehaviorEngine()
+        engine.add_model(ProximityModel(weight=0.3))
+        custom = RegionalElection(parties, regions, voters_per_seat=300, behavior_engine=engine)
+        assert any(isinstance(m, RegionalBiasModel) for m, _ in custom.behavior_engine.models)
+        assert len(engine.models) == 1  # the caller's engine is not modified
+        assert sum(custom.run(seed=5).total_seats.values()) == 15
+
+        # Voters follow the parties into a third issue dimension
+        parties_3d = {name: {**p, "position_2": 0.5} for name, p in parties.items()}
+        result_3d = RegionalElection(parties_3d, regions, voters_per_seat=300).run(
+            seed=5, sample_size=10
+        )
+        assert result_3d.sample_positions.shape == (30, 3)
+
+        with pytest.raises(ValueError):
+            RegionalElection(parties, [Region("X", 1, allocation="borda")])
+
+    def test_usa_presidential_electoral_college(self):
+        """Test the Electoral College preset and its state-level Monte Carlo."""
+        from electoral_sim import USA_STATES, simulate_usa_presidential
+
+        result = simulate_usa_presidential(voters_per_seat=200, seed=3, verbose=False)
+        assert sum(result.electoral_votes.values()) == 538
+        assert result.majority_threshold == 270
+        assert result.state_results["California"]["electoral_votes"]["Democratic"] == 54
+        assert result.state_results["Wyoming"]["electoral_votes"]["Republican"] == 3
+        # District rule: Maine and Nebraska districts carry their own leans
+        assert result.state_results["Nebraska"]["electoral_votes"]["Democratic"] == 1
+        assert len(result.district_state) == 5
+        assert result.state_shares.shape == (len(USA_STATES), 2)
+
+        scenarios = result.monte_carlo(n_scenarios=20_000, seed=3)
+        np.testing.assert_array_equal(scenarios["electoral_votes"].sum(axis=1), 538)
+        total = scenarios["win_probability"].sum() + scenarios["no_majority_probability"]
+        assert total == pytest.approx(1.0)
+        california = list(USA_STATES).index("California")
+        assert scenarios["state_win_probability"][california, 0] == 1.0
+
     def test_big_five_personality_columns(self):
         """Test Big Five (OCEAN) personality trait columns."""
         from electoral_sim import ElectionModel
@@ -975,6 +1298,101 @@ class TestP4Features:
         # Party 0 should lose votes
         assert res_scandal[0] < res_base[0]
 
+    def test_p4_event_modifier_arrays(self):
+        """Test valence modifiers come back as a decaying per-party array."""
+        from electoral_sim.events import Event, EventManager
+
+        manager = EventManager(np.random.default_rng(0), prob_scandal=0.0, prob_shock=0.0)
+        manager.add_event(
+            Event(id=0, type="scandal", start_step=0, duration=4, severity=8.0, target_party_id=1)
+        )
+        manager.add_event(
+            Event(id=1, type="economic_shock", start_step=0, duration=2, severity=-2.0)
+        )
+
+        np.testing.assert_allclose(manager.get_valence_modifiers(3), [0.0, -8.0, 0.0])
+        assert manager.get_economic_modifier() == -2.0
+
+        manager.step(3)
+        np.testing.assert_allclose(manager.get_valence_modifiers(3), [0.0, -6.0, 0.0])
+        assert manager.get_economic_modifier() == -1.0
+
+        for _ in range(3):
+            manager.step(3)
+        assert manager.active_events == []
+        assert len(manager.history) == 2
+
+    def test_p4_event_lists_write_through(self):
+        """Test mutating the event lists keeps the column store in sync."""
+        from electoral_sim.events import Event, EventManager
+
+        manager = EventManager(np.random.default_rng(0), prob_scandal=0.0, prob_shock=0.0)
+        scandal = Event(
+            id=0, type="scandal", start_step=0, duration=4, severity=8.0, target_party_id=1
+        )
+        shock = Event(id=1, type="economic_shock", start_step=0, duration=4, severity=-2.0)
+        later = Event(
+            id=2, type="scandal", start_step=5, duration=2, severity=1.0, target_party_id=0
+        )
+
+        manager.active_events += [scandal, shock]
+        manager.scheduled.append(later)
+        assert [e.id for e in manager.active_events] == [0, 1]
+        assert [e.id for e in manager.scheduled] == [2]
+
+        # Removing from active_events ends the event but keeps it in history
+        manager.active_events.remove(scandal)
+        np.testing.assert_allclose(manager.get_valence_modifiers(3), [0.0, 0.0, 0.0])
+        assert [e.id for e in manager.history] == [0, 1]
+
+        # Reassignment keeps only the listed events active
+        manager.active_events = []
+        assert manager.get_economic_modifier() == 0.0
+
+        # Removing from history or scheduled deletes the event
+        del manager.scheduled[0]
+        manager.history.pop(0)
+        assert [e.id for e in manager.history] == [1]
+        assert manager.scheduled == []
+        assert len(manager.columns["id"]) == 1
+        with pytest.raises(ValueError):
+            manager.remove_event(7)
+
+    def test_p4_event_timeline_replay(self):
+        """Test scheduled timelines and batched streams agree with stepping."""
+        import polars as pl
+        from electoral_sim.events import EventManager, EventStreams
+
+        timeline = pl.DataFrame(
+            {
+                "type": ["scandal", "economic_shock"],
+                "start_step": [2, 3],
+                "duration": [4, 6],
+                "severity": [10.0, -2.0],
+                "target_party_id": [1, None],
+            }
+        )
+        manager = EventManager.from_timeline(timeline)
+        assert manager.history == [] and len(manager.scheduled) == 2
+        manager.step(3)
+        assert manager.active_events == []
+        manager.step(3)
+        manager.step(3)
+        np.testing.assert_allclose(manager.get_valence_modifiers(3), [0.0, -7.5, 0.0])
+        assert manager.get_economic_modifier() == -2.0
+        assert [e.type for e in manager.history] == ["scandal", "economic_shock"]
+        assert manager.scheduled == []
+
+        streams = EventStreams.sample(n_streams=50, n_steps=24, n_parties=4, seed=1)
+        valence = streams.valence_modifiers(step=12, n_parties=4)
+        assert valence.shape == (50, 4)
+
+        replay = streams.manager(7)
+        for _ in range(12):
+            replay.step(4)
+        np.testing.assert_allclose(replay.get_valence_modifiers(4), valence[7])
+        assert np.isclose(replay.get_economic_modifier(), streams.economic_modifiers(12)[7])
+
     def test_p4_adaptive_strategy(self):
         """Test P4 Adaptive Strategy (Median Voter Theorem)."""
         from electoral_sim import ElectionModel
@@ -1016,6 +1434,44 @@ class TestP4Features:
         # We just check it's a float.
         assert isinstance(res["vse"], float)
 
+    def test_vse_metric_selection(self):
+        """VSE can be skipped, and per-constituency VSE requested."""
+        from electoral_sim import ElectionModel
+        from electoral_sim.analysis.vse import calculate_vse
+
+        model = ElectionModel(n_voters=2000, n_constituencies=5, seed=7)
+        ballots = model.cast_ballots()
+        res = model.count_ballots(ballots, metrics=("vse", "constituency_vse"))
+
+        # Welfare accumulated while voting matches a full pass over utilities
+        seat_shares = res["seats"] / res["seats"].sum()
+        assert res["vse"] == pytest.approx(calculate_vse(ballots.utilities, seat_shares))
+        assert res["constituency_vse"].shape == (5,)
+        assert "gallagher" in res and "enp_votes" in res  # always reported
+
+        skipped = ElectionModel(n_voters=2000, seed=7, metrics=("vse",))
+        assert "vse" in skipped.run_election()
+        skipped.metrics = ("gallagher",)
+        assert "vse" not in skipped.run_election()
+        assert skipped.get_aggregate_stats()["n_elections"] == 2
+
+        with pytest.raises(ValueError, match="Unknown metrics"):
+            model.run_election(metrics=("vse", "utility"))
+
+    def test_monte_carlo_vse(self):
+        """Monte Carlo VSE across honest/strategic voter mixes."""
+        from electoral_sim import ElectionModel
+        from electoral_sim.analysis.vse import monte_carlo_vse
+
+        model = ElectionModel(n_voters=2000, n_constituencies=4, seed=3)
+        df = monte_carlo_vse(
+            model, strategic_fractions=(0.0, 1.0), systems=("FPTP", "PR"), n_replicates=2
+        )
+
+        assert len(df) == 2 * 2 * 2
+        assert df.filter(pl.col("system") == "FPTP")["district_vse"].is_finite().all()
+        assert df.filter(pl.col("system") == "PR")["district_vse"].is_nan().all()
+
     def test_policy_office_tradeoff(self):
         """Test P4 Policy vs Office Tradeoff in Coalition Formation."""
         from electoral_sim.engine.coalition import form_coalition_with_utility
@@ -42,6 +42,32 @@ class TestElectoralSystems:
         assert int(seats[0]) == 1  # Party 0 wins constituency 0
         assert int(seats[1]) == 1  # Party 1 wins constituency 1
 
+    def test_canonical_index_dtypes(self):
+        """Test kernels take int32 constituencies and narrow votes without casts."""
+        from electoral_sim import ElectionModel
+        from electoral_sim.engine.numba_accel import fptp_count_fast, vote_dtype
+
+        assert vote_dtype(10) == np.int8
+        assert vote_dtype(200) == np.int16
+
+        model = ElectionModel(n_voters=3000, n_constituencies=4, seed=42)
+        constituencies = model.voters.get_constituencies()
+        positions = model.voters.get_positions()
+        assert constituencies.dtype == np.int32
+        assert positions.flags.c_contiguous
+        # Ideology columns are views into the positions block
+        assert np.shares_memory(model.voters.get_ideology_x(), positions)
+
+        ballots = model.cast_ballots()
+        assert ballots.votes.dtype == np.int8
+
+        seats, counts = fptp_count_fast(constituencies, ballots.votes, 4, len(model.parties))
+        wide_seats, wide_counts = fptp_count_fast(
+            constituencies.astype(np.int64), ballots.votes.astype(np.int64), 4, len(model.parties)
+        )
+        np.testing.assert_array_equal(seats, wide_seats)
+        np.testing.assert_array_equal(counts, wide_counts)
+
     def test_dhondt_allocation(self):
         """Test D'Hondt seat allocation."""
         from electoral_sim.systems.allocation import dhondt_allocation
@@ -63,6 +89,105 @@ class TestElectoralSystems:
         seats = sainte_lague_allocation(votes, total_seats)
         assert sum(seats) == total_seats
 
+    def test_allocate_seats_batch(self):
+        """Test batched allocation matches row-by-row allocation."""
+        from electoral_sim.systems.allocation import allocate_seats, allocate_seats_batch
+
+        rng = np.random.default_rng(0)
+        votes = rng.integers(0, 100_000, (12, 6))
+        n_seats = rng.integers(1, 40, 12)
+        methods = ["dhondt", "sainte_lague", "hare", "droop"] * 3
+        thresholds = [0.0, 0.05, 0.1] * 4
+
+        seats = allocate_seats_batch(votes, n_seats, methods, thresholds)
+        np.testing.assert_array_equal(seats.sum(axis=1), n_seats)
+        for r in range(12):
+            expected = allocate_seats(votes[r], int(n_seats[r]), methods[r], thresholds[r])
+            np.testing.assert_array_equal(seats[r], expected)
+
+        with pytest.raises(ValueError):
+            allocate_seats_batch(votes, n_seats, "unknown")
+
+        # A row with seats but no qualifying votes cannot be allocated
+        for method in ["dhondt", "sainte_lague", "hare", "droop"]:
+            with pytest.raises(ValueError, match="rows \\[1\\]"):
+                allocate_seats_batch([[10, 20, 30], [0, 0, 0]], [5, 5], method)
+        with pytest.raises(ValueError):
+            allocate_seats_batch([[10, 20, 30], [1, 1, 1]], [5, 5], "hare", [0.0, 0.5])
+        np.testing.assert_array_equal(
+            allocate_seats_batch([[10, 20, 30], [0, 0, 0]], [5, 0], "hare"), [[1, 2, 2], [0, 0, 0]]
+        )
+
+    def test_mmp_allocation(self):
+        """Test MMP overhang, levelling and the basic-mandate clause."""
+        from electoral_sim.systems.allocation import allocate_seats, mmp_allocation
+
+        votes = np.array([300, 280, 200, 120, 100])
+        direct = np.array([200, 99, 0, 0, 0])
+
+        # Party 0 wins more districts than its 30% of 598 seats
+        kept = mmp_allocation(votes, direct, 598, levelling=False)
+        assert kept["overhang_seats"][0] > 0
+        assert kept["house_size"] == 598 + kept["overhang_seats"].sum()
+
+        levelled = mmp_allocation(votes, direct, 598)
+        size = levelled["house_size"]
+        assert levelled["levelling_seats"] > 0
+        assert size == 598 + kept["overhang_seats"].sum() + levelled["levelling_seats"]
+        np.testing.assert_array_equal(
+            levelled["seats"], allocate_seats(votes, size, "sainte_lague")
+        )
+        # One seat fewer would not cover party 0's districts
+        assert allocate_seats(votes, size - 1, "sainte_lague")[0] < 200
+        np.testing.assert_array_equal(levelled["list_seats"], levelled["seats"] - direct)
+
+        # Below the threshold, 3 districts qualify a party; 2 do not
+        small = np.array([500, 400, 30])
+        assert mmp_allocation(small, np.array([5, 3, 3]), 20)["qualified"][2]
+        result = mmp_allocation(small, np.array([5, 3, 2]), 20)
+        assert not result["qualified"][2]
+        assert result["seats"][2] == 2
+        assert result["house_size"] == 20
+
+    def test_electoral_college_votes(self):
+        """Test winner-take-all states and the district rule."""
+        from electoral_sim.systems.electoral_college import electoral_college_votes
+
+        state_tallies = np.array([[60, 40], [45, 55], [52, 48], [0, 0]])
+        electors = np.array([10, 7, 5, 3])
+        # State 2 splits its 3 district electors; its 2 at-large go to party 0
+        district_tallies = np.array([[30, 10], [10, 20], [12, 18]])
+        district_state = np.array([2, 2, 2])
+
+        votes = electoral_college_votes(state_tallies, electors, district_tallies, district_state)
+        np.testing.assert_array_equal(votes, [[10, 0], [0, 7], [3, 2], [0, 0]])
+        np.testing.assert_array_equal(electoral_college_votes(state_tallies, electors)[2], [5, 0])
+
+        with pytest.raises(ValueError):
+            electoral_college_votes(state_tallies, [10, 7, 2, 3], district_tallies, district_state)
+
+    def test_electoral_college_monte_carlo(self):
+        """Test Monte Carlo win probabilities on fixed state shares."""
+        from electoral_sim.systems.electoral_college import electoral_college_monte_carlo
+
+        shares = np.array([[0.7, 0.3], [0.3, 0.7], [0.505, 0.495]])
+        electors = np.array([10, 10, 5])
+
+        result = electoral_college_monte_carlo(shares, electors, n_scenarios=20_000, seed=0)
+        assert result["electoral_votes"].shape == (20_000, 2)
+        np.testing.assert_array_equal(result["electoral_votes"].sum(axis=1), 25)
+        # Safe states never flip; the swing state decides
+        np.testing.assert_allclose(result["state_win_probability"][:2], [[1, 0], [0, 1]])
+        swing = result["state_win_probability"][2, 0]
+        assert 0.5 < swing < 0.7
+        assert result["win_probability"][0] == pytest.approx(swing)
+        assert result["no_majority_probability"] == 0.0
+
+        again = electoral_college_monte_carlo(
+            shares, electors, n_scenarios=20_000, seed=0, chunk_size=7_000
+        )
+        assert again["win_probability"][0] == pytest.approx(swing, abs=0.02)
+
     def test_hare_quota(self):
         """Test Hare quota allocation."""
         from electoral_sim.systems.allocation import hare_quota_allocation
@@ -132,6 +257,25 @@ class TestMetrics:
         gap = efficiency_gap(district_votes_a, district_votes_b, party_a_seats)
         assert -1 <= gap <= 1
 
+        # Rows of a 2-D input are scored as separate plans
+        plans = efficiency_gap(
+            np.stack([district_votes_a, district_votes_b]),
+            np.stack([district_votes_b, district_votes_a]),
+            np.stack([party_a_seats, 1 - party_a_seats]),
+        )
+        np.testing.assert_allclose(plans, [gap, -gap])
+
+    def test_partisan_bias(self):
+        """Test partisan bias under uniform swing."""
+        from electoral_sim.metrics.indices import partisan_bias
+
+        # Symmetric districts: no bias
+        assert partisan_bias(np.array([0.3, 0.45, 0.55, 0.7])) == 0.0
+        # A's votes are packed into one district; at 50% it wins 1 of 4
+        packed = np.array([0.8, 0.45, 0.45, 0.45])
+        assert partisan_bias(packed) == -0.25
+        np.testing.assert_allclose(partisan_bias(np.stack([packed, 1 - packed])), [-0.25, 0.25])
+
 
 class TestConfig:
     """Tests for configuration classes."""